@@ -3,15 +3,50 @@ import pandas as pd
 import numpy as np
 import plotly.express as px
 import plotly.graph_objects as go
+import plotly.io as pio
 from plotly.subplots import make_subplots
 import requests
 import json
+import re
 from datetime import datetime, timedelta
 import os
+import logging
 import base64
 from io import BytesIO
 import time
 import random
+import uuid
+import hashlib
+import pyarrow as pa
+
+from utils.market_data import MarketDataRefresher
+from utils.market_history import MarketHistoryStore
+from utils.http_cache import HttpCache
+from utils.advisor_client import stream_chat_completion, close_response
+from utils.http_client import PooledHttpClient
+from utils.advisor_dispatch import HedgedDispatcher, AllProvidersFailed
+from utils.circuit_breaker import BreakerRegistry
+from utils.response_cache import AdvisorResponseCache, normalize_prompt
+from utils.request_queue import AdvisorRequestQueue
+from utils.single_flight import SingleFlight
+from utils.figure_cache import FigureCache
+from utils.chat_history import ChatHistory
+from utils.advisor_knowledge import AdvisorKnowledgeIndex
+from utils.offline_advisor import OfflineAdvisor
+from utils.career_mapper import CareerMapper
+from utils.course_store import CourseStore
+from utils.course_search import CourseSearchIndex, FACET_LABELS
+from utils.course_recommender import CourseRecommender
+from utils.course_cover import CourseCoverPlanner
+from utils.skill_extractor import SkillExtractor
+from utils.readiness_score import ReadinessCalculator
+from utils.readiness_cache import ReadinessCache
+from utils.learning_planner import LearningPlanner
+from config import (EDUCATIONAL_CONTENT_SOURCES, COURSE_CATALOG_PATH, INDUSTRY_SKILLS_PATH,
+                    OPENROUTER_API_URL, OPENROUTER_API_KEY, ADVISOR_STREAMING, FUTURE_INDUSTRIES,
+                    DEBUG_DIAGNOSTICS)
+
+logger = logging.getLogger(__name__)
 
 # Page configuration
 st.set_page_config(
@@ -352,78 +387,69 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 # Initialize session state
+if 'session_id' not in st.session_state:
+    st.session_state.session_id = uuid.uuid4().hex
 if 'chat_history' not in st.session_state:
-    st.session_state.chat_history = []
+    # Latest turns stay in memory; older ones spill to a per-session file
+    st.session_state.chat_history = ChatHistory(st.session_state.session_id)
 if 'real_time_data' not in st.session_state:
     st.session_state.real_time_data = {}
-if 'last_update' not in st.session_state:
-    st.session_state.last_update = datetime.now()
 
 # Real-time data fetching functions
-@st.cache_data(ttl=600)  # Cache for 10 minutes
-def fetch_real_time_job_data():
-    """Fetch real-time job market data from multiple sources"""
-    try:
-        # Simulate real-time data from various sources
-        # In production, this would connect to actual APIs
-        current_time = datetime.now()
-        
-        # Mock data that simulates real API responses
-        job_data = {
-            'ai_ml_jobs': {
-                'count': 15420 + random.randint(-100, 200),
-                'growth_rate': 23.5 + random.uniform(-2, 3),
-                'avg_salary': 145000 + random.randint(-5000, 8000),
-                'top_skills': ['Python', 'TensorFlow', 'PyTorch', 'Machine Learning', 'Deep Learning'],
-                'locations': ['San Francisco', 'Seattle', 'New York', 'Austin', 'Boston'],
-                'source': 'LinkedIn API, Indeed API, Glassdoor API'
-            },
-            'data_science_jobs': {
-                'count': 12850 + random.randint(-80, 150),
-                'growth_rate': 18.2 + random.uniform(-1.5, 2.5),
-                'avg_salary': 125000 + random.randint(-4000, 6000),
-                'top_skills': ['Python', 'SQL', 'R', 'Tableau', 'Statistics'],
-                'locations': ['San Francisco', 'New York', 'Chicago', 'Los Angeles', 'Denver'],
-                'source': 'Bureau of Labor Statistics, Kaggle Jobs, Stack Overflow'
-            },
-            'cybersecurity_jobs': {
-                'count': 9340 + random.randint(-60, 120),
-                'growth_rate': 15.8 + random.uniform(-1, 2),
-                'avg_salary': 110000 + random.randint(-3000, 5000),
-                'top_skills': ['Network Security', 'Penetration Testing', 'CISSP', 'Incident Response'],
-                'locations': ['Washington DC', 'San Francisco', 'Austin', 'New York', 'Atlanta'],
-                'source': 'CyberSeek.org, SANS Institute, ISACA'
-            },
-            'cloud_jobs': {
-                'count': 18750 + random.randint(-120, 250),
-                'growth_rate': 28.3 + random.uniform(-2, 4),
-                'avg_salary': 135000 + random.randint(-4500, 7000),
-                'top_skills': ['AWS', 'Azure', 'Kubernetes', 'Docker', 'DevOps'],
-                'locations': ['Seattle', 'San Francisco', 'Austin', 'Raleigh', 'Boston'],
-                'source': 'AWS Jobs Portal, Azure Careers, Google Cloud'
-            },
-            'biotech_jobs': {
-                'count': 6720 + random.randint(-40, 80),
-                'growth_rate': 12.4 + random.uniform(-0.8, 1.5),
-                'avg_salary': 95000 + random.randint(-2500, 4000),
-                'top_skills': ['Bioinformatics', 'R', 'Python', 'CRISPR', 'Genomics'],
-                'locations': ['Boston', 'San Francisco', 'San Diego', 'Research Triangle', 'Philadelphia'],
-                'source': 'BioPharma Dive, Nature Careers, Science Careers'
-            }
-        }
-        
-        # Add timestamp and market indicators
-        job_data['last_updated'] = current_time.strftime("%Y-%m-%d %H:%M:%S")
-        job_data['market_sentiment'] = random.choice(['Bullish', 'Optimistic', 'Stable', 'Growing'])
-        job_data['total_stem_jobs'] = sum([field['count'] for field in job_data.values() if isinstance(field, dict) and 'count' in field])
-        
-        return job_data
-        
-    except Exception as e:
-        st.error(f"Error fetching real-time data: {e}")
-        return None
+@st.cache_resource
+def get_single_flight():
+    """Coalesces identical concurrent fetches, prompts and chart builds across all sessions"""
+    return SingleFlight()
+
+@st.cache_resource
+def get_figure_cache():
+    """Market chart specs shared by all sessions, keyed by their input data and theme"""
+    return FigureCache(single_flight=get_single_flight())
+
+@st.cache_resource
+def get_market_data_refresher():
+    """One background refresher per server process, shared by all sessions"""
+    refresher = MarketDataRefresher(history=MarketHistoryStore(), single_flight=get_single_flight())
+    refresher.start()
+    return refresher
 
-@st.cache_data(ttl=1800)  # Cache for 30 minutes
+@st.cache_resource
+def get_http_cache():
+    """Disk-backed conditional-request cache shared by all sessions"""
+    return HttpCache(single_flight=get_single_flight())
+
+@st.cache_resource
+def get_advisor_http_client():
+    """Keep-alive connection pools for AI providers, shared by all sessions"""
+    return PooledHttpClient()
+
+@st.cache_resource
+def get_advisor_dispatcher():
+    """Hedged OpenRouter / HuggingFace dispatch, with circuit breakers shared by all sessions"""
+    return HedgedDispatcher(breakers=BreakerRegistry())
+
+@st.cache_resource
+def get_advisor_response_cache():
+    """Answers to repeated questions, persisted on disk and shared by all sessions"""
+    return AdvisorResponseCache()
+
+@st.cache_resource
+def get_advisor_knowledge_index():
+    """TF-IDF index over the platform's course, skill, field and market data, shared by all sessions"""
+    return AdvisorKnowledgeIndex()
+
+@st.cache_resource
+def get_offline_advisor():
+    """Template answers from career scores, skill gaps, courses and market data, for when no provider answers"""
+    extractor, calculator = get_readiness_tools()
+    return OfflineAdvisor(CareerMapper(), calculator, extractor)
+
+@st.cache_resource
+def get_advisor_request_queue():
+    """Rate-limited, session-fair queue for AI provider calls, shared by all sessions"""
+    return AdvisorRequestQueue()
+
+@st.cache_data(ttl=300)  # Revalidation is cheap: unchanged content comes back as 304
 def fetch_educational_content():
     """Fetch latest educational content and courses"""
     try:
@@ -482,21 +508,31 @@ def fetch_educational_content():
             ]
         }
         
+        # Replace sections with provider content where a source is configured
+        http_cache = get_http_cache()
+        for section, url in EDUCATIONAL_CONTENT_SOURCES.items():
+            if not url:
+                continue
+            try:
+                content = http_cache.get(url).json()
+            except (requests.RequestException, ValueError):
+                continue
+            if isinstance(content, list):
+                educational_data[section] = content
+        
         return educational_data
         
     except Exception as e:
         st.error(f"Error fetching educational content: {e}")
         return None
 
-def get_enhanced_ai_response(prompt, context="general", api_key=None):
-    """Enhanced AI response with OpenRouter QwQ model integration"""
-    try:
-        # OpenRouter API endpoint for QwQ model (free tier)
-        url = "https://openrouter.ai/api/v1/chat/completions"
-        
-        # Enhanced prompts based on context
-        context_prompts = {
-            "career_transition": f"""You are an expert STEM career advisor with 15+ years of experience helping professionals transition into technology fields. You have access to real-time job market data, salary trends, and industry insights.
+def build_advisor_request(prompt, context="general", api_key=None, grounding=""):
+    """OpenRouter QwQ chat completion request (url, headers, payload) for a question, with grounding data appended"""
+    url = OPENROUTER_API_URL
+    
+    # Enhanced prompts based on context
+    context_prompts = {
+        "career_transition": f"""You are an expert STEM career advisor with 15+ years of experience helping professionals transition into technology fields. You have access to real-time job market data, salary trends, and industry insights.
 
 Provide comprehensive, actionable advice that includes:
 1. Specific steps and timeline for career transition
@@ -510,7 +546,7 @@ User question: {prompt}
 
 Base your response on current 2025 market conditions and emerging technology trends.""",
 
-            "skills_assessment": f"""You are a technical skills assessor and learning path designer for STEM careers. Analyze the user's current abilities and create personalized development plans.
+        "skills_assessment": f"""You are a technical skills assessor and learning path designer for STEM careers. Analyze the user's current abilities and create personalized development plans.
 
 Provide detailed analysis including:
 1. Current skill level assessment
@@ -524,7 +560,7 @@ User question: {prompt}
 
 Focus on practical, measurable outcomes and industry-relevant skills.""",
 
-            "salary_negotiation": f"""You are a compensation expert specializing in STEM salaries. Use real-time market data to provide accurate salary guidance.
+        "salary_negotiation": f"""You are a compensation expert specializing in STEM salaries. Use real-time market data to provide accurate salary guidance.
 
 Include in your response:
 1. Current market rates by location and experience
@@ -537,116 +573,444 @@ User question: {prompt}
 
 Provide specific numbers and actionable negotiation advice.""",
 
-            "general": f"""You are a comprehensive STEM career advisor with expertise across all technology fields. Provide helpful, accurate, and actionable guidance for career development in STEM.
+        "general": f"""You are a comprehensive STEM career advisor with expertise across all technology fields. Provide helpful, accurate, and actionable guidance for career development in STEM.
 
 User question: {prompt}
 
 Provide practical advice with specific examples and resources."""
-        }
+    }
 
-        # Select appropriate prompt
-        enhanced_prompt = context_prompts.get(context, context_prompts["general"])
-        
-        headers = {
-            "Content-Type": "application/json",
-            "HTTP-Referer": "https://career-stem-platform.streamlit.app",
-            "X-Title": "STEM Career Platform"
-        }
-        
-        payload = {
-            "model": "qwen/qwq-32b:free",
-            "messages": [
-                {
-                    "role": "system",
-                    "content": "You are a professional STEM career advisor with deep expertise in technology transitions, career development, and industry insights. Provide helpful, practical advice."
-                },
-                {
-                    "role": "user", 
-                    "content": enhanced_prompt
-                }
-            ],
+    # Select appropriate prompt
+    enhanced_prompt = context_prompts.get(context, context_prompts["general"])
+    if grounding:
+        enhanced_prompt += f"\n\n{grounding}"
+    
+    headers = {
+        "Content-Type": "application/json",
+        "HTTP-Referer": "https://career-stem-platform.streamlit.app",
+        "X-Title": "STEM Career Platform"
+    }
+    
+    payload = {
+        "model": "qwen/qwq-32b:free",
+        "messages": [
+            {
+                "role": "system",
+                "content": "You are a professional STEM career advisor with deep expertise in technology transitions, career development, and industry insights. Provide helpful, practical advice."
+            },
+            {
+                "role": "user", 
+                "content": enhanced_prompt
+            }
+        ],
+        "temperature": 0.7,
+        "max_tokens": 500,
+        "top_p": 0.9,
+        "stream": False
+    }
+    
+    api_key = api_key or OPENROUTER_API_KEY
+    if api_key:
+        headers["Authorization"] = f"Bearer {api_key}"
+    
+    return url, headers, payload
+
+def add_market_data_note(ai_response):
+    """Enhance response with real-time data if available"""
+    if 'real_time_data' in st.session_state and st.session_state.real_time_data:
+        job_data = st.session_state.real_time_data
+        if 'total_stem_jobs' in job_data:
+            ai_response += f"\n\n📊 **Current Market Data:** {job_data['total_stem_jobs']:,} active STEM positions available (updated: {job_data.get('last_updated', 'recently')})"
+    return ai_response
+
+def build_fallback_request(prompt, context="general", grounding=""):
+    """HuggingFace Inference API request (url, headers, payload) for a question, with grounding data appended"""
+    # HuggingFace Inference API
+    url = "https://api-inference.huggingface.co/models/Qwen/Qwen2.5-14B-Instruct"
+    
+    headers = {
+        "Authorization": "Bearer hf_demo",
+        "Content-Type": "application/json"
+    }
+    
+    enhanced_prompt = f"""You are a professional STEM career advisor. Help with career transition questions.
+
+User question: {prompt}
+
+Provide practical, actionable advice for STEM career development."""
+    if grounding:
+        enhanced_prompt += f"\n\n{grounding}"
+    
+    payload = {
+        "inputs": enhanced_prompt,
+        "parameters": {
+            "max_new_tokens": 500,
             "temperature": 0.7,
-            "max_tokens": 500,
             "top_p": 0.9,
-            "stream": False
+            "return_full_text": False,
+            "do_sample": True
         }
-        
-        response = requests.post(url, headers=headers, json=payload, timeout=30)
-        
-        if response.status_code == 200:
-            result = response.json()
-            if 'choices' in result and len(result['choices']) > 0:
-                ai_response = result['choices'][0]['message']['content']
-                
-                # Enhance response with real-time data if available
-                if 'real_time_data' in st.session_state and st.session_state.real_time_data:
-                    job_data = st.session_state.real_time_data
-                    if 'total_stem_jobs' in job_data:
-                        ai_response += f"\n\n📊 **Current Market Data:** {job_data['total_stem_jobs']:,} active STEM positions available (updated: {job_data.get('last_updated', 'recently')})"
-                
-                return ai_response
-            else:
-                return "I'm here to help with your STEM career questions! The AI service is processing your request."
-        else:
-            # Fallback to HuggingFace if OpenRouter fails
-            return get_fallback_ai_response(prompt, context)
-            
-    except Exception as e:
-        return get_fallback_ai_response(prompt, context)
+    }
+    
+    return url, headers, payload
 
-def get_fallback_ai_response(prompt, context="general"):
-    """Fallback AI response using HuggingFace"""
+# Shown only if even the offline advisor can't compose an answer
+ADVISOR_UNAVAILABLE_MESSAGE = "I'm here to provide STEM career guidance! Try our interactive features while the AI service connects, or explore our comprehensive course catalog and market analysis."
+
+def post_advisor_request(client, url, headers, payload, timeout, attempt=None):
+    """
+    POST a provider request whose body is read only once the headers are in
+    
+    If the dispatcher cancels the attempt, no retry is sent and the open
+    response is closed, so a losing request stops instead of being read to the end.
+    """
+    if attempt:
+        attempt.begin()
+    response = client.post(url, headers=headers, json=payload, timeout=timeout, stream=True,
+                           cancel=attempt.cancelled if attempt else None)
+    if attempt:
+        attempt.on_cancel(lambda: close_response(response))
     try:
-        # HuggingFace Inference API
-        url = "https://api-inference.huggingface.co/models/Qwen/Qwen2.5-14B-Instruct"
-        
-        headers = {
-            "Authorization": "Bearer hf_demo",
-            "Content-Type": "application/json"
-        }
-        
-        enhanced_prompt = f"""You are a professional STEM career advisor. Help with career transition questions.
+        response.raise_for_status()
+    except requests.HTTPError:
+        response.close()
+        raise
+    return response
 
-User question: {prompt}
+def request_openrouter_answer(client, prompt, context="general", api_key=None, grounding="", attempt=None):
+    """Complete OpenRouter answer; raises if the provider gives no usable text"""
+    url, headers, payload = build_advisor_request(prompt, context, api_key, grounding)
+    response = post_advisor_request(client, url, headers, payload, 30, attempt)
+    ai_response = response.json()['choices'][0]['message']['content']
+    if not ai_response or not ai_response.strip():
+        raise ValueError("OpenRouter returned an empty answer")
+    return ai_response
 
-Provide practical, actionable advice for STEM career development."""
-        
-        payload = {
-            "inputs": enhanced_prompt,
-            "parameters": {
-                "max_new_tokens": 500,
-                "temperature": 0.7,
-                "top_p": 0.9,
-                "return_full_text": False,
-                "do_sample": True
-            }
-        }
-        
-        response = requests.post(url, headers=headers, json=payload, timeout=20)
-        
-        if response.status_code == 200:
-            result = response.json()
-            if isinstance(result, list) and len(result) > 0:
-                ai_response = result[0].get('generated_text', '')
-                
-                # Enhance response with real-time data if available
-                if 'real_time_data' in st.session_state and st.session_state.real_time_data:
-                    job_data = st.session_state.real_time_data
-                    if 'total_stem_jobs' in job_data:
-                        ai_response += f"\n\n📊 **Current Market Data:** {job_data['total_stem_jobs']:,} active STEM positions available (updated: {job_data.get('last_updated', 'recently')})"
-                
-                return ai_response
+def request_huggingface_answer(client, prompt, context="general", grounding="", attempt=None):
+    """Complete HuggingFace answer; raises if the provider gives no usable text"""
+    url, headers, payload = build_fallback_request(prompt, context, grounding)
+    response = post_advisor_request(client, url, headers, payload, 20, attempt)
+    result = response.json()
+    ai_response = result[0].get('generated_text', '') if isinstance(result, list) and result else ''
+    if not ai_response.strip():
+        raise ValueError("HuggingFace returned an empty answer")
+    return ai_response
+
+def open_openrouter_stream(client, prompt, context="general", api_key=None, grounding="", attempt=None):
+    """OpenRouter answer as a stream of pieces, returned once the first piece has arrived"""
+    url, headers, payload = build_advisor_request(prompt, context, api_key, grounding)
+    # Connect within 10s, then allow up to 30s between streamed chunks. A cancelled
+    # attempt closes the response, which ends a read still waiting on the first piece.
+    if attempt:
+        attempt.begin()
+    stream = stream_chat_completion(
+        url, headers, payload, timeout=(10, 30), session=client,
+        cancel=attempt.cancelled if attempt else None,
+        on_response=(lambda response: attempt.on_cancel(lambda: close_response(response))) if attempt else None
+    )
+    first = next(stream, None)
+    if first is None:
+        raise ValueError("OpenRouter stream ended without any text")
+    
+    def pieces():
+        try:
+            yield first
+            yield from stream
+        finally:
+            stream.close()
+    
+    return pieces()
+
+def offline_advisor_answer(prompt, context="general"):
+    """Final tier when no provider answers: composed from platform data with no network call"""
+    try:
+        return get_offline_advisor().answer(
+            prompt, detect_target_industry(prompt), context,
+            market=get_market_data_refresher().snapshot,
+            recommender=get_course_recommender(get_catalog_version())
+        )
+    except (KeyError, TypeError, ValueError, OSError):
+        # A malformed market snapshot or an unreadable catalog; anything else is a bug and propagates
+        logger.exception("Offline advisor answer failed")
+        return ADVISOR_UNAVAILABLE_MESSAGE
+
+def advisor_grounding(prompt):
+    """Course, skill, field and market data relevant to a question, sized for the prompt"""
+    index = get_advisor_knowledge_index()
+    index.update_market(get_market_data_refresher().snapshot)
+    return index.grounding(prompt)
+
+def advisor_answer_version(grounding):
+    """
+    Identifies the data an answer is based on: its grounding text
+    
+    Market figures are part of the grounding when they are relevant, so an answer
+    only goes stale when its own data changes, not on every market refresh.
+    """
+    return hashlib.sha256(grounding.encode('utf-8')).hexdigest()[:16]
+
+def api_key_id(api_key):
+    """Stand-in for an API key in shared in-memory keys, so the key itself isn't kept there"""
+    return hashlib.sha256(api_key.encode('utf-8')).hexdigest()[:16] if api_key else None
+
+def queued_advisor_attempts(openrouter_call, huggingface_call):
+    """
+    Dispatcher attempts for both providers, each waiting its turn in the request queue
+    
+    An attempt cancelled while still queued is withdrawn without using a rate-limit token.
+    """
+    queue = get_advisor_request_queue()
+    session_id = st.session_state.session_id
+    
+    def queued(provider, call):
+        return lambda attempt: queue.call(provider, session_id, lambda: call(attempt),
+                                          on_submit=lambda ticket: attempt.on_cancel(ticket.cancel))
+    
+    return [("OpenRouter", queued("OpenRouter", openrouter_call)),
+            ("HuggingFace", queued("HuggingFace", huggingface_call))]
+
+def queue_progress(on_queue):
+    """Dispatcher on_wait hook reporting this session's place in the request queue"""
+    if on_queue is None:
+        return None
+    queue = get_advisor_request_queue()
+    session_id = st.session_state.session_id
+    return lambda: on_queue(queue.position(session_id))
+
+def request_advisor_answer(prompt, context="general", api_key=None, on_queue=None, grounding="", version=""):
+    """Provider answer to a question, cached once it arrives; None if every provider failed"""
+    client = get_advisor_http_client()
+    try:
+        result = get_advisor_dispatcher().run(queued_advisor_attempts(
+            lambda attempt: request_openrouter_answer(client, prompt, context, api_key, grounding, attempt),
+            lambda attempt: request_huggingface_answer(client, prompt, context, grounding, attempt)
+        ), on_wait=queue_progress(on_queue))
+    except AllProvidersFailed:
+        return None
+    
+    get_advisor_response_cache().set(prompt, context, result.value, version)
+    return result.value
+
+def get_enhanced_ai_response(prompt, context="general", api_key=None, on_queue=None):
+    """Enhanced AI response with OpenRouter QwQ model integration, hedged with HuggingFace"""
+    grounding = advisor_grounding(prompt)
+    version = advisor_answer_version(grounding)
+    cached = get_advisor_response_cache().get(prompt, context, version)
+    if cached:
+        return add_market_data_note(cached['answer'])
+    
+    # The same question asked by several sessions at once goes upstream once
+    answer = get_single_flight().do(
+        ("advisor", "answer", context, version, api_key_id(api_key), normalize_prompt(prompt)),
+        lambda: request_advisor_answer(prompt, context, api_key, on_queue, grounding, version)
+    )
+    if answer is None:
+        return offline_advisor_answer(prompt, context)
+    return add_market_data_note(answer)
+
+def stream_enhanced_ai_response(prompt, context="general", api_key=None, on_queue=None):
+    """
+    Yield the advisor's answer in pieces as OpenRouter streams it
+    
+    HuggingFace is asked too if OpenRouter has not sent its first piece within
+    the hedge delay, and answers in one piece if it wins, as does the response
+    cache, or a session already streaming the same question. Joining the pieces
+    always gives the full answer. on_queue is called with this session's queue
+    position (None once running) while it waits.
+    """
+    grounding = advisor_grounding(prompt)
+    version = advisor_answer_version(grounding)
+    cached = get_advisor_response_cache().get(prompt, context, version)
+    if cached:
+        yield cached['answer']
+        yield add_market_data_note("")
+        return
+    
+    single_flight = get_single_flight()
+    key = ("advisor", "stream", context, version, api_key_id(api_key), normalize_prompt(prompt))
+    flight, leader = single_flight.claim(key)
+    while not leader:
+        try:
+            text = flight.result()
+        except Exception:
+            # That session stopped reading before the end; ask for ourselves
+            flight, leader = single_flight.claim(key)
+            continue
+        yield text
+        yield add_market_data_note("")
+        return
+    
+    text = ""
+    try:
+        for piece in stream_advisor_answer(prompt, context, api_key, on_queue, grounding, version):
+            text += piece
+            yield piece
+    except BaseException:
+        flight.fail(RuntimeError("The shared answer stopped before it finished"))
+        raise
+    flight.resolve(text)
+    
+    yield add_market_data_note("")
+
+def stream_advisor_answer(prompt, context="general", api_key=None, on_queue=None, grounding="", version=""):
+    """Provider answer in pieces, cached once complete; failures end it with a note instead of raising"""
+    client = get_advisor_http_client()
+    try:
+        result = get_advisor_dispatcher().run(queued_advisor_attempts(
+            lambda attempt: open_openrouter_stream(client, prompt, context, api_key, grounding, attempt),
+            lambda attempt: [request_huggingface_answer(client, prompt, context, grounding, attempt)]
+        ), on_wait=queue_progress(on_queue))
+    except AllProvidersFailed:
+        yield offline_advisor_answer(prompt, context)
+        return
+    
+    answer = ""
+    pieces = iter(result.value)
+    try:
+        for delta in pieces:
+            answer += delta
+            yield delta
+    except Exception:
+        logger.exception("%s answer stream was interrupted", result.provider)
+        yield "\n\n_(The response was interrupted before it finished.)_"
+    else:
+        get_advisor_response_cache().set(prompt, context, answer, version)
+    finally:
+        # Frees the provider's queue slot even if the reader stopped early
+        if hasattr(pieces, "close"):
+            pieces.close()
+
+def queue_status(placeholder, waiting_message=None):
+    """on_queue callback showing the queue position in a placeholder, or waiting_message once running"""
+    shown = []
+    
+    def show(position):
+        if shown[-1:] != [position]:
+            shown.append(position)
+            if position:
+                placeholder.markdown(f"⏳ High demand right now: {position} question{'s' if position > 1 else ''} ahead of yours...")
+            elif waiting_message:
+                placeholder.markdown(waiting_message)
             else:
-                return "I'm here to help with your STEM career questions! The AI service is processing your request."
-        else:
-            return "I'm ready to assist with your STEM career journey! While connecting to enhanced AI services, explore our real-time market data and interactive features."
-            
-    except Exception as e:
-        return "I'm here to provide STEM career guidance! Try our interactive features while the AI service connects, or explore our comprehensive course catalog and market analysis."
+                placeholder.empty()
+    return show
+
+def render_chat_card(chat):
+    """One question and answer from the chat history"""
+    st.markdown(f"""
+    <div class="glass-card">
+        <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 1rem;">
+            <strong style="color: #00f0ff;">👤 You ({chat['timestamp']})</strong>
+            <span style="background: rgba(0,240,255,0.2); padding: 0.2rem 0.5rem; border-radius: 4px; font-size: 0.8rem; color: #00f0ff;">
+                {chat.get('context', 'general').replace('_', ' ').title()}
+            </span>
+        </div>
+        <div style="background: rgba(255,255,255,0.05); padding: 1rem; border-radius: 8px; margin-bottom: 1rem;">
+            {chat['user']}
+        </div>
+        
+        <div style="margin-bottom: 0.5rem;">
+            <strong style="color: #00d4aa;">🤖 AI Career Advisor:</strong>
+        </div>
+        <div style="background: rgba(0,212,170,0.1); padding: 1rem; border-radius: 8px; color: #ffffff; line-height: 1.6;">
+            {chat['ai']}
+        </div>
+    </div>
+    """, unsafe_allow_html=True)
+
+def render_streamed_response(chunks, placeholder, refresh_seconds=0.05):
+    """Render answer pieces into a placeholder as they arrive and return the full text"""
+    text = ""
+    last_render = 0.0
+    for chunk in chunks:
+        text += chunk
+        # Markdown re-renders are throttled; tokens can arrive faster than the browser repaints
+        if time.monotonic() - last_render >= refresh_seconds:
+            placeholder.markdown(text + "▌")
+            last_render = time.monotonic()
+    
+    placeholder.empty()
+    return text
+
+def create_market_history_chart(history):
+    """Plot recorded job counts per field, indexed to the first point in range"""
+    colors = {'ai_ml_jobs': '#00f0ff', 'data_science_jobs': '#b347d9', 'cybersecurity_jobs': '#ff006e', 'cloud_jobs': '#00ff88', 'biotech_jobs': '#feca57'}
+    labels = {'ai_ml_jobs': 'AI/ML', 'data_science_jobs': 'Data Science', 'cybersecurity_jobs': 'Cybersecurity', 'cloud_jobs': 'Cloud Computing', 'biotech_jobs': 'Biotechnology'}
+    
+    fig = go.Figure()
+    for field, points in history.groupby('field', sort=False):
+        index = 100 * points['count'] / points['count'].iloc[0]
+        fig.add_trace(go.Scatter(
+            x=points['timestamp'],
+            y=index,
+            mode='lines',
+            name=labels.get(field, field),
+            line=dict(color=colors.get(field, '#ffffff'), width=3),
+            customdata=points['count'],
+            hovertemplate=f'<b>{labels.get(field, field)}</b><br>Growth Index: %{{y:.1f}}<br>Open positions: %{{customdata:,.0f}}<extra></extra>'
+        ))
+    
+    fig.update_layout(
+        title={
+            'text': f"📈 Recorded STEM Job Market History ({history.attrs.get('resolution', 'raw')} resolution)",
+            'x': 0.5,
+            'font': {'size': 24, 'color': '#ffffff'}
+        },
+        xaxis_title="Date",
+        yaxis_title="Growth Index (Base: first snapshot = 100)",
+        font=dict(color='#ffffff'),
+        paper_bgcolor='rgba(0,0,0,0)',
+        plot_bgcolor='rgba(0,0,0,0)',
+        height=600,
+        hovermode='x unified',
+        legend=dict(
+            orientation="h",
+            yanchor="bottom",
+            y=1.02,
+            xanchor="right",
+            x=1,
+            bgcolor='rgba(255,255,255,0.1)',
+            bordercolor='rgba(0,240,255,0.3)',
+            borderwidth=1
+        )
+    )
+    fig.update_xaxes(gridcolor='rgba(255,255,255,0.1)', zerolinecolor='rgba(255,255,255,0.2)')
+    fig.update_yaxes(gridcolor='rgba(255,255,255,0.1)', zerolinecolor='rgba(255,255,255,0.2)')
+    return fig
+
+def chart_theme():
+    """What market chart specs depend on besides their data: the Plotly template and Streamlit theme"""
+    return {'template': pio.templates.default, 'streamlit': st.get_option('theme.base')}
+
+def chart_inputs(real_time_data, metric):
+    """The snapshot values a chart reads: metric per job field that the snapshot has"""
+    return {field: data.get(metric) for field, data in real_time_data.items()
+            if field.endswith('_jobs') and isinstance(data, dict)}
+
+def recorded_market_history():
+    """Last 180 days of recorded market history, or None until there are two snapshots to compare"""
+    history_store = get_market_data_refresher().history
+    if history_store is None:
+        return None
+    history = history_store.query(start=time.time() - 180 * 86400)
+    return history if history['timestamp'].nunique() >= 2 else None
 
 def create_enhanced_career_trends():
     """Create enhanced career trends with real-time data"""
+    # History is recorded before a snapshot is swapped in, so the snapshot version identifies
+    # both; a cache hit skips the history query and the hashing of its frame
+    real_time_data = st.session_state.get('real_time_data', {})
+    data = {'version': real_time_data.get('last_updated'), 'growth_rates': chart_inputs(real_time_data, 'growth_rate')}
+    return get_figure_cache().get_or_build('career_trends', data, chart_theme(),
+                                           lambda: build_enhanced_career_trends(recorded_market_history()))
+
+def build_enhanced_career_trends(history=None):
+    """Career trends chart from recorded history, or projections from the current snapshot"""
     try:
+        # Plot recorded history once there are at least two snapshots to compare
+        if history is not None:
+            return create_market_history_chart(history)
+        
         # Base projection data
         years = list(range(2020, 2031))
         
@@ -750,6 +1114,12 @@ def create_enhanced_career_trends():
 
 def create_enhanced_salary_comparison():
     """Create enhanced salary comparison with real-time data"""
+    real_time_data = st.session_state.get('real_time_data', {})
+    return get_figure_cache().get_or_build('salary_comparison', {'salaries': chart_inputs(real_time_data, 'avg_salary')},
+                                           chart_theme(), build_enhanced_salary_comparison)
+
+def build_enhanced_salary_comparison():
+    """Salary comparison chart from the current snapshot"""
     try:
         real_time_data = st.session_state.get('real_time_data', {})
         
@@ -929,6 +1299,191 @@ def create_skills_radar_enhanced():
     
     return fig
 
+def build_course_details_html(course):
+    """Detail panels for one curated course; only built when the course is opened"""
+    main_html = f"""
+    <div style="margin-bottom: 1rem;">
+        <h5 style="color: #00f0ff; margin-bottom: 0.5rem;">{course['name']}</h5>
+        <div style="color: #b0b3b8; margin-bottom: 1rem;">
+            <strong>Provider:</strong> {course['provider']} | 
+            <strong>Level:</strong> {course['level']} | 
+            <strong>Duration:</strong> {course['duration']}
+        </div>
+    </div>
+
+    <div style="margin-bottom: 1rem;">
+        <strong style="color: #ffffff;">Key Skills You'll Learn:</strong>
+        <div style="display: flex; flex-wrap: wrap; gap: 0.5rem; margin-top: 0.5rem;">
+            {''.join([f'<span style="background: rgba(0,240,255,0.2); padding: 0.3rem 0.6rem; border-radius: 6px; font-size: 0.85rem;">{skill}</span>' for skill in course['skills']])}
+        </div>
+    </div>
+
+    <div style="background: rgba(0,212,170,0.1); padding: 1rem; border-radius: 8px;">
+        <strong style="color: #00d4aa;">Course Highlights:</strong>
+        <ul style="margin: 0.5rem 0; color: #b0b3b8;">
+            <li>Hands-on projects and real-world applications</li>
+            <li>Industry-relevant curriculum updated for 2025</li>
+            <li>Career services and networking opportunities</li>
+            <li>Professional certification upon completion</li>
+        </ul>
+    </div>
+    """
+    side_html = f"""
+    <div style="background: rgba(255,255,255,0.05); padding: 1.5rem; border-radius: 12px; text-align: center;">
+        <div style="margin-bottom: 1rem;">
+            <div style="display: flex; align-items: center; justify-content: center; gap: 0.5rem; margin-bottom: 0.5rem;">
+                <span style="color: #feca57; font-size: 1.2rem;">⭐</span>
+                <span style="font-size: 1.3rem; font-weight: 600; color: #ffffff;">{course['rating']}</span>
+            </div>
+            <div style="color: #b0b3b8; font-size: 0.9rem;">{course['students']:,} students</div>
+        </div>
+
+        <div style="margin-bottom: 1rem;">
+            <div style="background: rgba(0,240,255,0.2); padding: 0.5rem; border-radius: 6px; margin-bottom: 0.5rem;">
+                <strong style="color: #00f0ff;">Job Relevance</strong>
+                <div style="font-size: 1.2rem; font-weight: 600;">{course['job_relevance']}%</div>
+            </div>
+
+            {'<div style="background: rgba(0,212,170,0.2); padding: 0.3rem 0.6rem; border-radius: 4px; color: #00d4aa; font-size: 0.8rem; margin-bottom: 0.5rem;">✓ Certification Included</div>' if course['certification'] else ''}
+        </div>
+
+        <button style="background: linear-gradient(135deg, #00f0ff, #b347d9); color: white; border: none; padding: 0.8rem 1.5rem; border-radius: 8px; font-weight: 600; width: 100%; cursor: pointer;">
+            🎯 Enroll Now
+        </button>
+
+        <div style="margin-top: 1rem; font-size: 0.8rem; color: #b0b3b8;">
+            Free preview available
+        </div>
+    </div>
+    """
+    return main_html, side_html
+
+def dataframe_payload_bytes(df):
+    """
+    Approximate websocket payload of a DataFrame: Streamlit ships it as an Arrow stream
+    
+    Serializes the frame a second time, so only called for debug diagnostics.
+    """
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().size
+
+def page_selector(total_pages, key):
+    """Page number input shown only when there is more than one page; returns a zero-based page"""
+    if total_pages <= 1:
+        return 0
+    return st.number_input(f"Page (of {total_pages})", min_value=1, max_value=total_pages, value=1, step=1, key=key) - 1
+
+@st.cache_resource(max_entries=1)
+def get_course_store(catalog_version=None):
+    """Course catalog loaded once from data/course_catalog.csv, shared by all sessions"""
+    return CourseStore()
+
+def get_catalog_version():
+    """Modification time of the catalog file; a new value reloads the store. None if the file is missing"""
+    try:
+        return os.path.getmtime(COURSE_CATALOG_PATH)
+    except OSError:
+        return None
+
+@st.cache_resource
+def get_course_search_index():
+    """Search index kept for the life of the server, updated in place as the catalog changes"""
+    return CourseSearchIndex()
+
+@st.cache_resource(max_entries=1)
+def get_course_recommender(catalog_version=None):
+    """Skill x course coverage matrix, rebuilt only when the catalog changes"""
+    return CourseRecommender(get_course_store(catalog_version))
+
+@st.cache_resource(max_entries=1)
+def get_course_cover_planner(catalog_version=None):
+    """Set-cover planner over the shared coverage matrix"""
+    return CourseCoverPlanner(get_course_recommender(catalog_version))
+
+@st.cache_data
+def load_industry_skills():
+    """Skills required per industry from data/industry_skills.csv"""
+    return pd.read_csv(INDUSTRY_SKILLS_PATH)
+
+@st.cache_resource
+def get_readiness_tools():
+    """Skill extractor and readiness calculator shared by all sessions"""
+    return SkillExtractor(), ReadinessCalculator()
+
+@st.cache_resource
+def get_learning_planner():
+    """Hour-budget skill planner sharing the readiness calculator"""
+    extractor, calculator = get_readiness_tools()
+    return LearningPlanner(calculator=calculator)
+
+@st.cache_resource
+def get_readiness_cache():
+    """Readiness assessments keyed by canonical profile, on disk and shared with the cli"""
+    return ReadinessCache()
+
+def score_readiness(profile, industry):
+    """Readiness assessment of a profile for an industry, served from the cache when scored before"""
+    extractor, calculator = get_readiness_tools()
+    return get_readiness_cache().get_or_compute(calculator, profile, industry)
+
+# Slider rating from which a skill counts as one the user has
+PROFICIENT_RATING = 6
+
+def assessment_profile(scores):
+    """Readiness profile of the skills rated proficient or better on the Skill Assessment page"""
+    return {'skills': {category: [skill for skill, rating in data['skills'].items() if rating >= PROFICIENT_RATING]
+                       for category, data in scores.items()}}
+
+# Curated courses shown per page in the field listing
+COURSES_PER_PAGE = 5
+
+# Phrases that point a conversation at a target industry
+INDUSTRY_KEYWORDS = {
+    'AI': ['artificial intelligence', 'machine learning', 'data science', 'deep learning', 'ai'],
+    'CYBERSECURITY': ['cybersecurity', 'cyber security', 'security', 'hacking'],
+    'BLOCKCHAIN': ['blockchain', 'web3', 'crypto', 'smart contract'],
+    'BIOTECH': ['biotech', 'biotechnology', 'bioinformatics', 'genomics'],
+    'AGRITECH': ['agritech', 'agriculture', 'farming'],
+    'AQUATECH': ['aquatech', 'aquaculture', 'marine'],
+    'SPACETECH': ['spacetech', 'aerospace', 'satellite', 'space'],
+    'RENEWABLE': ['renewable', 'solar', 'wind energy', 'clean energy']
+}
+
+def detect_target_industry(text, default='AI'):
+    """First industry whose keywords appear in the text"""
+    padded = f" {' '.join(re.findall(r'[a-z0-9]+', text.lower()))} "
+    for industry, keywords in INDUSTRY_KEYWORDS.items():
+        if any(f" {keyword} " in padded for keyword in keywords):
+            return industry
+    return default
+
+def recommend_courses_for_chat(chat, top_k=3):
+    """Courses that close the skill gaps implied by one advisor conversation"""
+    extractor, calculator = get_readiness_tools()
+    industry = detect_target_industry(f"{chat['user']} {chat['ai']}")
+    profile = {'skills': extractor.extract_skills(chat['user'])}
+    gaps = score_readiness(profile, industry)['gaps']
+    
+    recommender = get_course_recommender(get_catalog_version())
+    recommendations = recommender.recommend(gaps, top_k=top_k, industry=industry)
+    if not recommendations['courses']:
+        recommendations = recommender.recommend(gaps, top_k=top_k)
+    return industry, gaps, recommendations
+
+def search_courses(query, filters, limit=50):
+    """Search the current catalog, syncing only changed courses into the index first"""
+    catalog_version = get_catalog_version()
+    course_store = get_course_store(catalog_version)
+    search_index = get_course_search_index()
+    # Unchanged catalogs skip both the frame copy and the fingerprint pass
+    if search_index.needs_sync(catalog_version):
+        search_index.sync(course_store.courses.drop(columns=['industry_key', 'price_band']), version=catalog_version)
+    return search_index.search(query, filters=filters, limit=limit)
+
+@st.cache_resource
 def load_enhanced_course_data():
     """Load enhanced course catalog with real-time updates"""
     courses = {
@@ -1136,11 +1691,8 @@ def load_enhanced_course_data():
     return courses
 
 def main():
-    # Load real-time data
-    if not st.session_state.real_time_data or (datetime.now() - st.session_state.last_update).seconds > 600:
-        with st.spinner("🔄 Loading real-time market data..."):
-            st.session_state.real_time_data = fetch_real_time_job_data()
-            st.session_state.last_update = datetime.now()
+    # Read the latest shared snapshot; refreshing happens in the background
+    st.session_state.real_time_data = get_market_data_refresher().snapshot
     
     # Main header with animation
     st.markdown("""
@@ -1190,6 +1742,34 @@ def main():
             st.sidebar.metric("📈 Market Sentiment", real_data['market_sentiment'])
         
         st.sidebar.caption(f"Last updated: {real_data.get('last_updated', 'Recently')}")
+        
+        # Provider availability is for everyone; health figures are diagnostics
+        show_diagnostics = DEBUG_DIAGNOSTICS and st.sidebar.toggle("🛠️ Diagnostics", key="show_diagnostics")
+        breaker_icons = {"closed": "🟢", "half_open": "🟡", "open": "🔴"}
+        for breaker in get_advisor_dispatcher().breakers.snapshots():
+            status = f"{breaker_icons[breaker['state']]} {breaker['name']}: {breaker['state'].replace('_', '-')}"
+            if breaker['state'] == "open":
+                status += f", retry in {breaker['retry_in_seconds']:.0f}s"
+                if show_diagnostics:
+                    status += f" ({breaker['rejected']} calls skipped)"
+            elif show_diagnostics and breaker['requests']:
+                status += f", {breaker['error_rate']:.0%} errors, p95 {breaker['p95_seconds']:.1f}s over {breaker['requests']} calls"
+            st.sidebar.caption(status)
+        
+        if show_diagnostics:
+            for host, stats in get_advisor_http_client().stats().items():
+                st.sidebar.caption(f"🤖 {host}: {stats['requests']} calls, p50 {stats['p50_seconds'] * 1000:.0f} ms, "
+                                   f"p95 {stats['p95_seconds'] * 1000:.0f} ms, {stats['retries']} retries")
+        
+            coalesced = {name: stats for name, stats in get_single_flight().stats().items() if stats['coalesced']}
+            if coalesced:
+                st.sidebar.caption("🔗 Shared in-flight: " + ", ".join(
+                    f"{name} {stats['coalesced']}/{stats['calls']}" for name, stats in coalesced.items()))
+        
+            figure_stats = get_figure_cache().stats()
+            if figure_stats['entries']:
+                st.sidebar.caption(f"🖼️ Chart cache: {figure_stats['hits']} hits, {figure_stats['misses']} misses, "
+                                   f"{figure_stats['entries']} charts ({figure_stats['bytes'] / 1024:.0f} KB)")
     
     # Page Content
     if page == "🏠 Home":
@@ -1375,6 +1955,9 @@ def main():
         if salary_fig:
             st.plotly_chart(salary_fig, use_container_width=True)
     
+    elif page == "📚 Course Catalog" and get_catalog_version() is None:
+        st.error(f"📚 The course catalog could not be found ({COURSE_CATALOG_PATH}), so courses can't be listed right now.")
+    
     elif page == "📚 Course Catalog":
         st.markdown("<h2 style='color: #00f0ff; text-align: center; margin-bottom: 2rem;'>📚 Comprehensive STEM Course Catalog</h2>", unsafe_allow_html=True)
         
@@ -1431,71 +2014,164 @@ def main():
             # Course listings
             st.markdown("<h4 style='color: #00f0ff; margin: 2rem 0 1rem 0;'>Available Courses</h4>", unsafe_allow_html=True)
             
-            for i, course in enumerate(field_data['courses'], 1):
-                with st.expander(f"📖 {course['name']}", expanded=False):
-                    col1, col2 = st.columns([2, 1])
-                    
-                    with col1:
-                        st.markdown(f"""
-                        <div style="margin-bottom: 1rem;">
-                            <h5 style="color: #00f0ff; margin-bottom: 0.5rem;">{course['name']}</h5>
-                            <div style="color: #b0b3b8; margin-bottom: 1rem;">
-                                <strong>Provider:</strong> {course['provider']} | 
-                                <strong>Level:</strong> {course['level']} | 
-                                <strong>Duration:</strong> {course['duration']}
-                            </div>
-                        </div>
-                        
-                        <div style="margin-bottom: 1rem;">
-                            <strong style="color: #ffffff;">Key Skills You'll Learn:</strong>
-                            <div style="display: flex; flex-wrap: wrap; gap: 0.5rem; margin-top: 0.5rem;">
-                                {''.join([f'<span style="background: rgba(0,240,255,0.2); padding: 0.3rem 0.6rem; border-radius: 6px; font-size: 0.85rem;">{skill}</span>' for skill in course['skills']])}
-                            </div>
-                        </div>
-                        
-                        <div style="background: rgba(0,212,170,0.1); padding: 1rem; border-radius: 8px;">
-                            <strong style="color: #00d4aa;">Course Highlights:</strong>
-                            <ul style="margin: 0.5rem 0; color: #b0b3b8;">
-                                <li>Hands-on projects and real-world applications</li>
-                                <li>Industry-relevant curriculum updated for 2025</li>
-                                <li>Career services and networking opportunities</li>
-                                <li>Professional certification upon completion</li>
-                            </ul>
-                        </div>
-                        """, unsafe_allow_html=True)
+            field_courses = field_data['courses']
+            course_page = page_selector(-(-len(field_courses) // COURSES_PER_PAGE), key=f"course_page_{selected_field}")
+            page_start = course_page * COURSES_PER_PAGE
+            details_bytes = 0
+            
+            for i, course in enumerate(field_courses[page_start:page_start + COURSES_PER_PAGE], page_start + 1):
+                # Details are built and sent only for courses the user opens
+                if not st.toggle(f"📖 {course['name']}", key=f"course_open_{selected_field}_{i}"):
+                    continue
+                
+                main_html, side_html = build_course_details_html(course)
+                details_bytes += len(main_html.encode()) + len(side_html.encode())
+                col1, col2 = st.columns([2, 1])
+                
+                with col1:
+                    st.markdown(main_html, unsafe_allow_html=True)
+                
+                with col2:
+                    st.markdown(side_html, unsafe_allow_html=True)
                     
-                    with col2:
-                        st.markdown(f"""
-                        <div style="background: rgba(255,255,255,0.05); padding: 1.5rem; border-radius: 12px; text-align: center;">
-                            <div style="margin-bottom: 1rem;">
-                                <div style="display: flex; align-items: center; justify-content: center; gap: 0.5rem; margin-bottom: 0.5rem;">
-                                    <span style="color: #feca57; font-size: 1.2rem;">⭐</span>
-                                    <span style="font-size: 1.3rem; font-weight: 600; color: #ffffff;">{course['rating']}</span>
-                                </div>
-                                <div style="color: #b0b3b8; font-size: 0.9rem;">{course['students']:,} students</div>
-                            </div>
-                            
-                            <div style="margin-bottom: 1rem;">
-                                <div style="background: rgba(0,240,255,0.2); padding: 0.5rem; border-radius: 6px; margin-bottom: 0.5rem;">
-                                    <strong style="color: #00f0ff;">Job Relevance</strong>
-                                    <div style="font-size: 1.2rem; font-weight: 600;">{course['job_relevance']}%</div>
-                                </div>
-                                
-                                {'<div style="background: rgba(0,212,170,0.2); padding: 0.3rem 0.6rem; border-radius: 4px; color: #00d4aa; font-size: 0.8rem; margin-bottom: 0.5rem;">✓ Certification Included</div>' if course['certification'] else ''}
-                            </div>
-                            
-                            <button style="background: linear-gradient(135deg, #00f0ff, #b347d9); color: white; border: none; padding: 0.8rem 1.5rem; border-radius: 8px; font-weight: 600; width: 100%; cursor: pointer;">
-                                🎯 Enroll Now
-                            </button>
-                            
-                            <div style="margin-top: 1rem; font-size: 0.8rem; color: #b0b3b8;">
-                                Free preview available
-                            </div>
-                        </div>
-                        """, unsafe_allow_html=True)
-                        
-                        if st.button(f"📋 View Curriculum", key=f"curriculum_{i}"):
-                            st.info("📚 Detailed curriculum and learning path will be displayed here.")
+                    if st.button(f"📋 View Curriculum", key=f"curriculum_{i}"):
+                        st.info("📚 Detailed curriculum and learning path will be displayed here.")
+            
+            showing = f"Showing {page_start + 1}-{min(page_start + COURSES_PER_PAGE, len(field_courses))} of {len(field_courses)} courses"
+            st.caption(f"{showing} · details payload {details_bytes / 1024:.1f} KB" if DEBUG_DIAGNOSTICS else showing)
+        
+        # Full catalog browser backed by the indexed course store
+        st.markdown("<h4 style='color: #00f0ff; margin: 2rem 0 1rem 0;'>🔎 Browse Full Catalog</h4>", unsafe_allow_html=True)
+        
+        course_query = st.text_input("🔍 Search courses", placeholder="e.g. machine learning, blockchain, python", key="catalog_query")
+        
+        if course_query.strip():
+            facet_names = {'difficulty': 'Difficulty', 'price_band': 'Price', 'rating_band': 'Rating', 'duration_band': 'Duration'}
+            search_filters = {facet: st.session_state.get(f"search_{facet}", []) for facet in facet_names}
+            search = search_courses(course_query, search_filters)
+            
+            # Show how many matches each facet value would leave
+            facet_cols = st.columns(4)
+            for col, (facet, label) in zip(facet_cols, facet_names.items()):
+                with col:
+                    st.multiselect(label, FACET_LABELS[facet], key=f"search_{facet}")
+                    counts = search['facets'][facet]
+                    st.caption(" · ".join(f"{value}: {count}" for value, count in counts.items() if count))
+            
+            st.caption(f"{search['total']:,} matching courses")
+            if search['results']:
+                search_results = pd.DataFrame([dict(result['course'], score=result['score']) for result in search['results']])
+                st.dataframe(
+                    search_results[['course_name', 'platform', 'industry', 'skill_focus', 'difficulty', 'duration_weeks', 'price_usd', 'rating', 'score', 'url']],
+                    hide_index=True,
+                    use_container_width=True,
+                    column_config={
+                        'course_name': 'Course',
+                        'platform': 'Platform',
+                        'industry': 'Industry',
+                        'skill_focus': 'Skill Focus',
+                        'difficulty': 'Level',
+                        'duration_weeks': st.column_config.NumberColumn('Weeks'),
+                        'price_usd': st.column_config.NumberColumn('Price', format="$%.0f"),
+                        'rating': st.column_config.NumberColumn('Rating', format="⭐ %.1f"),
+                        'score': st.column_config.NumberColumn('Relevance', format="%.2f"),
+                        'url': st.column_config.LinkColumn('Link')
+                    }
+                )
+            else:
+                st.info("No courses match your search. Try fewer words or clear some filters.")
+        
+        course_store = get_course_store(get_catalog_version())
+        filter_cols = st.columns(4)
+        with filter_cols[0]:
+            industry_filter = st.multiselect("Industry", course_store.facet_values('industry'), key="catalog_industry")
+        with filter_cols[1]:
+            platform_filter = st.multiselect("Platform", course_store.facet_values('platform'), key="catalog_platform")
+        with filter_cols[2]:
+            difficulty_filter = st.multiselect("Difficulty", course_store.facet_values('difficulty'), key="catalog_difficulty")
+        with filter_cols[3]:
+            price_filter = st.multiselect("Price", course_store.facet_values('price_band'), key="catalog_price")
+        
+        sort_cols = st.columns([2, 1, 1])
+        sort_options = {'Rating': 'rating', 'Price': 'price_usd', 'Duration': 'duration_weeks', 'Name': 'course_name'}
+        with sort_cols[0]:
+            sort_label = st.selectbox("Sort by", list(sort_options), key="catalog_sort")
+        with sort_cols[1]:
+            sort_descending = st.radio("Order", ["Descending", "Ascending"], horizontal=True, key="catalog_order") == "Descending"
+        with sort_cols[2]:
+            page_size = st.selectbox("Per page", [10, 25, 50, 100], index=1, key="catalog_page_size")
+        
+        catalog_positions = course_store.filter_positions(
+            industry=industry_filter,
+            platform=platform_filter,
+            difficulty=difficulty_filter,
+            price_band=price_filter
+        )
+        total_pages = max(1, -(-len(catalog_positions) // page_size))
+        catalog_page = course_store.page(
+            catalog_positions,
+            sort_by=sort_options[sort_label],
+            descending=sort_descending,
+            page=page_selector(total_pages, key="catalog_page"),
+            page_size=page_size
+        )
+        page_rows = catalog_page['rows'][['course_name', 'platform', 'industry', 'skill_focus', 'difficulty', 'duration_weeks', 'price_usd', 'rating', 'url']]
+        
+        st.dataframe(
+            page_rows,
+            hide_index=True,
+            use_container_width=True,
+            column_config={
+                'course_name': 'Course',
+                'platform': 'Platform',
+                'industry': 'Industry',
+                'skill_focus': 'Skill Focus',
+                'difficulty': 'Level',
+                'duration_weeks': st.column_config.NumberColumn('Weeks'),
+                'price_usd': st.column_config.NumberColumn('Price', format="$%.0f"),
+                'rating': st.column_config.NumberColumn('Rating', format="⭐ %.1f"),
+                'url': st.column_config.LinkColumn('Link')
+            }
+        )
+        first_row = catalog_page['page'] * page_size
+        showing = (f"{first_row + 1 if len(page_rows) else 0}-{first_row + len(page_rows)} of "
+                   f"{catalog_page['total']:,} matching ({len(course_store):,} total)")
+        if DEBUG_DIAGNOSTICS:
+            showing += f" · page payload {dataframe_payload_bytes(page_rows) / 1024:.1f} KB"
+        st.caption(showing)
+        
+        # Smallest set of courses that covers every missing industry skill
+        st.markdown("<h4 style='color: #00f0ff; margin: 2rem 0 1rem 0;'>🧩 Close Your Skill Gap</h4>", unsafe_allow_html=True)
+        
+        industry_skills = load_industry_skills()
+        gap_cols = st.columns([1, 2, 1])
+        with gap_cols[0]:
+            gap_industry = st.selectbox("Target industry", sorted(industry_skills['industry'].unique()), key="gap_industry")
+        target_skills = industry_skills.loc[industry_skills['industry'] == gap_industry, 'skill_name'].tolist()
+        with gap_cols[1]:
+            known_skills = st.multiselect("Skills you already have", target_skills, key="gap_known_skills")
+        with gap_cols[2]:
+            cover_goals = {'Fewest courses': 'count', 'Lowest price': 'price', 'Shortest time': 'duration'}
+            cover_cost = cover_goals[st.radio("Optimize for", list(cover_goals), key="gap_cover_cost")]
+        
+        missing_skills = [skill for skill in target_skills if skill not in known_skills]
+        if not missing_skills:
+            st.success("🎉 You already have every listed skill for this industry!")
+        elif st.button("🧩 Find Course Plan", key="gap_find_plan"):
+            plan = get_course_cover_planner(get_catalog_version()).minimum_cover(missing_skills, cost=cover_cost, industry=gap_industry)
+            if plan['courses']:
+                st.markdown(
+                    f"**{len(plan['courses'])} courses** · {plan['total_weeks']} weeks · "
+                    f"${plan['total_price']:,.0f} total · covers {len(plan['covered_gaps'])} of {len(missing_skills)} missing skills"
+                )
+                for course in plan['courses']:
+                    price = "Free" if course['price_usd'] == 0 else f"${course['price_usd']:,.0f}"
+                    st.markdown(
+                        f"- [{course['course_name']}]({course['url']}) · {course['platform']} · "
+                        f"{course['duration_weeks']} weeks · {price} — covers {', '.join(course['covers'])}"
+                    )
+            if plan['uncovered_gaps']:
+                st.info(f"No catalog course covers yet: {', '.join(plan['uncovered_gaps'])}")
     
     elif page == "🤖 AI Career Advisor":
         st.markdown("<h2 style='color: #00f0ff; text-align: center; margin-bottom: 2rem;'>🤖 AI-Powered Career Advisor</h2>", unsafe_allow_html=True)
@@ -1579,63 +2255,60 @@ def main():
             ask_button = st.button("🚀 Get AI Career Advice", type="primary")
         with col2:
             if st.button("🔄 Clear History"):
-                st.session_state.chat_history = []
+                st.session_state.chat_history.clear()
+                st.session_state.pop('earlier_turns_shown', None)
                 st.rerun()
         with col3:
             if st.button("💾 Export Chat"):
                 if st.session_state.chat_history:
-                    chat_export = "\n\n".join([f"Q: {chat['user']}\nA: {chat['ai']}" for chat in st.session_state.chat_history])
-                    st.download_button(
-                        "📄 Download",
-                        data=chat_export,
-                        file_name=f"career_advice_{datetime.now().strftime('%Y%m%d_%H%M')}.txt",
-                        mime="text/plain"
-                    )
+                    # Written to disk turn by turn, so the archive is never loaded at once; the
+                    # download button still reads the finished file into Streamlit's media store
+                    with open(st.session_state.chat_history.export(), "rb") as chat_export:
+                        st.download_button(
+                            "📄 Download",
+                            data=chat_export,
+                            file_name=f"career_advice_{datetime.now().strftime('%Y%m%d_%H%M')}.txt",
+                            mime="text/plain"
+                        )
         
         # Process AI request
         if ask_button and user_input:
-            with st.spinner("🤖 AI Advisor analyzing your question with real-time market data..."):
-                # Add context and real-time data to the response
-                enhanced_response = get_enhanced_ai_response(user_input, context_type)
-                
-                # Add to chat history
-                st.session_state.chat_history.append({
-                    "user": user_input,
-                    "ai": enhanced_response,
-                    "timestamp": datetime.now().strftime("%H:%M"),
-                    "context": context_type
-                })
-                
-                # Clear the input
-                if 'current_question' in st.session_state:
-                    del st.session_state.current_question
+            waiting_message = "🤖 AI Advisor analyzing your question with real-time market data..."
+            status = st.empty()
+            if ADVISOR_STREAMING:
+                # Tokens render as they arrive; history gets the complete answer
+                status.markdown(waiting_message)
+                enhanced_response = render_streamed_response(
+                    stream_enhanced_ai_response(user_input, context_type, on_queue=queue_status(status, waiting_message)),
+                    status
+                )
+            else:
+                with st.spinner(waiting_message):
+                    # Add context and real-time data to the response
+                    enhanced_response = get_enhanced_ai_response(user_input, context_type, on_queue=queue_status(status, None))
+                status.empty()
+            
+            # Add to chat history
+            st.session_state.chat_history.append({
+                "user": user_input,
+                "ai": enhanced_response,
+                "timestamp": datetime.now().strftime("%H:%M"),
+                "context": context_type
+            })
+            
+            # Clear the input
+            if 'current_question' in st.session_state:
+                del st.session_state.current_question
         
         # Enhanced Chat History Display
-        if st.session_state.chat_history:
+        chat_history = st.session_state.chat_history
+        if chat_history:
             st.markdown("<h4 style='color: #00f0ff; margin: 2rem 0 1rem 0;'>💬 Conversation History</h4>", unsafe_allow_html=True)
             
-            for i, chat in enumerate(reversed(st.session_state.chat_history[-10:])):  # Show last 10 chats
+            latest_chats = chat_history.latest(10)
+            for i, chat in enumerate(reversed(latest_chats)):  # Show last 10 chats
                 with st.container():
-                    st.markdown(f"""
-                    <div class="glass-card">
-                        <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 1rem;">
-                            <strong style="color: #00f0ff;">👤 You ({chat['timestamp']})</strong>
-                            <span style="background: rgba(0,240,255,0.2); padding: 0.2rem 0.5rem; border-radius: 4px; font-size: 0.8rem; color: #00f0ff;">
-                                {chat.get('context', 'general').replace('_', ' ').title()}
-                            </span>
-                        </div>
-                        <div style="background: rgba(255,255,255,0.05); padding: 1rem; border-radius: 8px; margin-bottom: 1rem;">
-                            {chat['user']}
-                        </div>
-                        
-                        <div style="margin-bottom: 0.5rem;">
-                            <strong style="color: #00d4aa;">🤖 AI Career Advisor:</strong>
-                        </div>
-                        <div style="background: rgba(0,212,170,0.1); padding: 1rem; border-radius: 8px; color: #ffffff; line-height: 1.6;">
-                            {chat['ai']}
-                        </div>
-                    </div>
-                    """, unsafe_allow_html=True)
+                    render_chat_card(chat)
                     
                     # Action buttons for each response
                     col1, col2, col3 = st.columns(3)
@@ -1646,8 +2319,37 @@ def main():
                         if st.button("💡 Follow-up", key=f"followup_{i}"):
                             st.session_state.current_question = f"Follow-up to: {chat['user'][:50]}..."
                     with col3:
-                        if st.button("🔗 Related Courses", key=f"courses_{i}"):
-                            st.info("Redirecting to relevant courses...")
+                        show_courses = st.button("🔗 Related Courses", key=f"courses_{i}")
+                    
+                    if show_courses:
+                        industry, gaps, recommendations = recommend_courses_for_chat(chat)
+                        if recommendations['courses']:
+                            gap_names = ', '.join(gap.split(': ', 1)[-1] for gap in gaps)
+                            industry_name = industry if len(industry) <= 2 else industry.title()
+                            st.markdown(f"**📚 Courses for your {industry_name} skill gaps** ({gap_names})")
+                            for course in recommendations['courses']:
+                                price = "Free" if course['price_usd'] == 0 else f"${course['price_usd']:,.0f}"
+                                st.markdown(
+                                    f"- [{course['course_name']}]({course['url']}) · {course['platform']} · "
+                                    f"{course['difficulty']} · {course['duration_weeks']} weeks · {price} · ⭐ {course['rating']} "
+                                    f"— covers {', '.join(course['covers'])}"
+                                )
+                        else:
+                            st.info("No catalog courses match the skill gaps from this conversation yet.")
+            
+            # Older turns are read back from the session's archive a page at a time, on request
+            earlier = len(chat_history) - len(latest_chats)
+            shown = min(st.session_state.get('earlier_turns_shown', 0), earlier)
+            for chat in reversed(chat_history.turns(earlier - shown, earlier)):
+                with st.container():
+                    render_chat_card(chat)
+            if shown < earlier:
+                if st.button(f"⬆️ Show earlier conversation ({earlier - shown} more)"):
+                    st.session_state.earlier_turns_shown = shown + 10
+                    st.rerun()
+            if DEBUG_DIAGNOSTICS:
+                st.caption(f"{len(chat_history)} turns, {len(chat_history.recent_turns)} in memory "
+                           f"({chat_history.memory_bytes() / 1024:.0f} KB), {chat_history.archived} archived")
     
     elif page == "🎯 Skill Assessment":
         st.markdown("<h2 style='color: #00f0ff; text-align: center; margin-bottom: 2rem;'>🎯 Comprehensive STEM Skill Assessment</h2>", unsafe_allow_html=True)
@@ -1759,6 +2461,51 @@ def main():
                     'skills': dict(zip(data['skills'], skill_scores))
                 }
         
+        # Readiness for a target industry, rescored as the sliders move
+        st.markdown("<h4 style='color: #00f0ff; margin: 2rem 0 1rem 0;'>🚀 Target Industry Readiness</h4>", unsafe_allow_html=True)
+        industry_labels = {f"{info['icon']} {info['name']}": key for key, info in FUTURE_INDUSTRIES.items()}
+        target_industry = industry_labels[st.selectbox("Target industry", list(industry_labels), key="assessment_industry")]
+        profile = assessment_profile(scores)
+        readiness = score_readiness(profile, target_industry)
+        
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.metric("Readiness Score", f"{readiness['overall_score']:.0f}/100")
+        with col2:
+            st.metric("Readiness Level", readiness['readiness_level'])
+        with col3:
+            st.metric("Time to Ready", readiness['time_to_ready'])
+        if readiness['gaps']:
+            st.caption(f"Skills counted from ratings of {PROFICIENT_RATING}+. Gaps: {', '.join(readiness['gaps'][:6])}")
+        
+        # What each missing skill would add, recomputed with the sliders in one vectorized pass
+        extractor, calculator = get_readiness_tools()
+        gains = [gain for gain in calculator.calculate_marginal_gains(profile, target_industry, top_k=5)
+                 if gain['score_gain'] > 0]
+        if gains:
+            st.markdown("**Biggest readiness gains**")
+            st.markdown("\n".join(f"- **{gain['candidate']}**: +{gain['score_gain']:.1f} points (to {gain['new_score']:.0f})"
+                                   for gain in gains))
+        
+        # Missing skills that raise readiness the most within a learning-hour budget
+        hour_budget = st.slider("Learning hours available", 50, 1000, 300, step=50, key="assessment_hours")
+        plan = get_learning_planner().optimize_learning_plan(profile, target_industry, hour_budget)
+        if plan['skills']:
+            st.markdown(f"**Learning plan**: {plan['total_hours']} of {hour_budget} hours, "
+                        f"readiness {plan['current_score']:.0f} → {plan['projected_score']:.0f}")
+            st.dataframe(
+                pd.DataFrame(plan['skills'])[['skill', 'importance', 'difficulty', 'learning_hours', 'score_gain']],
+                hide_index=True,
+                use_container_width=True,
+                column_config={
+                    'skill': 'Skill',
+                    'importance': 'Importance',
+                    'difficulty': 'Difficulty',
+                    'learning_hours': st.column_config.NumberColumn('Hours'),
+                    'score_gain': st.column_config.NumberColumn('Readiness Gain', format="+%.1f")
+                }
+            )
+        
         # Enhanced Assessment Results
         if st.button("📊 Generate Comprehensive Skill Report", type="primary"):
             st.session_state.skill_scores = category_scores
@@ -0,0 +1,267 @@
+"""
+Command-line interface for headless readiness scoring
+
+Usage:
+    career-stem score profiles.jsonl --industry all --workers 4 --output scores.jsonl
+    career-stem score profiles.jsonl --output scores.csv --format csv --resume
+    career-stem score profiles.jsonl --cache
+    career-stem serve
+"""
+
+import argparse
+import csv
+import json
+import os
+import subprocess
+import sys
+from multiprocessing import Pool
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from utils import ReadinessCache, ReadinessCalculator, SkillExtractor
+
+# Profiles scored per worker task, and per checkpointed batch per worker
+CHUNK_SIZE = 64
+BATCHES_PER_WORKER = 8
+
+CSV_FIELDS = [
+    "id", "line", "industry", "overall_score", "readiness_level", "time_to_ready",
+    "skill_match", "experience", "education", "projects", "certifications",
+    "learning_curve", "market_readiness", "gaps", "error"
+]
+
+# Per-process scoring state, created once by _init_worker
+_extractor = None
+_calculator = None
+_cache = None
+
+def _init_worker(use_cache: bool = False):
+    """Create the extractor, calculator and (with --cache) readiness cache once per worker process"""
+    global _extractor, _calculator, _cache
+    _extractor = SkillExtractor()
+    _calculator = ReadinessCalculator()
+    # The cache file is shared with the web app, so batch runs only use it when asked to:
+    # a large file would evict the app's entries and pay a SQLite write per profile
+    _cache = ReadinessCache() if use_cache else None
+
+def _score_line(task: Tuple[int, bytes, List[str]]) -> List[Dict]:
+    """Score one raw JSONL line against every requested industry"""
+    line_number, raw, industries = task
+
+    try:
+        profile = json.loads(raw)
+        if not isinstance(profile, dict):
+            raise ValueError("profile must be a JSON object")
+    except ValueError as e:
+        return [{"line": line_number, "error": f"invalid profile: {e}"}]
+
+    profile_id = profile.get("id", line_number)
+
+    # Free-text profiles go through the skill extractor first
+    if not profile.get("skills") and profile.get("text"):
+        profile["skills"] = _extractor.extract_skills(profile["text"])
+
+    results = []
+    for industry in industries:
+        try:
+            if _cache is not None:
+                assessment = _cache.get_or_compute(_calculator, profile, industry)
+            else:
+                assessment = _calculator.calculate_readiness_score(profile, industry)
+        except Exception as e:
+            results.append({"id": profile_id, "line": line_number, "industry": industry, "error": str(e)})
+            continue
+
+        results.append({
+            "id": profile_id,
+            "line": line_number,
+            "industry": industry,
+            "overall_score": assessment["overall_score"],
+            "readiness_level": assessment["readiness_level"],
+            "time_to_ready": assessment["time_to_ready"],
+            "component_scores": assessment["component_scores"],
+            "gaps": assessment["gaps"]
+        })
+
+    return results
+
+def _read_batches(input_file, start_line: int, batch_size: int, industries: List[str]) -> Iterator[Tuple[List, int, int]]:
+    """Yield (tasks, lines_read, byte_offset) batches without loading the whole file"""
+    line_number = start_line
+    batch = []
+
+    while True:
+        raw = input_file.readline()
+        if not raw:
+            break
+        line_number += 1
+        if raw.strip():
+            batch.append((line_number, raw, industries))
+        if len(batch) >= batch_size:
+            yield batch, line_number, input_file.tell()
+            batch = []
+
+    if batch:
+        yield batch, line_number, input_file.tell()
+
+class ResultWriter:
+    """Append-only JSONL or CSV writer"""
+
+    def __init__(self, stream, output_format: str, write_header: bool):
+        self.stream = stream
+        self.output_format = output_format
+        if output_format == "csv":
+            self.writer = csv.DictWriter(stream, fieldnames=CSV_FIELDS, extrasaction="ignore")
+            if write_header:
+                self.writer.writeheader()
+
+    def write(self, record: Dict):
+        if self.output_format == "csv":
+            row = dict(record)
+            row.update(record.get("component_scores", {}))
+            row["gaps"] = "; ".join(record.get("gaps", []))
+            self.writer.writerow(row)
+        else:
+            self.stream.write(json.dumps(record) + "\n")
+
+def _load_checkpoint(path: str, input_path: str) -> Optional[Dict]:
+    """Read a resume checkpoint if it belongs to the same input file"""
+    if not os.path.exists(path):
+        return None
+    with open(path) as f:
+        checkpoint = json.load(f)
+    if checkpoint.get("input") != os.path.abspath(input_path):
+        raise SystemExit(f"Checkpoint {path} was written for a different input file")
+    return checkpoint
+
+def _save_checkpoint(path: str, checkpoint: Dict):
+    """Atomically replace the checkpoint file"""
+    temp_path = path + ".tmp"
+    with open(temp_path, "w") as f:
+        json.dump(checkpoint, f)
+    os.replace(temp_path, path)
+
+def score_command(args) -> int:
+    """Stream profiles from a JSONL file and write readiness scores incrementally"""
+    industries = list(ReadinessCalculator().industry_requirements)
+    if args.industry.lower() != "all":
+        requested = [industry.strip().upper() for industry in args.industry.split(",")]
+        unknown = [industry for industry in requested if industry not in industries]
+        if unknown:
+            print(f"Unknown industry: {', '.join(unknown)}. Choose from: {', '.join(industries)}", file=sys.stderr)
+            return 2
+        industries = requested
+
+    output_format = args.format or ("csv" if args.output.endswith(".csv") else "jsonl")
+    to_stdout = args.output == "-"
+    if to_stdout and args.resume:
+        print("--resume requires an --output file", file=sys.stderr)
+        return 2
+
+    checkpoint_path = args.output + ".ckpt"
+    checkpoint = _load_checkpoint(checkpoint_path, args.input) if args.resume and not to_stdout else None
+
+    input_file = open(args.input, "rb")
+    if checkpoint:
+        # Drop any rows written after the last checkpoint, then continue from there
+        input_file.seek(checkpoint["input_offset"])
+        output_file = open(args.output, "r+", newline="")
+        output_file.truncate(checkpoint["output_offset"])
+        output_file.seek(checkpoint["output_offset"])
+        start_line = checkpoint["lines_done"]
+        print(f"Resuming after line {start_line:,}", file=sys.stderr)
+    else:
+        output_file = sys.stdout if to_stdout else open(args.output, "w", newline="")
+        start_line = 0
+
+    writer = ResultWriter(output_file, output_format, write_header=not checkpoint)
+    workers = max(1, args.workers)
+    batch_size = CHUNK_SIZE * BATCHES_PER_WORKER * workers
+
+    use_cache = args.cache
+    pool = Pool(workers, initializer=_init_worker, initargs=(use_cache,)) if workers > 1 else None
+    if pool is None:
+        _init_worker(use_cache)
+
+    scored = errors = 0
+    try:
+        for tasks, lines_done, input_offset in _read_batches(input_file, start_line, batch_size, industries):
+            if pool is not None:
+                batch_results = pool.imap(_score_line, tasks, chunksize=CHUNK_SIZE)
+            else:
+                batch_results = map(_score_line, tasks)
+
+            for records in batch_results:
+                for record in records:
+                    errors += "error" in record
+                    writer.write(record)
+                scored += 1
+
+            output_file.flush()
+            if not to_stdout:
+                _save_checkpoint(checkpoint_path, {
+                    "input": os.path.abspath(args.input),
+                    "lines_done": lines_done,
+                    "input_offset": input_offset,
+                    "output_offset": output_file.tell()
+                })
+            print(f"Scored {scored:,} profiles (line {lines_done:,})", file=sys.stderr)
+    except BaseException:
+        # Interrupted runs keep their last checkpoint for --resume
+        if pool is not None:
+            pool.terminate()
+        raise
+    else:
+        if pool is not None:
+            pool.close()
+    finally:
+        if pool is not None:
+            pool.join()
+        input_file.close()
+        if not to_stdout:
+            output_file.close()
+
+    # A finished run leaves no checkpoint behind
+    if not to_stdout and os.path.exists(checkpoint_path):
+        os.remove(checkpoint_path)
+
+    print(f"Done: {scored:,} profiles, {errors:,} errors", file=sys.stderr)
+    return 0
+
+def serve_command(args) -> int:
+    """Launch the Streamlit web app"""
+    app_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "app.py")
+    return subprocess.call([sys.executable, "-m", "streamlit", "run", app_path])
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="career-stem",
+        description="Career Shift to Future STEM Industry"
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    score = subparsers.add_parser("score", help="Score profiles from a JSONL file")
+    score.add_argument("input", help="JSONL file with one profile per line")
+    score.add_argument("--industry", default="all", help="'all' or a comma-separated list, e.g. AI,CYBERSECURITY")
+    score.add_argument("--workers", type=int, default=1, help="Number of worker processes")
+    score.add_argument("--output", default="-", help="Output file, or '-' for stdout")
+    score.add_argument("--format", choices=["jsonl", "csv"], help="Output format (default: from --output extension)")
+    score.add_argument("--resume", action="store_true", help="Continue from the last checkpoint of --output")
+    score.add_argument("--cache", action="store_true",
+                       help="Read and fill the readiness cache shared with the web app (e.g. to warm it)")
+    score.set_defaults(func=score_command)
+
+    serve = subparsers.add_parser("serve", help="Run the Streamlit app")
+    serve.set_defaults(func=serve_command)
+
+    return parser
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    try:
+        return args.func(args)
+    except KeyboardInterrupt:
+        print("Interrupted. Rerun with --resume to continue from the last checkpoint.", file=sys.stderr)
+        return 130
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -13,6 +13,210 @@ APP_TITLE = "Career Shift to Future STEM Industry"
 APP_ICON = "🚀"
 VERSION = "1.0.0"
 
+# Developer diagnostics (payload sizes, connection pool and cache stats) are
+# hidden from users; set CAREER_DEBUG=true to show them
+DEBUG_DIAGNOSTICS = os.getenv('CAREER_DEBUG', 'false').lower() == 'true'
+
+# Target Industries (keys match ReadinessCalculator and the CareerMapper paths)
+FUTURE_INDUSTRIES = {
+    "AI": {
+        "name": "Artificial Intelligence",
+        "icon": "🤖",
+        "description": "Machine learning, deep learning and intelligent systems",
+        "key_skills": ["Python", "Machine Learning", "Mathematics", "Statistics", "Deep Learning", "NLP"]
+    },
+    "BLOCKCHAIN": {
+        "name": "Blockchain",
+        "icon": "⛓️",
+        "description": "Distributed ledgers, smart contracts and decentralized finance",
+        "key_skills": ["Programming", "Cryptography", "Distributed Systems", "Solidity", "Smart Contracts", "Web3"]
+    },
+    "CYBERSECURITY": {
+        "name": "Cybersecurity",
+        "icon": "🔒",
+        "description": "Protecting networks, systems and data",
+        "key_skills": ["Networking", "Security Fundamentals", "Linux", "Python", "Penetration Testing", "SIEM"]
+    },
+    "BIOTECH": {
+        "name": "Biotechnology",
+        "icon": "🧬",
+        "description": "Genomics, bioinformatics and life-science research",
+        "key_skills": ["Biology", "Data Analysis", "Research Methods", "Bioinformatics", "Genomics", "Lab Techniques"]
+    },
+    "AGRITECH": {
+        "name": "Agricultural Technology",
+        "icon": "🌾",
+        "description": "Precision farming, IoT and sustainable food production",
+        "key_skills": ["Agriculture Knowledge", "Data Analysis", "IoT", "Precision Agriculture", "GIS", "Automation"]
+    },
+    "AQUATECH": {
+        "name": "Aquatic Technology",
+        "icon": "🌊",
+        "description": "Aquaculture systems, water quality and marine science",
+        "key_skills": ["Marine Science", "Data Analysis", "Environmental Science", "Aquaculture Systems", "Water Quality", "IoT"]
+    },
+    "SPACETECH": {
+        "name": "Space Technology",
+        "icon": "🚀",
+        "description": "Aerospace engineering, satellites and mission systems",
+        "key_skills": ["Engineering", "Mathematics", "Physics", "Programming", "Aerospace Engineering", "Simulation"]
+    },
+    "RENEWABLE": {
+        "name": "Renewable Energy",
+        "icon": "☀️",
+        "description": "Solar, wind, storage and smart grid systems",
+        "key_skills": ["Engineering", "Energy Systems", "Mathematics", "Solar/Wind Technology", "Grid Systems", "Energy Storage"]
+    }
+}
+
+# Readiness score component weights (education, projects and certifications add a bonus on top)
+SCORING_WEIGHTS = {
+    "current_skills_match": 0.35,
+    "transferable_skills": 0.25,
+    "learning_curve": 0.2,
+    "market_demand": 0.2
+}
+
+# Data Files
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+INDUSTRY_SKILLS_PATH = os.path.join(DATA_DIR, "industry_skills.csv")
+COURSE_CATALOG_PATH = os.path.join(DATA_DIR, "course_catalog.csv")
+CERTIFICATION_CATALOG_PATH = os.path.join(DATA_DIR, "certifications.csv")
+
+# Local Cache Storage (shared by all app processes on the host)
+CACHE_DIR = os.getenv('CAREER_CACHE_DIR', os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache"))
+
+READINESS_CACHE = {
+    "path": os.path.join(CACHE_DIR, "readiness.sqlite3"),
+    "ttl_seconds": 7 * 24 * 3600,
+    "max_entries": 50000
+}
+
+# Job Market Data Sources
+# Each source returns JSON keyed by job field (e.g. "ai_ml_jobs") with any of
+# count, growth_rate, avg_salary, top_skills and locations. Sources without a
+# URL are skipped, and fields no source reports fall back to baseline values.
+MARKET_DATA_SOURCES = [
+    {"name": "LinkedIn", "url": os.getenv('LINKEDIN_JOBS_API_URL'), "timeout": 4.0},
+    {"name": "Indeed", "url": os.getenv('INDEED_JOBS_API_URL'), "timeout": 4.0},
+    {"name": "Glassdoor", "url": os.getenv('GLASSDOOR_API_URL'), "timeout": 4.0},
+    {"name": "Bureau of Labor Statistics", "url": os.getenv('BLS_API_URL'), "timeout": 6.0}
+]
+
+# Seconds between background market data refreshes (one refresher per server process)
+MARKET_DATA_REFRESH_SECONDS = 600
+
+# Time series of refreshed snapshots; daily rollups are kept indefinitely
+MARKET_HISTORY = {
+    "path": os.path.join(CACHE_DIR, "market_history.sqlite3"),
+    "raw_retention_days": 14,
+    "hourly_retention_days": 180
+}
+
+# Educational Content Sources
+# Each URL returns a JSON list that replaces the matching section of the
+# built-in educational content. Sections without a URL keep the defaults.
+EDUCATIONAL_CONTENT_SOURCES = {
+    "trending_courses": os.getenv('TRENDING_COURSES_URL'),
+    "latest_research": os.getenv('LATEST_RESEARCH_URL'),
+    "youtube_channels": os.getenv('YOUTUBE_CHANNELS_URL')
+}
+
+# Conditional-request cache for content providers (ETag / Last-Modified)
+HTTP_CACHE = {
+    "directory": os.path.join(CACHE_DIR, "http"),
+    "timeout": 5.0
+}
+
+# AI Career Advisor
+# Answers stream token by token as the provider generates them; set
+# ADVISOR_STREAMING=false to wait for the complete answer instead
+OPENROUTER_API_URL = os.getenv('OPENROUTER_API_URL', "https://openrouter.ai/api/v1/chat/completions")
+OPENROUTER_API_KEY = os.getenv('OPENROUTER_API_KEY')
+ADVISOR_STREAMING = os.getenv('ADVISOR_STREAMING', 'true').lower() != 'false'
+
+# Keep-alive connection pools shared by all advisor calls in a server process.
+# 429 and 5xx responses are retried with exponential backoff and full jitter.
+ADVISOR_HTTP = {
+    "pool_connections": 4,
+    "pool_maxsize": int(os.getenv('ADVISOR_POOL_MAXSIZE', '16')),
+    "retries": 2,
+    "backoff_seconds": 0.5,
+    "backoff_max_seconds": 4.0
+}
+
+# Hedged provider calls: if OpenRouter has not answered (or sent a first token)
+# within the delay, HuggingFace is asked too and the first good answer wins.
+# A provider being probed after an outage is hedged immediately.
+ADVISOR_HEDGING = {
+    "hedge_delay_seconds": float(os.getenv('ADVISOR_HEDGE_DELAY', '4')),
+    "max_workers": 16
+}
+
+# Per-provider circuit breakers, shared by all sessions in a server process.
+# A provider whose recent calls mostly fail or are slow is skipped for
+# open_seconds, then a single probe call decides whether it is back.
+ADVISOR_CIRCUIT_BREAKER = {
+    "window_seconds": 120,
+    "min_requests": 4,
+    "error_rate_threshold": 0.5,
+    "slow_call_seconds": 15.0,
+    "slow_call_rate_threshold": 0.8,
+    "open_seconds": 30,
+    "half_open_probes": 1
+}
+
+# Advisor answers keyed by question and context type. A question that is not
+# an exact repeat is still served from cache when its TF-IDF cosine to a
+# cached question reaches the similarity threshold.
+ADVISOR_RESPONSE_CACHE = {
+    "path": os.path.join(CACHE_DIR, "advisor_responses.sqlite3"),
+    "ttl_seconds": 24 * 3600,
+    "max_entries": 2000,
+    "similarity_threshold": 0.9
+}
+
+# Outbound advisor calls go through one queue per server process. Each provider
+# has a token bucket (OpenRouter's free tier allows 20 requests a minute), at
+# most max_concurrent calls run at once, and sessions take turns so one busy
+# user can't starve the others. A call still queued after max_queue_seconds
+# is withdrawn, which lets the other provider answer instead.
+ADVISOR_RATE_LIMITS = {
+    "providers": {
+        "OpenRouter": {"rate_per_second": 20 / 60, "burst": 5},
+        "HuggingFace": {"rate_per_second": 0.5, "burst": 5}
+    },
+    "max_concurrent": 8,
+    "max_queue_seconds": 45
+}
+
+# Each session keeps its latest max_turns advisor turns in memory; older turns
+# move to a gzip file per session and are read back only when scrolled to or
+# exported. Files untouched for retention_seconds are deleted.
+CHAT_HISTORY = {
+    "directory": os.path.join(CACHE_DIR, "chat_history"),
+    "max_turns": int(os.getenv('CHAT_HISTORY_MAX_TURNS', '20')),
+    "retention_seconds": 7 * 24 * 3600
+}
+
+# Advisor prompts are grounded in the course catalog, industry skills, STEM
+# fields and the latest market snapshot: the best TF-IDF matches for the
+# question are added until token_budget (estimated at chars_per_token) is spent.
+ADVISOR_RETRIEVAL = {
+    "top_k": 8,
+    "min_score": 0.1,
+    "token_budget": 350,
+    "chars_per_token": 4,
+    "cache_entries": 512
+}
+
+# Market charts are cached as figure specs keyed by a hash of their input data
+# (or its snapshot version) and theme, shared by every session; the least
+# recently used spec is evicted past max_entries.
+FIGURE_CACHE = {
+    "max_entries": 32
+}
+
 # Course Data
 STEM_FIELDS = {
     'AI & Machine Learning': {
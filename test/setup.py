@@ -28,7 +28,7 @@ setup(
     python_requires=">=3.8",
     entry_points={
         "console_scripts": [
-            "career-stem=app:main",
+            "career-stem=cli:main",
         ],
     },
     classifiers=[
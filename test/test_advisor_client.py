@@ -0,0 +1,133 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler
+
+import pytest
+import requests
+
+from utils.advisor_client import (StreamError, iter_completion_deltas, iter_lines, iter_sse_events,
+                                  stream_chat_completion)
+
+
+def delta_frame(text):
+    return f"data: {json.dumps({'choices': [{'delta': {'content': text}}]})}\n\n".encode()
+
+
+class StreamHandler(BaseHTTPRequestHandler):
+    """Chunked event stream; `frames` are sent one chunk each, pausing on `gate` between them"""
+    protocol_version = "HTTP/1.1"
+    frames = []
+    gate = None
+    frame_delay = 0.0
+
+    def log_message(self, *args):
+        pass
+
+    def send_chunk(self, data):
+        self.wfile.write(b"%x\r\n%s\r\n" % (len(data), data))
+        self.wfile.flush()
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        assert body["stream"] is True
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        handler = type(self)
+        try:
+            for frame in handler.frames:
+                if handler.gate is not None:
+                    handler.gate.wait(5)
+                    handler.gate.clear()
+                time.sleep(handler.frame_delay)
+                self.send_chunk(frame)
+            self.send_chunk(b"")
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+
+@pytest.fixture
+def stream_server(serve):
+    StreamHandler.gate = None
+    StreamHandler.frame_delay = 0.0
+    return serve(StreamHandler)
+
+
+def test_lines_split_across_chunks():
+    chunks = [b"data: caf", b"\xc3", b"\xa9\r", b"\ndata: two\r\rlast"]
+    assert list(iter_lines(chunks)) == ["data: café", "data: two", "", "last"]
+
+
+def test_events_join_multi_line_data_and_skip_comments():
+    lines = [": keep-alive", "event: delta", "id: 7", "data: first", "data:second", "", "data: tail"]
+    assert list(iter_sse_events(lines)) == [
+        {"event": "delta", "id": "7", "data": "first\nsecond"},
+        {"event": "message", "data": "tail"}
+    ]
+
+
+def test_deltas_stop_at_done_and_raise_on_errors():
+    events = [{"data": '{"choices": [{"delta": {"content": "a"}}]}'}, {"data": "not json"},
+              {"data": "[DONE]"}, {"data": '{"choices": [{"delta": {"content": "late"}}]}'}]
+    assert list(iter_completion_deltas(events)) == ["a"]
+    with pytest.raises(StreamError, match="overloaded"):
+        list(iter_completion_deltas([{"data": '{"error": {"message": "overloaded"}}'}]))
+
+
+def test_deltas_are_yielded_as_each_chunk_arrives(stream_server):
+    # The server sends each frame only after the client has read the one before
+    StreamHandler.gate = threading.Event()
+    StreamHandler.frames = [delta_frame("Hello"), delta_frame(" world"), b"data: [DONE]\n\n"]
+    StreamHandler.gate.set()
+
+    received = []
+    start = time.monotonic()
+    for delta in stream_chat_completion(stream_server, {}, {}, timeout=(2, 2)):
+        received.append(delta)
+        StreamHandler.gate.set()
+
+    # A reader that buffered the body would stall on the first gate until the read timeout
+    assert received == ["Hello", " world"]
+    assert time.monotonic() - start < 1
+
+
+def test_frames_split_mid_line_and_multi_line_data(stream_server):
+    frame = delta_frame("split")
+    multi_line = b'data: {"choices": [{"delta":\ndata: {"content": "joined"}}]}\n\n'
+    StreamHandler.frames = [frame[:9], frame[9:20], frame[20:], b": ping\n\n", multi_line,
+                            b"data: [DONE]\n\n", delta_frame("after done")]
+
+    assert list(stream_chat_completion(stream_server, {}, {})) == ["split", "joined"]
+
+
+def test_error_status_raises(serve):
+    class Failing(BaseHTTPRequestHandler):
+        def log_message(self, *args):
+            pass
+
+        def do_POST(self):
+            self.send_response(503)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+    with pytest.raises(requests.HTTPError):
+        list(stream_chat_completion(serve(Failing), {}, {}))
+
+
+def test_time_to_first_token_against_a_stub_provider(stream_server):
+    StreamHandler.frame_delay = 0.05
+    StreamHandler.frames = [delta_frame(f"token{i} ") for i in range(20)] + [b"data: [DONE]\n\n"]
+
+    start = time.monotonic()
+    stream = stream_chat_completion(stream_server, {}, {})
+    first = next(stream)
+    time_to_first_token = time.monotonic() - start
+    text = first + "".join(stream)
+    total = time.monotonic() - start
+
+    print(f"\ntime to first token {time_to_first_token * 1000:.0f} ms, full answer {total * 1000:.0f} ms")
+    assert text.split() == [f"token{i}" for i in range(20)]
+    # Streaming shows the first words after one frame instead of after all twenty
+    assert time_to_first_token < total / 5
@@ -0,0 +1,185 @@
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+from utils.advisor_client import close_response, stream_chat_completion
+from utils.advisor_dispatch import AllProvidersFailed, AttemptHandle, HedgedDispatcher
+from utils.circuit_breaker import BreakerRegistry
+from utils.http_client import PooledHttpClient
+
+
+def dispatcher(hedge_delay=0.05):
+    return HedgedDispatcher(hedge_delay=hedge_delay, max_workers=8, breakers=BreakerRegistry(min_requests=100))
+
+
+def percentile(values, q):
+    ordered = sorted(values)
+    return ordered[int(q * (len(ordered) - 1))]
+
+
+def test_first_provider_answers_alone_when_fast():
+    result = dispatcher().run([("A", lambda attempt: "a"), ("B", lambda attempt: "b")])
+    assert (result.provider, result.value, result.started, result.hedged) == ("A", "a", ["A"], False)
+
+
+def test_slow_provider_is_hedged_after_the_delay():
+    def slow(attempt):
+        attempt.cancelled.wait(2)
+        return "slow"
+
+    start = time.monotonic()
+    result = dispatcher().run([("A", slow), ("B", lambda attempt: "fast")])
+
+    assert (result.provider, result.started) == ("B", ["A", "B"])
+    assert time.monotonic() - start < 1
+
+
+def test_failure_starts_the_next_provider_at_once():
+    def failing(attempt):
+        raise ValueError("boom")
+
+    result = dispatcher(hedge_delay=10).run([("A", failing), ("B", lambda attempt: "b")])
+    assert result.provider == "B"
+
+
+def test_all_failures_are_reported():
+    def failing(attempt):
+        raise ValueError(attempt.provider)
+
+    with pytest.raises(AllProvidersFailed) as raised:
+        dispatcher().run([("A", failing), ("B", failing)])
+    assert set(raised.value.errors) == {"A", "B"}
+
+
+def test_losers_are_cancelled():
+    loser_stopped = threading.Event()
+
+    def slow(attempt):
+        attempt.on_cancel(loser_stopped.set)
+        attempt.cancelled.wait(5)
+        return "slow"
+
+    dispatcher().run([("A", slow), ("B", lambda attempt: "fast")])
+    assert loser_stopped.wait(1)
+
+
+def test_cancel_callbacks_run_once_and_late_registrations_run_at_once():
+    handle = AttemptHandle("A")
+    calls = []
+    handle.on_cancel(lambda: calls.append("first"))
+    handle.cancel()
+    handle.cancel()
+    handle.on_cancel(lambda: calls.append("late"))
+    assert calls == ["first", "late"]
+
+
+class SlowStreamHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disconnected = None
+
+    def log_message(self, *args):
+        pass
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers["Content-Length"]))
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        try:
+            for i in range(20):
+                time.sleep(0.1)
+                frame = f'data: {{"choices": [{{"delta": {{"content": "{i} "}}}}]}}\n\n'.encode()
+                self.wfile.write(b"%x\r\n%s\r\n" % (len(frame), frame))
+                self.wfile.flush()
+            self.wfile.write(b"0\r\n\r\n")
+        except (BrokenPipeError, ConnectionResetError):
+            type(self).disconnected.set()
+
+
+def test_losing_stream_is_closed_mid_read(serve):
+    SlowStreamHandler.disconnected = threading.Event()
+    url = serve(SlowStreamHandler)
+    client = PooledHttpClient()
+    reader_done = threading.Event()
+
+    def streaming(attempt):
+        stream = stream_chat_completion(url, {}, {}, session=client, cancel=attempt.cancelled,
+                                        on_response=lambda response: attempt.on_cancel(lambda: close_response(response)))
+        try:
+            return "".join(stream)
+        finally:
+            reader_done.set()
+
+    def answers_later(attempt):
+        time.sleep(0.3)
+        return "other"
+
+    result = dispatcher(hedge_delay=0.05).run([("Streaming", streaming), ("Other", answers_later)])
+
+    assert result.provider == "Other"
+    # The loser stops reading at once instead of running through the remaining chunks
+    assert reader_done.wait(0.5)
+    assert SlowStreamHandler.disconnected.wait(2)
+
+
+class LatencyHandler(BaseHTTPRequestHandler):
+    """Stub provider whose latency per request comes from the query string"""
+
+    def log_message(self, *args):
+        pass
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers["Content-Length"]))
+        delay = float(parse_qs(urlsplit(self.path).query)["delay"][0])
+        time.sleep(delay)
+        body = json.dumps({"answer": self.path}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def test_hedging_cuts_tail_latency_against_stub_providers(serve):
+    base = serve(LatencyHandler)
+    client = PooledHttpClient(pool_maxsize=16)
+    requests_count = 40
+
+    def provider(delay):
+        def call(attempt):
+            response = client.post(f"{base}/?delay={delay}", json={}, timeout=5, stream=True, cancel=attempt.cancelled)
+            attempt.on_cancel(lambda: close_response(response))
+            return response.json()["answer"]
+        return call
+
+    def primary_delay(i):
+        # One request in ten hits the primary's slow tail
+        return 0.6 if i % 10 == 9 else 0.02
+
+    def timed(i, hedged):
+        attempts = [("Primary", provider(primary_delay(i)))]
+        if hedged:
+            attempts.append(("Secondary", provider(0.04)))
+        start = time.monotonic()
+        dispatcher(hedge_delay=0.1).run(attempts)
+        return time.monotonic() - start
+
+    report = {}
+    for hedged in (False, True):
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            latencies = list(pool.map(lambda i: timed(i, hedged), range(requests_count)))
+        report["hedged" if hedged else "primary only"] = {q: percentile(latencies, q) for q in (0.5, 0.95, 0.99)}
+
+    print()
+    for name, quantiles in report.items():
+        print(f"{name:>12}: " + ", ".join(f"P{int(q * 100)} {seconds * 1000:.0f} ms" for q, seconds in quantiles.items()))
+
+    assert report["hedged"][0.5] < 0.1
+    assert report["primary only"][0.99] >= 0.6
+    assert report["hedged"][0.99] < 0.3
@@ -0,0 +1,67 @@
+import logging
+
+import pytest
+
+from utils.advisor_knowledge import GROUNDING_HEADER, AdvisorKnowledgeIndex
+
+FIELDS = {
+    "Cybersecurity": {"description": "Protect digital assets", "avg_salary": 95000, "growth": "+32%",
+                      "courses": ["Network Security", "Ethical Hacking"]},
+    "Biotechnology": {"description": "Engineer living systems", "avg_salary": 88000, "growth": "+15%",
+                      "courses": ["Genomics", "Bioinformatics"]}
+}
+
+
+def snapshot(version, count):
+    return {
+        "last_updated": version,
+        "cybersecurity_jobs": {"count": count, "growth_rate": 31.5, "avg_salary": 112000, "live": True,
+                               "top_skills": ["SIEM", "Penetration Testing"], "locations": ["Austin"]}
+    }
+
+
+@pytest.fixture
+def index(tmp_path):
+    skills = tmp_path / "industry_skills.csv"
+    skills.write_text("industry,skill_name,skill_category,importance,difficulty,learning_hours\n"
+                      "CYBERSECURITY,Linux,Operating System,Essential,Medium,150\n"
+                      "BIOTECH,Genomics,Core Knowledge,Essential,High,300\n")
+    return AdvisorKnowledgeIndex(course_catalog_path=None, industry_skills_path=str(skills), stem_fields=FIELDS)
+
+
+def test_questions_retrieve_matching_documents(index):
+    results = index.search("How do I learn genomics?")
+    assert [result["kind"] for result in results][:2] == ["skill", "field"]
+    assert results[0]["text"].startswith("Skill: Genomics for BIOTECH")
+    assert index.search("zzz") == []
+
+
+def test_new_snapshot_reindexes_only_the_market_documents(index):
+    static_postings, idf = index.static_postings, index.idf
+
+    index.update_market(snapshot("2025-10-09 08:00", 3500))
+    assert "3,500 openings" in index.grounding("penetration testing jobs in austin")
+    index.update_market(snapshot("2025-10-09 08:10", 3600))
+
+    assert index.static_postings is static_postings and index.idf is idf
+    assert len(index.documents) == 5
+    grounding = index.grounding("penetration testing jobs in austin")
+    assert grounding.startswith(GROUNDING_HEADER)
+    assert "3,600 openings" in grounding and "3,500 openings" not in grounding
+
+
+def test_same_snapshot_keeps_the_grounding_cache(index):
+    index.update_market(snapshot("2025-10-09 08:00", 3500))
+    index.grounding("linux skills")
+    index.update_market(snapshot("2025-10-09 08:00", 3500))
+    index.grounding("Linux skills?")
+    assert index.stats()["hits"] == 1 and index.stats()["cached_questions"] == 1
+
+
+def test_missing_source_file_is_logged(tmp_path, caplog):
+    missing = str(tmp_path / "course_catalog.csv")
+    with caplog.at_level(logging.WARNING, logger="utils.advisor_knowledge"):
+        index = AdvisorKnowledgeIndex(course_catalog_path=missing, industry_skills_path=None, stem_fields=FIELDS)
+
+    assert len(index.documents) == 2
+    assert missing in caplog.text
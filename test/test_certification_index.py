@@ -0,0 +1,68 @@
+import pytest
+
+from config import CERTIFICATION_CATALOG_PATH
+from utils.certification_index import CertificationIndex, tokenize
+from utils.readiness_score import ReadinessCalculator
+
+
+@pytest.fixture(scope="module")
+def index():
+    return CertificationIndex()
+
+
+def test_tokenize_keeps_plus_and_hash_suffixes():
+    assert tokenize("CompTIA Security+ / C# dev") == ("comptia", "security+", "c#", "dev")
+
+
+def test_shipped_catalog_is_loaded(index):
+    assert index.entries
+    assert index.match("CompTIA Security+")[0]["industry"] == "CYBERSECURITY"
+
+
+def test_longest_term_wins(index):
+    matched = index.match("AWS Certified Machine Learning - Specialty")
+    assert [entry["certification"] for entry in matched] == ["AWS Certified Machine Learning - Specialty"]
+
+
+def test_vendor_names_alone_are_not_certifications(index):
+    for vendor in ["Google", "Cisco", "IBM", "NVIDIA", "Worked at Google on Cisco networks"]:
+        assert index.match(vendor) == []
+    assert index.match("NVIDIA DLI")[0]["certification"] == "NVIDIA Deep Learning Institute Certificate"
+
+
+def test_gcp_is_read_as_google_cloud_not_clinical_practice(index):
+    assert index.match_industries(["GCP"]) == {}
+    assert list(index.match_industries(["GCP Machine Learning"])) == ["AI"]
+    assert list(index.match_industries(["ICH GCP"])) == ["BIOTECH"]
+
+
+def test_keywords_the_old_matcher_scored_still_match(index):
+    # Regression: these counted toward AI before certifications were catalog-backed
+    for certification in ["Machine Learning", "TensorFlow", "Deep Learning", "AWS ML", "Intro to TensorFlow"]:
+        assert list(index.match_industries([certification])) == ["AI"], certification
+    assert len(index.match_industries(["Machine Learning", "TensorFlow"])["AI"]) == 2
+
+
+def test_duplicate_certifications_count_once(index):
+    matches = index.match_industries(["CompTIA Security+", "Security+ certified"])
+    assert len(matches["CYBERSECURITY"]) == 1
+
+
+def test_missing_catalog_raises(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        CertificationIndex(str(tmp_path / "missing.csv"))
+
+
+def test_catalog_path_points_at_shipped_file():
+    assert CertificationIndex(CERTIFICATION_CATALOG_PATH).entries
+
+
+def test_certifications_raise_readiness_score():
+    calculator = ReadinessCalculator()
+    profile = {"skills": {"technical": ["Python"]}}
+    without = calculator.calculate_readiness_score(profile, "CYBERSECURITY")
+    with_cert = calculator.calculate_readiness_score({**profile, "certifications": ["CompTIA Security+"]}, "CYBERSECURITY")
+
+    assert without["component_scores"]["certifications"] == 0
+    assert with_cert["component_scores"]["certifications"] > 0
+    assert with_cert["certification_matches"][0]["matched"] == "CompTIA Security+"
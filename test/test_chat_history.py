@@ -0,0 +1,58 @@
+import os
+import time
+
+import pytest
+
+from utils.chat_history import ChatHistory, format_turn
+
+
+def turn(i):
+    return {"user": f"question {i}", "ai": f"answer {i}", "timestamp": f"2025-10-09 08:{i:02d}"}
+
+
+@pytest.fixture
+def history(tmp_path):
+    history = ChatHistory("session", directory=str(tmp_path), max_turns=3)
+    for i in range(8):
+        history.append(turn(i))
+    return history
+
+
+def test_only_the_latest_turns_stay_in_memory(history):
+    assert len(history) == 8
+    assert history.archived == 5
+    assert list(history.recent_turns) == [turn(5), turn(6), turn(7)]
+    assert os.path.exists(history.archive_path)
+
+
+def test_ranges_read_across_the_archive_and_memory(history):
+    assert history.turns() == [turn(i) for i in range(8)]
+    assert history.turns(3, 6) == [turn(3), turn(4), turn(5)]
+    assert history.turns(6, 100) == [turn(6), turn(7)]
+    assert history.latest(2) == [turn(6), turn(7)]
+
+
+def test_export_writes_every_turn_in_order(history):
+    with open(history.export(), encoding="utf-8") as f:
+        exported = f.read()
+    assert exported == "\n\n".join(format_turn(turn(i)) for i in range(8))
+
+
+def test_pruned_archive_leaves_the_in_memory_turns(history):
+    os.remove(history.archive_path)
+    assert history.turns() == [turn(5), turn(6), turn(7)]
+
+
+def test_clear_deletes_the_session_files(history):
+    history.export()
+    history.clear()
+    assert len(history) == 0 and history.turns() == []
+    assert not os.path.exists(history.archive_path) and not os.path.exists(history.export_path)
+
+
+def test_idle_sessions_are_pruned_when_a_new_one_starts(history, tmp_path):
+    stale = time.time() - 3600
+    os.utime(history.archive_path, (stale, stale))
+
+    ChatHistory("other", directory=str(tmp_path), retention_seconds=60)
+    assert not os.path.exists(history.archive_path)
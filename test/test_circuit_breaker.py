@@ -0,0 +1,109 @@
+import time
+
+import pytest
+
+from utils.advisor_dispatch import AllProvidersFailed, HedgedDispatcher
+from utils.circuit_breaker import CLOSED, HALF_OPEN, OPEN, BreakerRegistry, CircuitBreaker
+from utils.request_queue import QueueTimeout
+
+
+def breaker(**settings):
+    defaults = dict(window_seconds=60, min_requests=4, error_rate_threshold=0.5, slow_call_seconds=1.0,
+                    slow_call_rate_threshold=0.5, open_seconds=0.1, half_open_probes=1)
+    defaults.update(settings)
+    return CircuitBreaker("Provider", **defaults)
+
+
+def test_breaker_waits_for_enough_calls_before_tripping():
+    b = breaker()
+    for _ in range(3):
+        assert b.allow()
+        b.record(False, 0.1)
+    assert b.state == CLOSED
+
+    b.record(False, 0.1)
+    assert b.state == OPEN
+    assert not b.allow()
+    assert b.snapshot()["rejected"] == 1
+
+
+def test_slow_calls_trip_the_breaker():
+    b = breaker()
+    for _ in range(4):
+        b.record(True, 2.0)
+    assert b.state == OPEN
+
+
+def test_half_open_probe_closes_or_reopens():
+    b = breaker(min_requests=1)
+    b.record(False, 0.1)
+    time.sleep(0.15)
+
+    assert b.allow() and b.state == HALF_OPEN
+    # Only one probe at a time
+    assert not b.allow()
+    b.record(False, 0.1)
+    assert b.state == OPEN
+
+    time.sleep(0.15)
+    assert b.allow()
+    b.record(True, 0.1)
+    assert b.state == CLOSED and b.snapshot()["requests"] == 0
+
+
+def test_release_returns_a_probe_permit():
+    b = breaker(min_requests=1)
+    b.record(False, 0.1)
+    time.sleep(0.15)
+    assert b.allow()
+    b.release()
+    assert b.allow()
+
+
+def dispatcher_with(**settings):
+    return HedgedDispatcher(hedge_delay=5, max_workers=4, breakers=BreakerRegistry(**settings))
+
+
+def test_queue_wait_is_not_counted_as_provider_latency():
+    dispatcher = dispatcher_with(min_requests=1, slow_call_seconds=0.2)
+
+    def queued(attempt):
+        time.sleep(0.4)  # waiting for a rate-limit token
+        attempt.begin()
+        time.sleep(0.01)
+        return "answer"
+
+    dispatcher.run([("Provider", queued)])
+    snapshot = dispatcher.breakers.get("Provider").snapshot()
+    assert snapshot["requests"] == 1
+    assert snapshot["slow_rate"] == 0.0
+    assert snapshot["p95_seconds"] < 0.2
+
+
+def test_queue_timeouts_leave_the_breaker_alone():
+    dispatcher = dispatcher_with(min_requests=1)
+
+    def timed_out(attempt):
+        raise QueueTimeout("waited too long")
+
+    for _ in range(3):
+        with pytest.raises(AllProvidersFailed):
+            dispatcher.run([("Provider", timed_out)])
+    snapshot = dispatcher.breakers.get("Provider").snapshot()
+    assert snapshot["state"] == CLOSED and snapshot["requests"] == 0
+
+
+def test_open_breaker_skips_the_provider():
+    dispatcher = dispatcher_with(min_requests=1, open_seconds=60)
+    calls = []
+
+    def failing(attempt):
+        calls.append(attempt.provider)
+        raise ValueError("down")
+
+    with pytest.raises(AllProvidersFailed):
+        dispatcher.run([("Provider", failing)])
+    result = dispatcher.run([("Provider", failing), ("Backup", lambda attempt: "ok")])
+
+    assert calls == ["Provider"]
+    assert result.provider == "Backup" and result.started == ["Backup"]
@@ -0,0 +1,113 @@
+import csv
+import json
+import os
+import signal
+import subprocess
+import sys
+import time
+
+import pytest
+
+import cli
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+INDUSTRIES = 8
+
+
+def write_profiles(path, count):
+    with open(path, "w") as f:
+        for i in range(count):
+            f.write(json.dumps({
+                "id": i,
+                "skills": {"technical": ["Python", "SQL", "Statistics"][:i % 3 + 1]},
+                "experience_years": i % 12,
+                "education_level": "bachelors",
+                "current_role": "engineer",
+                "projects": ["p"] * (i % 4)
+            }) + "\n")
+
+
+def test_interrupted_run_resumes_without_gaps_or_duplicates(tmp_path):
+    profiles, output = tmp_path / "profiles.jsonl", tmp_path / "scores.jsonl"
+    checkpoint = str(output) + ".ckpt"
+    count = 6000
+    write_profiles(profiles, count)
+    command = [sys.executable, os.path.join(ROOT, "cli.py"), "score", str(profiles),
+               "--workers", "2", "--output", str(output)]
+
+    run = subprocess.Popen(command, stderr=subprocess.PIPE, text=True)
+    deadline = time.monotonic() + 30
+    while not os.path.exists(checkpoint) and run.poll() is None and time.monotonic() < deadline:
+        time.sleep(0.01)
+    run.send_signal(signal.SIGINT)
+    _, stderr = run.communicate(timeout=30)
+
+    assert run.returncode == 130, stderr
+    assert "--resume" in stderr
+    with open(checkpoint) as f:
+        lines_done = json.load(f)["lines_done"]
+    assert 0 < lines_done < count
+
+    resumed = subprocess.run(command + ["--resume"], stderr=subprocess.PIPE, text=True, timeout=60)
+    assert resumed.returncode == 0, resumed.stderr
+    assert f"Resuming after line {lines_done:,}" in resumed.stderr
+    assert not os.path.exists(checkpoint)
+
+    records = [json.loads(line) for line in output.read_text().splitlines()]
+    assert len(records) == count * INDUSTRIES
+    assert len({(record["id"], record["industry"]) for record in records}) == count * INDUSTRIES
+    assert [record["line"] for record in records[::INDUSTRIES]] == list(range(1, count + 1))
+
+
+def test_resumed_csv_matches_an_uninterrupted_run(tmp_path, monkeypatch):
+    profiles = tmp_path / "profiles.jsonl"
+    write_profiles(profiles, 9)
+    monkeypatch.setattr(cli, "CHUNK_SIZE", 1)
+    monkeypatch.setattr(cli, "BATCHES_PER_WORKER", 2)
+
+    expected = tmp_path / "expected.csv"
+    assert cli.main(["score", str(profiles), "--industry", "AI", "--output", str(expected)]) == 0
+
+    score_line = cli._score_line
+
+    def interrupt_at_line_6(task):
+        if task[0] == 6:
+            raise KeyboardInterrupt
+        return score_line(task)
+
+    output = tmp_path / "scores.csv"
+    args = ["score", str(profiles), "--industry", "AI", "--output", str(output)]
+    monkeypatch.setattr(cli, "_score_line", interrupt_at_line_6)
+    assert cli.main(args) == 130
+    # Line 5 was scored but not yet checkpointed; resuming rewrites it
+    with open(str(output) + ".ckpt") as f:
+        assert json.load(f)["lines_done"] == 4
+
+    monkeypatch.setattr(cli, "_score_line", score_line)
+    assert cli.main(args + ["--resume"]) == 0
+    assert output.read_text() == expected.read_text()
+    with open(output, newline="") as f:
+        assert [row["id"] for row in csv.DictReader(f)] == [str(i) for i in range(9)]
+
+
+def test_resume_refuses_a_checkpoint_for_another_input(tmp_path):
+    profiles, other = tmp_path / "profiles.jsonl", tmp_path / "other.jsonl"
+    write_profiles(profiles, 2)
+    write_profiles(other, 2)
+    output = tmp_path / "scores.jsonl"
+    with open(str(output) + ".ckpt", "w") as f:
+        json.dump({"input": str(other), "lines_done": 1, "input_offset": 0, "output_offset": 0}, f)
+
+    with pytest.raises(SystemExit, match="different input"):
+        cli.main(["score", str(profiles), "--resume", "--output", str(output)])
+
+
+
+def test_readiness_cache_is_left_alone_without_the_flag(tmp_path, monkeypatch):
+    profiles = tmp_path / "profiles.jsonl"
+    write_profiles(profiles, 3)
+    opened = []
+    monkeypatch.setattr(cli, "ReadinessCache", lambda: opened.append(1))
+
+    assert cli.main(["score", str(profiles), "--industry", "AI", "--output", str(tmp_path / "scores.jsonl")]) == 0
+    assert opened == []
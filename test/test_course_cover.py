@@ -0,0 +1,67 @@
+import pandas as pd
+import pytest
+
+from utils.course_cover import CourseCoverPlanner
+from utils.course_recommender import CourseRecommender
+from utils.course_store import CourseStore
+
+SKILLS = ["Alpha", "Bravo", "Charlie", "Delta", "Echo", "Foxtrot"]
+
+
+def course(name, focus, industry="AI", price=0, weeks=4):
+    return [name, "Coursera", industry, focus, weeks, "Beginner", price, 4.5, f"https://example.com/{name.replace(' ', '-')}"]
+
+
+@pytest.fixture
+def planner(tmp_path):
+    skills = tmp_path / "industry_skills.csv"
+    skills.write_text("industry,skill_name\n" + "".join(f"AI,{skill}\n" for skill in SKILLS))
+    courses = pd.DataFrame([
+        # Greedy's cheapest-per-skill picks need three of these; two cover everything
+        course("Bravo Foxtrot", "Bravo", price=10),
+        course("Alpha Charlie Delta Foxtrot", "Alpha", price=10),
+        course("Alpha Bravo Charlie Delta", "Bravo", price=30),
+        course("Charlie Echo Foxtrot", "Echo", price=30),
+        course("Alpha Charlie Delta Echo", "Delta", price=10),
+        course("Echo Basics", "Echo", industry="BIOTECH", price=0),
+        course("Foxtrot Basics", "Foxtrot", industry="BIOTECH", price=0),
+    ], columns=["course_name", "platform", "industry", "skill_focus", "duration_weeks", "difficulty",
+                "price_usd", "rating", "url"])
+    return CourseCoverPlanner(CourseRecommender(CourseStore(courses=courses), skills_path=str(skills)))
+
+
+def test_exact_cover_beats_greedy(planner):
+    gaps = [f"Essential: {skill}" for skill in SKILLS]
+
+    greedy = planner.minimum_cover(gaps, industry="AI", exact=False)
+    exact = planner.minimum_cover(gaps, industry="AI")
+
+    assert (greedy["method"], len(greedy["courses"])) == ("greedy", 3)
+    assert (exact["method"], exact["optimal"]) == ("branch_and_bound", True)
+    assert sorted(c["course_name"] for c in exact["courses"]) == ["Alpha Bravo Charlie Delta", "Charlie Echo Foxtrot"]
+    assert sorted(exact["covered_gaps"]) == SKILLS and exact["uncovered_gaps"] == []
+
+
+def test_price_cost_prefers_cheap_courses(planner):
+    result = planner.minimum_cover(["Echo", "Foxtrot"], cost="price")
+    assert sorted(c["course_name"] for c in result["courses"]) == ["Echo Basics", "Foxtrot Basics"]
+    assert result["total_price"] == 0
+
+
+def test_uncoverable_gaps_are_reported(planner):
+    result = planner.minimum_cover(["Alpha", "Quantum Computing"], industry="AI")
+    assert len(result["courses"]) == 1 and "Alpha" in result["courses"][0]["covers"]
+    assert result["uncovered_gaps"] == ["Quantum Computing"]
+
+
+def test_unknown_cost_mode_is_rejected(planner):
+    with pytest.raises(ValueError):
+        planner.minimum_cover(["Alpha"], cost="rating")
+
+
+def test_industry_limits_the_courses_used(planner):
+    # The free BIOTECH courses are cheapest, but not in scope for an AI plan
+    result = planner.minimum_cover(["Echo", "Foxtrot"], cost="price", industry="AI")
+    assert {c["industry"] for c in result["courses"]} == {"AI"}
+    assert result["total_price"] == 20 and result["uncovered_gaps"] == []
+    assert [c["course_name"] for c in planner.minimum_cover(["Echo"], industry="BioTech")["courses"]] == ["Echo Basics"]
@@ -0,0 +1,58 @@
+import pandas as pd
+import pytest
+
+from utils.course_recommender import CourseRecommender, parse_gaps
+from utils.course_store import CourseStore
+
+COURSES = pd.DataFrame([
+    ["Python for Everybody", "Coursera", "AI", "Python", 8, "Beginner", 0, 4.8, "https://example.com/py"],
+    ["Machine Learning with Python", "edX", "AI", "Machine Learning", 10, "Intermediate", 0, 4.8, "https://example.com/ml"],
+    ["Statistics Foundations", "Udemy", "AI", "Statistics", 4, "Beginner", 20, 4.2, "https://example.com/stats"],
+    ["Linux Administration", "Udemy", "CYBERSECURITY", "Linux", 6, "Beginner", 15, 4.5, "https://example.com/linux"],
+], columns=["course_name", "platform", "industry", "skill_focus", "duration_weeks", "difficulty", "price_usd",
+            "rating", "url"])
+
+
+@pytest.fixture(scope="module")
+def recommender(tmp_path_factory):
+    skills = tmp_path_factory.mktemp("skills") / "industry_skills.csv"
+    skills.write_text("industry,skill_name\nAI,Python\nAI,Machine Learning\nAI,Statistics\nAI,Quantum Computing\n")
+    return CourseRecommender(CourseStore(courses=COURSES), skills_path=str(skills))
+
+
+def test_parse_gaps_weights_by_prefix():
+    assert parse_gaps(["Essential: Python", "Preferred: Python", "Preferred: SQL", "Linux"]) == {
+        "python": 1.0, "sql": 0.6, "linux": 1.0
+    }
+
+
+def test_courses_are_ranked_by_gap_coverage(recommender):
+    result = recommender.recommend(["Essential: Machine Learning", "Essential: Python"], top_k=2)
+
+    names = [course["course_name"] for course in result["courses"]]
+    # Covers machine learning fully and python through its title
+    assert names[0] == "Machine Learning with Python"
+    assert result["courses"][0]["covers"] == ["Python", "Machine Learning"]
+    assert names[1] == "Python for Everybody"
+    assert result["uncovered_gaps"] == []
+
+
+def test_industry_filter_and_uncovered_gaps(recommender):
+    result = recommender.recommend(["Linux", "Quantum Computing", "Rust"], top_k=5, industry="AI")
+    assert result["courses"] == []
+    assert result["uncovered_gaps"] == ["Linux", "Quantum Computing", "Rust"]
+
+
+def test_uncovered_gaps_keep_the_callers_spelling(recommender):
+    result = recommender.recommend(["quantum computing", "Essential: RUST", "Preferred: Rust"], top_k=0)
+    assert result["uncovered_gaps"] == ["quantum computing", "RUST"]
+
+
+def test_top_k_zero_returns_no_courses(recommender):
+    result = recommender.recommend(["Python", "Quantum Computing"], top_k=0)
+    assert result == {"courses": [], "uncovered_gaps": ["Quantum Computing"]}
+
+
+def test_negative_top_k_is_rejected(recommender):
+    with pytest.raises(ValueError):
+        recommender.recommend(["Python"], top_k=-1)
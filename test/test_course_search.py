@@ -0,0 +1,91 @@
+import pandas as pd
+import pytest
+
+from utils.course_search import CourseSearchIndex
+
+COLUMNS = ["course_name", "platform", "industry", "skill_focus", "duration_weeks", "difficulty", "price_usd",
+           "rating", "url"]
+
+
+def catalog(*rows):
+    return pd.DataFrame(list(rows), columns=COLUMNS)
+
+
+PYTHON = ["Python for Data Science", "Coursera", "AI", "Python", 6, "Beginner", 0, 4.7, "https://example.com/python"]
+DEEP = ["Deep Learning with Python and Python Tools", "edX", "AI", "Deep Learning", 12, "Advanced", 300, 4.4,
+        "https://example.com/deep"]
+SECURITY = ["Network Security Basics", "Udemy", "CYBERSECURITY", "Networking", 3, "Beginner", 15, 3.9,
+            "https://example.com/security"]
+CLOUD = ["Cloud Security Engineering", "Coursera", "CYBERSECURITY", "Cloud Security", 16, "Intermediate", 49, 4.6,
+         "https://example.com/cloud"]
+
+
+@pytest.fixture
+def index():
+    return CourseSearchIndex(catalog(PYTHON, DEEP, SECURITY, CLOUD))
+
+
+def names(result):
+    return [hit["course"]["course_name"] for hit in result["results"]]
+
+
+def test_bm25_ranks_focused_short_documents_first(index):
+    result = index.search("python")
+    assert result["total"] == 2
+    # Python is the skill focus of the first course, a title mention in a longer one for the second
+    assert names(result) == ["Python for Data Science", "Deep Learning with Python and Python Tools"]
+    assert result["results"][0]["score"] > result["results"][1]["score"]
+
+
+def test_empty_query_ranks_by_rating_and_pages(index):
+    assert names(index.search("", limit=2)) == ["Python for Data Science", "Cloud Security Engineering"]
+    assert names(index.search("", limit=2, offset=2)) == ["Deep Learning with Python and Python Tools",
+                                                          "Network Security Basics"]
+
+
+def test_facet_counts_ignore_their_own_filter(index):
+    result = index.search("security", filters={"difficulty": ["Beginner"]})
+    assert names(result) == ["Network Security Basics"]
+    assert result["facets"]["difficulty"]["Intermediate"] == 1
+    assert result["facets"]["difficulty"]["Beginner"] == 1
+    assert sum(result["facets"]["rating_band"].values()) == 1
+
+
+def test_sync_touches_only_changed_courses(index):
+    changed = list(CLOUD)
+    changed[7] = 4.9
+    counts = index.sync(catalog(PYTHON, DEEP, changed))
+
+    assert counts == {"added": 0, "updated": 1, "removed": 1}
+    assert len(index) == 3
+    assert index.search("security")["results"][0]["course"]["rating"] == 4.9
+
+
+def test_same_version_skips_the_sync(index):
+    index.sync(catalog(PYTHON, DEEP, SECURITY, CLOUD), version=1)
+    assert not index.needs_sync(1)
+    assert index.needs_sync(2) and index.needs_sync(None)
+
+    # Under an unchanged version even a different frame is not looked at
+    assert index.sync(catalog(PYTHON), version=1) == {"added": 0, "updated": 0, "removed": 0}
+    assert len(index) == 4
+    assert index.sync(catalog(PYTHON), version=2)["removed"] == 3
+
+
+def test_freed_slots_are_reused(index):
+    slots = len(index.keys)
+    for rating in (4.0, 4.1, 4.2):
+        updated = list(PYTHON)
+        updated[7] = rating
+        index.sync(catalog(updated, DEEP, SECURITY, CLOUD))
+    assert len(index.keys) == slots
+    assert index.doc_ids["https://example.com/python"] == 0
+
+    index.sync(catalog(PYTHON, DEEP))
+    replacement = list(SECURITY)
+    replacement[8] = "https://example.com/security-2"
+    index.sync(catalog(PYTHON, DEEP, replacement))
+    assert len(index.keys) == slots
+    assert len(index.free_slots) == 1
+    assert names(index.search("network")) == ["Network Security Basics"]
+    assert index.search("cloud")["total"] == 0
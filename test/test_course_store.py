@@ -0,0 +1,59 @@
+import pandas as pd
+import pytest
+
+from utils.course_store import CourseStore
+
+COURSES = pd.DataFrame([
+    ["Python for Everybody", "Coursera", "AI", "Python", 8, "Beginner", 0, 4.8, "https://example.com/py"],
+    ["Deep Learning", "edX", "AI", "Deep Learning", 12, "Advanced", 300, 4.4, "https://example.com/deep"],
+    ["Network Security Basics", "Udemy", "Cybersecurity", "Networking", 3, "Beginner", 15, 3.9,
+     "https://example.com/network"],
+    ["Cloud Security Engineering", "Coursera", "Cybersecurity", "Cloud Security", 16, "Intermediate", 49, 4.6,
+     "https://example.com/cloud"],
+    ["Genomics Data Science", "Coursera", "Biotech", "Genomics", 10, "Intermediate", 120, 4.5,
+     "https://example.com/genomics"],
+], columns=["course_name", "platform", "industry", "skill_focus", "duration_weeks", "difficulty", "price_usd",
+            "rating", "url"])
+
+
+@pytest.fixture(scope="module")
+def store():
+    return CourseStore(courses=COURSES)
+
+
+def names(rows):
+    return rows["course_name"].tolist()
+
+
+def test_columns_get_compact_types_and_price_bands(store):
+    courses = store.courses
+    assert str(courses["platform"].dtype) == "category"
+    assert courses["duration_weeks"].dtype == "int16"
+    assert courses["price_band"].astype(str).tolist() == ["Free", "Over $200", "Up to $50", "Up to $50", "$50-$200"]
+    assert store.facet_values("difficulty") == ["Beginner", "Intermediate", "Advanced"]
+
+
+def test_filters_combine_facets_case_insensitively(store):
+    assert names(store.filter(industry="ai")) == ["Python for Everybody", "Deep Learning"]
+    assert names(store.filter(platform="Coursera", difficulty=["Intermediate", "Advanced"])) == [
+        "Cloud Security Engineering", "Genomics Data Science"]
+    assert names(store.filter(industry="cybersecurity", price_band="Up to $50", min_rating=4.0)) == [
+        "Cloud Security Engineering"]
+    assert names(store.filter(platform="Nowhere")) == []
+
+
+def test_pages_are_sorted_and_clamped(store):
+    first = store.page(sort_by="rating", page_size=2)
+    assert (first["total"], first["pages"]) == (5, 3)
+    assert names(first["rows"]) == ["Python for Everybody", "Cloud Security Engineering"]
+
+    last = store.page(sort_by="price_usd", descending=False, page=9, page_size=2)
+    assert last["page"] == 2 and names(last["rows"]) == ["Deep Learning"]
+
+    filtered = store.page(store.filter_positions(industry="AI"), sort_by="course_name")
+    assert names(filtered["rows"]) == ["Python for Everybody", "Deep Learning"]
+
+
+def test_unknown_sort_column_is_rejected(store):
+    with pytest.raises(ValueError):
+        store.page(sort_by="url")
@@ -0,0 +1,60 @@
+import pandas as pd
+import plotly.graph_objects as go
+
+from utils.figure_cache import FigureCache, figure_key
+
+
+def salary_chart(salaries):
+    return go.Figure(go.Bar(x=list(salaries), y=list(salaries.values())), layout={"title": {"text": "Salaries"}})
+
+
+def test_hit_rebuilds_the_figure_without_calling_build():
+    cache = FigureCache()
+    builds = []
+
+    def build():
+        builds.append(1)
+        return salary_chart({"ai_ml_jobs": 145000, "biotech_jobs": 98000})
+
+    first = cache.get_or_build("salary_comparison", {"version": "2025-10-09 08:00"}, "dark", build)
+    second = cache.get_or_build("salary_comparison", {"version": "2025-10-09 08:00"}, "dark", build)
+
+    assert len(builds) == 1
+    assert isinstance(second, go.Figure)
+    assert second.to_dict() == first.to_dict()
+    assert list(second.data[0].y) == [145000, 98000]
+
+
+def test_new_version_or_theme_misses():
+    cache = FigureCache()
+    build = lambda: salary_chart({"ai_ml_jobs": 145000})
+
+    cache.get_or_build("salary_comparison", {"version": "v1"}, "dark", build)
+    cache.get_or_build("salary_comparison", {"version": "v2"}, "dark", build)
+    cache.get_or_build("salary_comparison", {"version": "v2"}, "light", build)
+    assert cache.stats()["entries"] == 3 and cache.stats()["hits"] == 0
+
+
+def test_failed_builds_are_not_cached():
+    cache = FigureCache()
+    assert cache.get_or_build("career_trends", {}, "dark", lambda: None) is None
+    assert cache.get_or_build("career_trends", {}, "dark", lambda: salary_chart({"ai_ml_jobs": 1})) is not None
+
+
+def test_stats_report_hits_misses_entries_and_bytes():
+    cache = FigureCache(max_entries=2)
+    for version in ("v1", "v2", "v3"):
+        cache.get_or_build("salary_comparison", {"version": version}, "dark", lambda: salary_chart({"ai_ml_jobs": 1}))
+    cache.get_or_build("salary_comparison", {"version": "v3"}, "dark", lambda: None)
+
+    stats = cache.stats()
+    assert stats == {"entries": 2, "bytes": stats["bytes"], "hits": 1, "misses": 3}
+    assert stats["bytes"] == 2 * len(salary_chart({"ai_ml_jobs": 1}).to_json())
+    assert set(cache.sizes) == set(cache.specs)
+
+
+def test_frames_are_keyed_by_content():
+    frame = pd.DataFrame({"field": ["ai_ml_jobs"], "count": [1200.0]})
+    assert figure_key("trends", {"history": frame}, None) == figure_key("trends", {"history": frame.copy()}, None)
+    changed = frame.assign(count=[1300.0])
+    assert figure_key("trends", {"history": frame}, None) != figure_key("trends", {"history": changed}, None)
@@ -0,0 +1,141 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler
+
+import pytest
+import requests
+
+from utils.http_cache import HttpCache
+
+LAST_MODIFIED = "Mon, 06 Oct 2025 08:00:00 GMT"
+
+
+class ValidatingHandler(BaseHTTPRequestHandler):
+    """Stub content API answering conditional GETs the way a CDN would"""
+    etag = '"v1"'
+    body = b'{"version": 1}'
+    fail = False
+    delay = 0.0
+    requests_seen = []
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        handler = type(self)
+        handler.requests_seen.append((self.path, self.headers.get("If-None-Match"),
+                                      self.headers.get("If-Modified-Since")))
+        time.sleep(handler.delay)
+        if handler.fail:
+            self.send_response(502)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        if self.path == "/etag" and self.headers.get("If-None-Match") == handler.etag:
+            status, headers, body = 304, {"ETag": handler.etag}, b""
+        elif self.path == "/modified" and self.headers.get("If-Modified-Since") == LAST_MODIFIED:
+            status, headers, body = 304, {"Last-Modified": LAST_MODIFIED}, b""
+        elif self.path == "/etag":
+            status, headers, body = 200, {"ETag": handler.etag}, handler.body
+        elif self.path == "/modified":
+            status, headers, body = 200, {"Last-Modified": LAST_MODIFIED}, handler.body
+        else:
+            status, headers, body = 200, {}, handler.body
+
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+@pytest.fixture
+def base(serve):
+    ValidatingHandler.etag = '"v1"'
+    ValidatingHandler.body = b'{"version": 1}'
+    ValidatingHandler.fail = False
+    ValidatingHandler.delay = 0.0
+    ValidatingHandler.requests_seen = []
+    return serve(ValidatingHandler)
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return HttpCache(str(tmp_path / "http"), timeout=2)
+
+
+def test_etag_is_sent_back_and_the_stored_body_reused_on_304(base, cache):
+    first = cache.get(f"{base}/etag")
+    assert (first.status, first.json()) == ("fetched", {"version": 1})
+
+    second = cache.get(f"{base}/etag")
+    assert second.status == "not_modified" and second.from_cache
+    assert second.content == first.content
+    assert ValidatingHandler.requests_seen == [("/etag", None, None), ("/etag", '"v1"', None)]
+
+
+def test_last_modified_is_sent_back_as_if_modified_since(base, cache):
+    cache.get(f"{base}/modified")
+    second = cache.get(f"{base}/modified")
+
+    assert second.status == "not_modified" and second.json() == {"version": 1}
+    assert ValidatingHandler.requests_seen[-1] == ("/modified", None, LAST_MODIFIED)
+
+
+def test_changed_resource_replaces_the_stored_copy(base, cache):
+    cache.get(f"{base}/etag")
+    ValidatingHandler.etag, ValidatingHandler.body = '"v2"', b'{"version": 2}'
+
+    changed = cache.get(f"{base}/etag")
+    assert (changed.status, changed.json()) == ("fetched", {"version": 2})
+    assert cache.get(f"{base}/etag").status == "not_modified"
+    assert ValidatingHandler.requests_seen[-1][1] == '"v2"'
+
+
+def test_stored_copy_survives_a_new_cache_instance(base, cache, tmp_path):
+    cache.get(f"{base}/etag")
+    reopened = HttpCache(str(tmp_path / "http"), timeout=2)
+    assert reopened.get(f"{base}/etag").status == "not_modified"
+
+
+def test_responses_without_validators_are_not_stored(base, cache):
+    cache.get(f"{base}/plain")
+    cache.get(f"{base}/plain")
+    assert [headers for _, *headers in ValidatingHandler.requests_seen] == [[None, None], [None, None]]
+
+
+def test_upstream_failure_serves_the_stored_copy_or_raises(base, cache):
+    fetched = cache.get(f"{base}/etag")
+    ValidatingHandler.fail = True
+
+    stale = cache.get(f"{base}/etag")
+    assert stale.status == "stale" and stale.content == fetched.content
+    assert stale.fetched_at == fetched.fetched_at
+    with pytest.raises(requests.HTTPError):
+        cache.get(f"{base}/plain")
+
+
+def test_corrupted_body_is_refetched(base, cache):
+    cache.get(f"{base}/etag")
+    _, body_path = cache._paths(f"{base}/etag")
+    with open(body_path, "wb") as f:
+        f.write(b"garbage")
+
+    assert cache.get(f"{base}/etag").status == "fetched"
+    assert ValidatingHandler.requests_seen[-1][1] is None
+
+
+def test_concurrent_gets_share_one_request(base, cache):
+    ValidatingHandler.delay = 0.2
+    start = threading.Barrier(4)
+
+    def fetch(_):
+        start.wait()
+        return cache.get(f"{base}/etag").json()
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        assert list(pool.map(fetch, range(4))) == [{"version": 1}] * 4
+    assert len(ValidatingHandler.requests_seen) == 1
@@ -0,0 +1,120 @@
+import shutil
+import ssl
+import subprocess
+import threading
+import time
+from http.server import BaseHTTPRequestHandler
+
+import pytest
+import requests
+
+from utils.http_client import PooledHttpClient, RequestCancelled
+
+
+class KeepAliveHandler(BaseHTTPRequestHandler):
+    """Stub API that keeps connections open and records which connection served each request"""
+    protocol_version = "HTTP/1.1"
+    # Headers and body go out in separate writes; Nagle would hold the body for the client's delayed ACK
+    disable_nagle_algorithm = True
+    connections = set()
+    statuses = []
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        type(self).connections.add(self.client_address)
+        statuses = type(self).statuses
+        status = statuses.pop(0) if statuses else 200
+        body = b'{"ok": true}'
+        self.send_response(status)
+        if status == 429:
+            self.send_header("Retry-After", "0.05")
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+@pytest.fixture
+def handler():
+    KeepAliveHandler.connections = set()
+    KeepAliveHandler.statuses = []
+    return KeepAliveHandler
+
+
+@pytest.fixture(scope="module")
+def tls_files(tmp_path_factory):
+    if shutil.which("openssl") is None:
+        pytest.skip("openssl is needed to create a test certificate")
+    directory = tmp_path_factory.mktemp("tls")
+    cert, key = str(directory / "cert.pem"), str(directory / "key.pem")
+    subprocess.run(["openssl", "req", "-x509", "-newkey", "rsa:2048", "-nodes", "-days", "1",
+                    "-subj", "/CN=127.0.0.1", "-addext", "subjectAltName=IP:127.0.0.1",
+                    "-keyout", key, "-out", cert], check=True, capture_output=True)
+    return cert, key
+
+
+def test_pooled_https_calls_reuse_one_connection(serve, handler, tls_files):
+    cert, key = tls_files
+    context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+    context.load_cert_chain(cert, key)
+    url = serve(handler, ssl_context=context) + "/v1/models"
+    calls = 30
+
+    def timed(get):
+        elapsed = []
+        for _ in range(calls):
+            start = time.perf_counter()
+            get().json()
+            elapsed.append(time.perf_counter() - start)
+        return sorted(elapsed)
+
+    client = PooledHttpClient()
+    pooled = timed(lambda: client.get(url, verify=cert, timeout=5))
+    pooled_connections = len(handler.connections)
+
+    handler.connections = set()
+    fresh = timed(lambda: requests.get(url, verify=cert, timeout=5))
+    fresh_connections = len(handler.connections)
+
+    print(f"\npooled: p50 {pooled[calls // 2] * 1000:.1f} ms over {pooled_connections} connection(s); "
+          f"fresh: p50 {fresh[calls // 2] * 1000:.1f} ms over {fresh_connections} connections")
+    assert pooled_connections == 1
+    assert fresh_connections == calls
+    # Every fresh call pays for a TCP connect and a TLS handshake
+    assert pooled[calls // 2] < fresh[calls // 2]
+
+
+def test_retries_honor_retry_after_and_are_timed(serve, handler):
+    base = serve(handler)
+    handler.statuses = [429, 503]
+    client = PooledHttpClient(retries=2, backoff_seconds=0.01)
+
+    assert client.get(f"{base}/retry", timeout=5).status_code == 200
+    stats = client.stats()[base.split("//")[1]]
+    assert stats["requests"] == 1 and stats["retries"] == 2 and stats["errors"] == 0
+    assert client.recent()[0]["elapsed"] >= 0.05
+
+
+def test_last_error_status_is_returned(serve, handler):
+    base = serve(handler)
+    handler.statuses = [503, 503]
+    client = PooledHttpClient(retries=1, backoff_seconds=0.01)
+
+    assert client.get(f"{base}/down", timeout=5).status_code == 503
+    assert client.recent()[0]["attempts"] == 2
+
+
+def test_cancel_stops_backoff_and_further_attempts(serve, handler):
+    base = serve(handler)
+    handler.statuses = [503, 503, 503]
+    client = PooledHttpClient(retries=2, backoff_seconds=10, backoff_max_seconds=10)
+    cancel = threading.Event()
+    threading.Timer(0.1, cancel.set).start()
+
+    start = time.monotonic()
+    with pytest.raises(RequestCancelled):
+        client.get(f"{base}/down", timeout=5, cancel=cancel)
+    assert time.monotonic() - start < 2
+    assert client.recent()[0]["error"] == "RequestCancelled"
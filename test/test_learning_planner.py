@@ -0,0 +1,65 @@
+from itertools import combinations
+
+import pytest
+
+import utils.learning_planner as learning_planner
+from utils.learning_planner import LearningPlanner
+
+
+@pytest.fixture(scope="module")
+def planner():
+    return LearningPlanner()
+
+
+def best_subset_value(items, budget):
+    """Brute-force the highest total value that fits the budget"""
+    best = 0.0
+    for size in range(len(items) + 1):
+        for subset in combinations(items, size):
+            if sum(item["learning_hours"] for item in subset) <= budget:
+                best = max(best, sum(item["value"] for item in subset))
+    return best
+
+
+def everything(planner, profile):
+    return planner.optimize_learning_plan(profile, "AI", 10_000)["skills"]
+
+
+def test_dynamic_programming_matches_brute_force(planner):
+    profile = {"skills": {"programming": ["Python"]}}
+    items = everything(planner, profile)
+
+    for budget in (150, 400, 600, 900):
+        plan = planner.optimize_learning_plan(profile, "AI", budget)
+        assert plan["method"] == "dynamic_programming"
+        assert plan["total_hours"] <= budget
+        assert sum(item["value"] for item in plan["skills"]) == pytest.approx(best_subset_value(items, budget))
+        assert "Python" not in [item["skill"] for item in plan["skills"]]
+
+
+def test_greedy_fallback_stays_within_budget(planner, monkeypatch):
+    monkeypatch.setattr(learning_planner, "MAX_DP_CELLS", 1)
+    plan = planner.optimize_learning_plan({"skills": {}}, "AI", 600)
+
+    assert plan["method"] == "greedy"
+    assert 0 < plan["total_hours"] <= 600
+    assert plan["projected_score"] > plan["current_score"]
+
+
+def test_importance_only_breaks_ties_between_score_gains(planner):
+    items = {item["skill"]: item for item in everything(planner, {"skills": {}})}
+
+    # Untracked by the readiness model, so its value is the importance credit alone
+    assert items["Data Science"]["score_gain"] == 0
+    assert items["Data Science"]["value"] == learning_planner.IMPORTANCE_WEIGHT
+    # An Important skill the model tracks is still worth more than an untracked Essential one
+    assert items["TensorFlow"]["value"] > items["Data Science"]["value"]
+    # Between equal gains the Essential skill carries more weight
+    assert items["Deep Learning"]["score_gain"] == items["NLP"]["score_gain"]
+    assert items["Deep Learning"]["value"] > items["NLP"]["value"]
+
+
+def test_importance_weight_zero_ranks_by_score_gain_alone(planner):
+    plan = planner.optimize_learning_plan({"skills": {}}, "AI", 10_000, importance_weight=0)
+    assert "Data Science" not in [item["skill"] for item in plan["skills"]]
+    assert all(item["value"] == item["score_gain"] for item in plan["skills"])
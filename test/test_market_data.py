@@ -0,0 +1,161 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler
+
+import utils.market_data as market_data
+from utils.market_data import BASELINE_JOB_DATA, MarketDataRefresher, fetch_market_data, merge_source_data
+
+SLOW_SECONDS = 3
+
+
+class SourceHandler(BaseHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+
+    def _json(self, status, body):
+        payload = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def do_GET(self):
+        if self.path == "/fast":
+            self._json(200, {"ai_ml_jobs": {"count": 20000, "growth_rate": 30.0, "avg_salary": 150000,
+                                            "top_skills": ["JAX"]}})
+        elif self.path == "/fast2":
+            self._json(200, {"ai_ml_jobs": {"count": 10000, "growth_rate": 10.0, "avg_salary": 130000}})
+        elif self.path == "/slow":
+            time.sleep(SLOW_SECONDS)
+            self._json(200, {"cloud_jobs": {"count": 1, "growth_rate": 1.0, "avg_salary": 1}})
+        elif self.path == "/error":
+            self._json(500, {"error": "down"})
+        else:
+            self._json(200, ["not", "an", "object"])
+
+
+def test_fan_out_is_bounded_by_the_slowest_timeout(serve):
+    base = serve(SourceHandler)
+    sources = [
+        {"name": "Fast", "url": f"{base}/fast", "timeout": 1.0},
+        {"name": "Slow", "url": f"{base}/slow", "timeout": 0.5},
+        {"name": "Broken", "url": f"{base}/error", "timeout": 1.0},
+        {"name": "Garbled", "url": f"{base}/list", "timeout": 1.0},
+        {"name": "Unset", "url": None, "timeout": 1.0},
+    ]
+
+    start = time.monotonic()
+    data = fetch_market_data(sources)
+    elapsed = time.monotonic() - start
+
+    # Sequential fetching would wait out the slow source; fan-out stops at its timeout
+    assert elapsed < SLOW_SECONDS - 1
+    assert data["source_status"] == {
+        "Fast": "ok", "Slow": "timeout", "Broken": "error", "Garbled": "error", "Unset": "not configured"
+    }
+
+
+def test_each_field_falls_back_to_baseline_on_its_own(serve):
+    base = serve(SourceHandler)
+    data = fetch_market_data([
+        {"name": "Fast", "url": f"{base}/fast", "timeout": 1.0},
+        {"name": "Slow", "url": f"{base}/slow", "timeout": 0.3},
+    ])
+
+    assert data["ai_ml_jobs"]["live"] is True
+    assert data["ai_ml_jobs"]["count"] == 20000
+    assert data["ai_ml_jobs"]["top_skills"] == ["JAX"]
+    assert data["ai_ml_jobs"]["source"] == "Fast"
+    # The slow source was the only one reporting cloud jobs
+    assert data["cloud_jobs"]["live"] is False
+    assert abs(data["cloud_jobs"]["count"] - BASELINE_JOB_DATA["cloud_jobs"]["count"]) <= \
+        BASELINE_JOB_DATA["cloud_jobs"]["count"] * 0.01
+
+
+def test_numeric_fields_average_over_reporting_sources(serve):
+    base = serve(SourceHandler)
+    data = fetch_market_data([
+        {"name": "A", "url": f"{base}/fast", "timeout": 1.0},
+        {"name": "B", "url": f"{base}/fast2", "timeout": 1.0},
+    ])
+
+    assert data["ai_ml_jobs"]["count"] == 15000
+    assert data["ai_ml_jobs"]["growth_rate"] == 20.0
+    assert data["ai_ml_jobs"]["avg_salary"] == 140000
+    assert data["ai_ml_jobs"]["source"] == "A, B"
+
+
+def test_merge_ignores_failed_sources():
+    merged = merge_source_data([("Down", "error", None), ("Late", "timeout", None)])
+    assert all(not field["live"] for field in merged.values())
+
+
+def test_refresher_swaps_in_each_fetched_snapshot(serve):
+    base = serve(SourceHandler)
+    refresher = MarketDataRefresher(sources=[{"name": "Fast", "url": f"{base}/fast", "timeout": 1.0}])
+    refresher.refresh()
+    assert refresher.snapshot["ai_ml_jobs"]["live"] is True
+
+    refresher.sources = [{"name": "Broken", "url": f"{base}/error", "timeout": 1.0}]
+    refresher.refresh()
+    assert refresher.snapshot["source_status"] == {"Broken": "error"}
+    assert refresher.snapshot["ai_ml_jobs"]["live"] is False
+
+
+def stub_fetch(monkeypatch, fail_after=None):
+    """Replace the network fetch with numbered snapshots, failing after fail_after calls"""
+    calls = []
+
+    def fetch(sources):
+        calls.append(len(calls) + 1)
+        if fail_after is not None and len(calls) > fail_after:
+            raise ConnectionError("sources down")
+        return {"last_updated": f"refresh {len(calls)}"}
+
+    monkeypatch.setattr(market_data, "fetch_market_data", fetch)
+    return calls
+
+
+def wait_for(condition, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return condition()
+
+
+def refresher_threads():
+    return [thread for thread in threading.enumerate() if thread.name == "market-data-refresher"]
+
+
+def test_refresher_thread_refreshes_until_stopped(monkeypatch):
+    calls = stub_fetch(monkeypatch)
+    refresher = MarketDataRefresher(interval_seconds=0.05, sources=[])
+
+    refresher.start()
+    refresher.start()
+    assert len(refresher_threads()) == 1
+    assert wait_for(lambda: len(calls) >= 3)
+
+    refresher.stop(timeout=5)
+    assert refresher_threads() == []
+    refreshes = len(calls)
+    assert refresher.snapshot == {"last_updated": f"refresh {refreshes}"}
+    time.sleep(0.2)
+    assert len(calls) == refreshes
+
+    # A stopped refresher can be started again
+    refresher.start()
+    assert wait_for(lambda: len(calls) > refreshes)
+    refresher.stop(timeout=5)
+    assert refresher_threads() == []
+
+
+def test_failed_refresh_keeps_the_last_snapshot(monkeypatch):
+    stub_fetch(monkeypatch, fail_after=1)
+    refresher = MarketDataRefresher(sources=[])
+
+    refresher.refresh()
+    refresher.refresh()
+    assert refresher.snapshot == {"last_updated": "refresh 1"}
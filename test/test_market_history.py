@@ -0,0 +1,71 @@
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from utils.market_history import MarketHistoryStore
+
+NOW = 1_760_000_400.0
+
+
+def snapshot(count=1200, version="2025-10-09 08:20:00"):
+    return {
+        "last_updated": version,
+        "ai_ml_jobs": {"count": count, "growth_rate": 28.5, "avg_salary": 145000, "live": True},
+        "biotech_jobs": {"count": 900, "growth_rate": 12.0, "avg_salary": 98000, "live": False}
+    }
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / "history.sqlite3")
+
+
+def rows(path, table):
+    with sqlite3.connect(path) as conn:
+        return conn.execute(f"SELECT * FROM {table}").fetchall()
+
+
+def test_only_live_fields_are_recorded_and_rolled_up(path):
+    store = MarketHistoryStore(path)
+    assert store.append(snapshot(), timestamp=NOW) == 1
+    assert store.append(snapshot(count=1300, version="2025-10-09 08:30:00"), timestamp=NOW + 600) == 1
+
+    history = store.query(start=NOW - 60, end=NOW + 660, resolution="raw")
+    assert history["field"].tolist() == ["ai_ml_jobs", "ai_ml_jobs"]
+    hourly = store.query(start=NOW, end=NOW + 660, resolution="hour")
+    assert hourly["count"].tolist() == [1250.0]
+
+
+def test_same_snapshot_from_several_processes_is_stored_once(path):
+    # Each server process has its own store and connection on the shared file
+    stores = [MarketHistoryStore(path) for _ in range(4)]
+    start = threading.Barrier(len(stores))
+
+    def append(index):
+        start.wait()
+        return stores[index].append(snapshot(), timestamp=NOW + index)
+
+    with ThreadPoolExecutor(max_workers=len(stores)) as pool:
+        assert sorted(pool.map(append, range(len(stores)))) == [0, 0, 0, 1]
+
+    assert len(rows(path, "market_raw")) == 1
+    assert [samples for _, _, samples, *_ in rows(path, "market_hourly")] == [1]
+    assert [samples for _, _, samples, *_ in rows(path, "market_daily")] == [1]
+
+
+def test_snapshot_recorded_on_either_side_of_an_hour_is_stored_once(path):
+    first, second = MarketHistoryStore(path), MarketHistoryStore(path)
+    assert first.append(snapshot(), timestamp=NOW - 1) == 1
+    assert second.append(snapshot(), timestamp=NOW + 1) == 0
+    assert len(rows(path, "market_hourly")) == 1
+
+
+def test_changed_figures_or_a_new_snapshot_are_recorded(path):
+    store = MarketHistoryStore(path)
+    store.append(snapshot(), timestamp=NOW)
+
+    assert store.append(snapshot(count=1250), timestamp=NOW + 5) == 1
+    assert store.append(snapshot(version="2025-10-09 08:30:00"), timestamp=NOW + 600) == 1
+    assert len(rows(path, "market_raw")) == 3
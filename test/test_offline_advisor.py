@@ -0,0 +1,61 @@
+import pandas as pd
+import pytest
+
+from utils.course_recommender import CourseRecommender
+from utils.course_store import CourseStore
+from utils.offline_advisor import OFFLINE_NOTICE, OfflineAdvisor, detect_current_role
+
+COURSES = pd.DataFrame([
+    ["Network Security Basics", "Udemy", "CYBERSECURITY", "Networking", 3, "Beginner", 0, 4.6,
+     "https://example.com/network"],
+    ["Linux for Defenders", "Coursera", "CYBERSECURITY", "Linux", 5, "Beginner", 39, 4.4, "https://example.com/linux"],
+], columns=["course_name", "platform", "industry", "skill_focus", "duration_weeks", "difficulty", "price_usd",
+            "rating", "url"])
+
+MARKET = {
+    "last_updated": "2025-10-06 08:00",
+    "cybersecurity_jobs": {"count": 3500, "growth_rate": 31.5, "avg_salary": 112000, "live": True,
+                           "top_skills": ["SIEM", "Cloud Security"], "locations": ["Austin"]}
+}
+
+
+@pytest.fixture(scope="module")
+def advisor():
+    return OfflineAdvisor()
+
+
+def headings(answer):
+    return [line for line in answer.splitlines() if line.startswith("### ")]
+
+
+def test_self_described_role_is_detected_but_target_roles_are_not():
+    assert detect_current_role("I'm an accountant looking at security") == "accountant"
+    assert detect_current_role("How much does a security analyst earn?") is None
+
+
+def test_headings_use_industry_display_names(advisor):
+    answer = advisor.answer("How do I get into solar?", "RENEWABLE")
+    assert "### Getting into Renewable Energy" in headings(answer)
+    assert "Learn Renewable Energy Fundamentals" in answer
+    assert "RENEWABLE" not in answer
+
+
+def test_answer_draws_on_courses_and_market_data(advisor, tmp_path):
+    skills = tmp_path / "industry_skills.csv"
+    skills.write_text("industry,skill_name\nCYBERSECURITY,Networking\nCYBERSECURITY,Linux\n")
+    recommender = CourseRecommender(CourseStore(courses=COURSES), skills_path=str(skills))
+
+    answer = advisor.answer("I am an accountant, how do I move into cybersecurity?", "CYBERSECURITY",
+                            market=MARKET, recommender=recommender)
+
+    assert answer.startswith(OFFLINE_NOTICE)
+    assert headings(answer)[:2] == ["### Moving from Accountant into Cybersecurity", "### Skills to build"]
+    assert "[Network Security Basics](https://example.com/network)" in answer
+    assert "3,500 open roles, growing 31.5% a year (live, updated 2025-10-06 08:00)" in answer
+
+
+def test_salary_questions_lead_with_the_market(advisor):
+    answer = advisor.answer("What do cybersecurity jobs pay?", "CYBERSECURITY", context="salary_negotiation",
+                            market=MARKET)
+    assert headings(answer)[0] == "### Cybersecurity market"
+    assert headings(answer)[-1] == "### Next steps"
@@ -0,0 +1,101 @@
+import json
+
+import pytest
+
+import cli
+from utils.readiness_cache import ReadinessCache, canonical_profile, profile_hash
+from utils.readiness_score import ReadinessCalculator
+
+PROFILE = {
+    "skills": {"technical": ["Python", " Machine Learning ", "statistics"], "soft": ["Problem Solving"]},
+    "experience_years": 4,
+    "education_level": "Masters",
+    "current_role": "Data Analyst",
+    "projects": ["churn model", "dashboard"],
+    "certifications": ["AWS Certified Machine Learning - Specialty"]
+}
+
+
+@pytest.fixture(scope="module")
+def calculator():
+    return ReadinessCalculator()
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ReadinessCache(str(tmp_path / "readiness.sqlite3"), model_version="test-1")
+
+
+def test_equivalent_profiles_share_a_key():
+    reordered = {
+        "skills": {"all": ["problem solving", "STATISTICS", "machine learning", "python"]},
+        "experience_years": 4.0,
+        "education_level": " masters",
+        "current_role": "data analyst",
+        "projects": ["a", "b"],
+        "certifications": ["aws certified machine learning - specialty"]
+    }
+    assert canonical_profile(reordered, "AI") == canonical_profile(PROFILE, "AI")
+    assert profile_hash(reordered, "AI") == profile_hash(PROFILE, "AI")
+    assert profile_hash(PROFILE, "AI") != profile_hash(PROFILE, "AI", model_version="other")
+
+
+def test_cached_assessment_matches_a_fresh_score_of_the_canonical_profile(cache, calculator):
+    first = cache.get_or_compute(calculator, PROFILE, "AI")
+    # Padded skill names count as the skills they name
+    assert first["component_scores"]["skill_match"] > 0
+    assert "Machine Learning" not in first["gaps"]
+
+    clean = dict(PROFILE, skills={"all": ["python", "machine learning", "statistics", "problem solving"]})
+    assert cache.get_or_compute(calculator, clean, "AI") == first
+    assert calculator.calculate_readiness_score(clean, "AI")["overall_score"] == first["overall_score"]
+    assert len(cache) == 1
+
+
+def test_hits_skip_the_calculator(cache, calculator):
+    cache.get_or_compute(calculator, PROFILE, "AI")
+
+    class Failing:
+        def calculate_readiness_score(self, *args):
+            raise AssertionError("scored a cached profile")
+
+    assert cache.get_or_compute(Failing(), PROFILE, "AI")["overall_score"] > 0
+
+
+def test_other_model_versions_are_kept_but_never_served(tmp_path, calculator):
+    path = str(tmp_path / "readiness.sqlite3")
+    old = ReadinessCache(path, model_version="old")
+    old.set(PROFILE, "AI", {"overall_score": 1})
+
+    new = ReadinessCache(path, model_version="new")
+    assert new.get(PROFILE, "AI") is None
+    new.get_or_compute(calculator, PROFILE, "AI")
+
+    # A process still on the old model keeps its entries
+    assert len(new) == 2
+    assert old.get(PROFILE, "AI") == {"overall_score": 1}
+
+
+def test_prune_evicts_least_recently_used(tmp_path):
+    cache = ReadinessCache(str(tmp_path / "readiness.sqlite3"), max_entries=2)
+    for industry in ("AI", "BIOTECH", "SPACETECH"):
+        cache.set(PROFILE, industry, {"industry": industry})
+    cache.prune()
+    assert len(cache) == 2
+    assert cache.get(PROFILE, "AI") is None
+
+
+def test_cli_scores_through_the_cache(tmp_path, monkeypatch):
+    cache_path = str(tmp_path / "readiness.sqlite3")
+    monkeypatch.setattr(cli, "ReadinessCache", lambda: ReadinessCache(cache_path))
+    profiles = tmp_path / "profiles.jsonl"
+    profiles.write_text(json.dumps(PROFILE) + "\n" + json.dumps(dict(PROFILE, id="copy")) + "\n")
+    output = tmp_path / "scores.jsonl"
+
+    assert cli.main(["score", str(profiles), "--industry", "AI,BIOTECH", "--cache", "--output", str(output)]) == 0
+
+    records = [json.loads(line) for line in output.read_text().splitlines()]
+    assert len(records) == 4
+    assert records[0]["overall_score"] == records[2]["overall_score"]
+    # Two identical profiles, two industries: two distinct assessments
+    assert len(ReadinessCache(cache_path)) == 2
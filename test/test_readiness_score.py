@@ -0,0 +1,67 @@
+import pytest
+
+from utils.readiness_score import ReadinessCalculator
+
+PROFILE = {
+    "skills": {"technical": ["Python", "Statistics"]},
+    "experience_years": 3,
+    "education_level": "bachelors",
+    "current_role": "data analyst",
+    "projects": ["a"],
+    "certifications": []
+}
+
+
+@pytest.fixture(scope="module")
+def calculator():
+    return ReadinessCalculator()
+
+
+def with_skill(profile, skill):
+    return {**profile, "skills": {**profile["skills"], "new": [skill]}}
+
+
+def test_marginal_gains_match_a_full_rescore(calculator):
+    base = calculator.calculate_readiness_score(PROFILE, "AI")["overall_score"]
+    gains = calculator.calculate_marginal_gains(PROFILE, "AI")
+
+    assert gains and all(gain["type"] == "skill" for gain in gains)
+    for gain in gains:
+        rescored = calculator.calculate_readiness_score(with_skill(PROFILE, gain["candidate"]), "AI")["overall_score"]
+        assert gain["new_score"] == pytest.approx(rescored, abs=0.11)
+        assert gain["score_gain"] == pytest.approx(rescored - base, abs=0.21)
+
+
+def test_gains_are_sorted_and_skip_known_skills(calculator):
+    gains = calculator.calculate_marginal_gains(PROFILE, "AI")
+    assert [gain["score_gain"] for gain in gains] == sorted((gain["score_gain"] for gain in gains), reverse=True)
+    assert not {"python", "statistics"} & {gain["candidate"].lower() for gain in gains}
+    # An essential skill moves the score more than a preferred one
+    by_name = {gain["candidate"]: gain["score_gain"] for gain in gains}
+    assert by_name["Machine Learning"] > by_name["TensorFlow"]
+
+
+def test_courses_and_certifications_are_ranked_together(calculator):
+    gains = calculator.calculate_marginal_gains(
+        PROFILE, "AI", candidate_skills=[],
+        candidate_courses=[{"course_name": "ML Course", "skill_focus": "Machine Learning"},
+                           {"course_name": "Knitting", "skill_focus": "Knitting"}],
+        candidate_certifications=["AWS Certified Machine Learning - Specialty"],
+        top_k=2
+    )
+    assert [(gain["candidate"], gain["type"]) for gain in gains] == [
+        ("ML Course", "course"), ("AWS Certified Machine Learning - Specialty", "certification")
+    ]
+
+
+def test_readiness_levels_follow_the_score(calculator):
+    empty = calculator.calculate_readiness_score({"skills": {}}, "AI")
+    strong = calculator.calculate_readiness_score({
+        "skills": {"all": ["Python", "Machine Learning", "Mathematics", "Statistics", "TensorFlow", "PyTorch",
+                           "Deep Learning", "Programming", "Data Analysis", "Problem Solving"]},
+        "experience_years": 10, "current_role": "software developer", "education_level": "PhD",
+        "projects": ["a"] * 5
+    }, "AI")
+    assert empty["overall_score"] < strong["overall_score"]
+    assert strong["readiness_level"] in ("Nearly Ready", "Ready to Transition")
+    assert empty["gaps"] and len(strong["gaps"]) < len(empty["gaps"])
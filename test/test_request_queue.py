@@ -0,0 +1,151 @@
+import threading
+import time
+from concurrent.futures import CancelledError
+from http.server import BaseHTTPRequestHandler
+
+import pytest
+import requests
+
+from utils.request_queue import AdvisorRequestQueue, QueueTimeout, TokenBucket
+
+
+class CountingHandler(BaseHTTPRequestHandler):
+    """Stub provider recording when each request arrives"""
+    arrivals = []
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        type(self).arrivals.append((time.monotonic(), self.path))
+        self.send_response(200)
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"ok")
+
+
+@pytest.fixture
+def provider(serve):
+    CountingHandler.arrivals = []
+    base = serve(CountingHandler)
+    return lambda path: lambda: requests.get(f"{base}{path}", timeout=5).text
+
+
+def rate_limited_queue(rate=10.0, burst=1, max_concurrent=4):
+    return AdvisorRequestQueue(rate_limits={"Stub": {"rate_per_second": rate, "burst": burst}},
+                               max_concurrent=max_concurrent)
+
+
+def test_token_bucket_refills_at_its_rate():
+    bucket = TokenBucket(rate_per_second=10, burst=2)
+    bucket.take()
+    bucket.take()
+    assert 0.05 < bucket.delay() <= 0.1
+
+
+def test_requests_reach_the_provider_at_the_configured_rate(provider):
+    queue = rate_limited_queue(rate=10.0, burst=1)
+    tickets = [queue.submit("Stub", "s1", provider(f"/{i}")) for i in range(5)]
+    assert [ticket.result(5) for ticket in tickets] == ["ok"] * 5
+
+    times = [at for at, _ in CountingHandler.arrivals]
+    gaps = [later - earlier for earlier, later in zip(times, times[1:])]
+    assert min(gaps) > 0.08
+    assert times[-1] - times[0] >= 0.35
+
+
+def test_cancelled_tickets_do_not_use_a_token(provider):
+    queue = rate_limited_queue(rate=5.0, burst=1)
+    first = queue.submit("Stub", "s1", provider("/first"))
+    dropped = [queue.submit("Stub", "s1", provider(f"/dropped{i}")) for i in range(3)]
+    last = queue.submit("Stub", "s1", provider("/last"))
+
+    assert all(ticket.cancel() for ticket in dropped)
+    assert first.result(5) == last.result(5) == "ok"
+    with pytest.raises(CancelledError):
+        dropped[0].result(5)
+
+    (first_at, _), (last_at, last_path) = CountingHandler.arrivals
+    assert last_path == "/last"
+    # One token interval, not four
+    assert last_at - first_at < 0.35
+
+
+def test_started_calls_cannot_be_cancelled():
+    queue = rate_limited_queue()
+    release = threading.Event()
+    ticket = queue.submit("Stub", "s1", lambda: release.wait(5))
+    while ticket.position() is not None:
+        time.sleep(0.01)
+
+    assert ticket.cancel() is False
+    release.set()
+    assert ticket.result(5) is True
+
+
+def test_queue_timeout_withdraws_the_call():
+    queue = rate_limited_queue(rate=0.5, burst=1)
+    queue.call("Stub", "s1", lambda: None)
+    ran = []
+
+    with pytest.raises(QueueTimeout):
+        queue.call("Stub", "s1", lambda: ran.append(True), queue_timeout=0.1)
+    assert queue.stats()["queued"]["Stub"] == 0
+    assert ran == []
+
+
+def test_on_submit_hands_out_the_ticket():
+    queue = rate_limited_queue(rate=0.5, burst=1)
+    queue.call("Stub", "s1", lambda: None)
+    tickets = []
+    threading.Timer(0.1, lambda: tickets[0].cancel()).start()
+
+    with pytest.raises(CancelledError):
+        queue.call("Stub", "s1", lambda: None, queue_timeout=5, on_submit=tickets.append)
+
+
+def test_sessions_take_turns():
+    queue = AdvisorRequestQueue(rate_limits={}, max_concurrent=1)
+    order = []
+    release = threading.Event()
+    blocker = queue.submit("Stub", "busy", release.wait)
+    while blocker.position() is not None:
+        time.sleep(0.01)
+
+    tickets = [queue.submit("Stub", session, lambda session=session: order.append(session))
+               for session in ("a", "a", "a", "b")]
+    assert tickets[3].position() == 1
+    release.set()
+    for ticket in tickets:
+        ticket.result(5)
+    assert order == ["a", "b", "a", "a"]
+
+
+def test_streamed_calls_hold_their_slot_until_the_stream_ends():
+    queue = AdvisorRequestQueue(rate_limits={}, max_concurrent=1)
+    stream = queue.call("Stub", "a", lambda: iter(["Hello", " world"]))
+    waiting = queue.submit("Stub", "b", lambda: "next")
+
+    assert next(stream) == "Hello"
+    time.sleep(0.1)
+    assert waiting.position() == 0 and queue.stats()["running"] == 1
+    assert list(stream) == [" world"]
+    assert waiting.result(5) == "next"
+
+
+def test_closing_a_stream_early_frees_its_slot():
+    queue = AdvisorRequestQueue(rate_limits={}, max_concurrent=1)
+    closed = []
+
+    def pieces():
+        try:
+            yield "Hello"
+            yield " world"
+        finally:
+            closed.append(True)
+
+    stream = queue.call("Stub", "a", pieces)
+    next(stream)
+    stream.close()
+    assert closed == [True]
+    assert queue.call("Stub", "b", lambda: "next", queue_timeout=5) == "next"
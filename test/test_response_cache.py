@@ -0,0 +1,71 @@
+import time
+
+import pytest
+
+from utils.response_cache import AdvisorResponseCache, normalize_prompt, similarity_terms
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return AdvisorResponseCache(str(tmp_path / "responses.sqlite3"), ttl_seconds=3600, max_entries=3,
+                                similarity_threshold=0.9)
+
+
+def test_normalize_prompt_ignores_case_punctuation_and_spacing():
+    assert normalize_prompt("  What  skills, do I need?? ") == normalize_prompt("what skills do i need")
+
+
+def test_direction_words_tag_the_terms_after_them():
+    terms = similarity_terms("Moving from software engineering into cybersecurity")
+    assert terms["from:software"] == terms["from:engineering"] == terms["to:cybersecurity"] == 1
+    assert "from" not in terms and "into" not in terms
+
+
+def test_exact_and_similar_hits(cache):
+    cache.set("Which skills do I need for AI jobs?", "general", "Python and statistics", "v1")
+
+    exact = cache.get("which skills do i need for ai jobs", "general", "v1")
+    assert exact["match"] == "exact" and exact["answer"] == "Python and statistics"
+
+    similar = cache.get("What skills do I need for AI jobs?", "general", "v1")
+    assert similar["match"] == "similar" and similar["similarity"] >= 0.9
+
+
+def test_reverse_transition_is_not_served_the_same_answer(cache):
+    cache.set("How do I transition from software engineering to cybersecurity?", "general", "forward", "v1")
+
+    assert cache.get("How do I transition from cybersecurity to software engineering?", "general", "v1") is None
+    assert cache.get("How can I transition from software engineering to cybersecurity?", "general", "v1")["answer"] == "forward"
+
+
+def test_answers_are_scoped_to_context_and_version(cache):
+    cache.set("What is a good AI salary?", "salary_negotiation", "answer", "v1")
+
+    assert cache.get("What is a good AI salary?", "general", "v1") is None
+    assert cache.get("What is a good AI salary?", "salary_negotiation", "v2") is None
+    assert cache.get("What is a good AI salary?", "salary_negotiation", "v1")["answer"] == "answer"
+
+
+def test_least_recently_used_entry_is_evicted(cache):
+    prompts = ["Robotics salaries", "Python courses", "Cloud certifications", "Biotech labs"]
+    for prompt in prompts[:3]:
+        cache.set(prompt, "general", prompt.upper())
+    cache.get("Robotics salaries")
+    cache.set(prompts[3], "general", prompts[3].upper())
+
+    assert len(cache) == 3
+    assert cache.get("Python courses") is None
+    assert cache.get("Robotics salaries")["answer"] == "ROBOTICS SALARIES"
+
+
+def test_entries_persist_and_expire(tmp_path):
+    path = str(tmp_path / "responses.sqlite3")
+    AdvisorResponseCache(path).set("Is cloud computing growing?", "general", "yes", "v1")
+
+    reopened = AdvisorResponseCache(path)
+    assert reopened.get("Is cloud computing growing?", "general", "v1")["answer"] == "yes"
+
+    expired = AdvisorResponseCache(path, ttl_seconds=3600)
+    expired.entries[next(iter(expired.entries))]["created_at"] = time.time() - 7200
+    assert expired.get("Is cloud computing growing?", "general", "v1") is None
+    assert len(AdvisorResponseCache(path)) == 0
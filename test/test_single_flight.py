@@ -0,0 +1,81 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from utils.single_flight import SingleFlight
+
+
+def run_together(callers, fn):
+    """Start callers at the same moment and collect what each got back (or raised)"""
+    start = threading.Barrier(callers)
+
+    def call(_):
+        start.wait()
+        try:
+            return fn()
+        except Exception as e:
+            return e
+
+    with ThreadPoolExecutor(max_workers=callers) as pool:
+        return list(pool.map(call, range(callers)))
+
+
+def test_overlapping_calls_share_one_run():
+    group = SingleFlight()
+    runs = []
+    release = threading.Event()
+
+    def slow():
+        runs.append(1)
+        release.wait(5)
+        return "answer"
+
+    def call():
+        threading.Timer(0.2, release.set).start()
+        return group.do(("advisor", "question"), slow)
+
+    assert run_together(5, call) == ["answer"] * 5
+    assert len(runs) == 1
+    assert group.stats() == {"advisor": {"calls": 5, "coalesced": 4, "in_flight": 0}}
+
+
+def test_failures_reach_every_caller_and_end_the_flight():
+    group = SingleFlight()
+    release = threading.Event()
+
+    def failing():
+        release.wait(5)
+        raise ValueError("upstream down")
+
+    def call():
+        threading.Timer(0.2, release.set).start()
+        return group.do("key", failing)
+
+    results = run_together(3, call)
+    assert all(isinstance(result, ValueError) for result in results)
+    assert group.do("key", lambda: "recovered") == "recovered"
+
+
+def test_later_calls_start_a_new_flight():
+    group = SingleFlight()
+    assert group.do("key", lambda: 1) == 1
+    assert group.do("key", lambda: 2) == 2
+    assert group.stats()["key"]["coalesced"] == 0
+
+
+def test_claim_lets_a_streaming_leader_settle_the_flight():
+    group = SingleFlight()
+    flight, leader = group.claim(("stream", "q"))
+    follower, follower_leads = group.claim(("stream", "q"))
+
+    assert leader and not follower_leads and follower is flight
+    assert group.stats()["stream"]["in_flight"] == 1
+    flight.resolve("full text")
+    assert follower.result(1) == "full text"
+
+    retry, leads_again = group.claim(("stream", "q"))
+    assert leads_again
+    retry.fail(RuntimeError("stopped"))
+    with pytest.raises(RuntimeError):
+        retry.result(1)
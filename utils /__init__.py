@@ -1,14 +0,0 @@
-# utils/__init__.py
-"""
-Career Shift Analyzer - Utilities Package
-"""
-
-from .skill_extractor import SkillExtractor
-from .career_mapper import CareerMapper
-from .readiness_score import ReadinessCalculator
-
-__all__ = [
-    'SkillExtractor',
-    'CareerMapper', 
-    'ReadinessCalculator'
-]
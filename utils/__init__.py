@@ -0,0 +1,32 @@
+# utils/__init__.py
+"""
+Career Shift Analyzer - Utilities Package
+"""
+
+from .skill_extractor import SkillExtractor
+from .career_mapper import CareerMapper
+from .readiness_score import ReadinessCalculator
+from .learning_planner import LearningPlanner
+from .readiness_cache import ReadinessCache
+from .certification_index import CertificationIndex
+from .market_data import MarketDataRefresher
+from .market_history import MarketHistoryStore
+from .course_store import CourseStore
+from .course_search import CourseSearchIndex
+from .course_recommender import CourseRecommender
+from .course_cover import CourseCoverPlanner
+
+__all__ = [
+    'SkillExtractor',
+    'CareerMapper', 
+    'ReadinessCalculator',
+    'LearningPlanner',
+    'ReadinessCache',
+    'CertificationIndex',
+    'MarketDataRefresher',
+    'MarketHistoryStore',
+    'CourseStore',
+    'CourseSearchIndex',
+    'CourseRecommender',
+    'CourseCoverPlanner'
+]
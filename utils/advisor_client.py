@@ -0,0 +1,151 @@
+"""
+Advisor Client Module
+Streams chat completions from OpenAI-compatible providers as server-sent events
+"""
+
+import codecs
+import json
+import re
+import socket
+import threading
+import requests
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Tuple, Union
+
+LINE_BREAK = re.compile(r"\r\n|\r|\n")
+
+Timeout = Union[float, Tuple[float, float]]
+
+class StreamError(Exception):
+    """The provider reported an error inside an event stream"""
+
+def iter_lines(chunks: Iterable[bytes]) -> Iterator[str]:
+    """
+    Split a byte stream into text lines as the bytes arrive
+
+    Handles \\n, \\r\\n and \\r line endings, and UTF-8 characters split
+    across chunks. A final line without a terminator is still yielded.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    buffer = ""
+    for chunk in chunks:
+        text = buffer + decoder.decode(chunk)
+        # A trailing \r may be the first half of \r\n, so leave it for the next chunk
+        held = "\r" if text.endswith("\r") else ""
+        lines = LINE_BREAK.split(text[:-1] if held else text)
+        buffer = lines.pop() + held
+        yield from lines
+    buffer += decoder.decode(b"", final=True)
+    if buffer:
+        yield buffer.rstrip("\r")
+
+def iter_sse_events(lines: Iterable[str]) -> Iterator[Dict[str, str]]:
+    """
+    Parse server-sent event lines into events
+
+    Follows the event-stream format: "field: value" lines accumulate until a
+    blank line dispatches the event, multiple data lines join with newlines,
+    and lines starting with ":" are comments (keep-alives).
+
+    Yields:
+        Dictionaries with "event" (default "message"), "data" and, if sent, "id"
+    """
+    event = {"event": "message", "data": []}
+    for line in lines:
+        if not line:
+            if event["data"]:
+                yield {**event, "data": "\n".join(event["data"])}
+            event = {"event": "message", "data": []}
+            continue
+        if line.startswith(":"):
+            continue
+        field, _, value = line.partition(":")
+        if value.startswith(" "):
+            value = value[1:]
+        if field == "data":
+            event["data"].append(value)
+        elif field in ("event", "id"):
+            event[field] = value
+    if event["data"]:
+        yield {**event, "data": "\n".join(event["data"])}
+
+def iter_completion_deltas(events: Iterable[Dict[str, str]]) -> Iterator[str]:
+    """
+    Text deltas from chat-completion chunk events, up to the [DONE] sentinel
+
+    Raises:
+        StreamError: If the provider sends an error event mid-stream
+    """
+    for event in events:
+        data = event["data"]
+        if data.strip() == "[DONE]":
+            return
+        try:
+            chunk = json.loads(data)
+        except ValueError:
+            continue
+        if "error" in chunk:
+            error = chunk["error"]
+            raise StreamError(error.get("message", str(error)) if isinstance(error, dict) else str(error))
+        for choice in chunk.get("choices") or []:
+            content = (choice.get("delta") or {}).get("content")
+            if content:
+                yield content
+
+def close_response(response: requests.Response):
+    """
+    Close a response from another thread, interrupting a read blocked on it
+
+    Closing alone waits for a blocked read to return, so the socket is shut
+    down first; the connection is dropped rather than returned to the pool.
+    """
+    connection = getattr(response.raw, "connection", None)
+    sock = getattr(connection, "sock", None)
+    if sock is not None:
+        try:
+            sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            # Already closed by the other side
+            pass
+    response.close()
+
+def stream_chat_completion(url: str, headers: Dict[str, str], payload: Dict,
+                           timeout: Timeout = (5.0, 30.0),
+                           session=None,
+                           cancel: Optional[threading.Event] = None,
+                           on_response: Optional[Callable[[requests.Response], Any]] = None) -> Iterator[str]:
+    """
+    POST a chat completion with "stream": true and yield text as it arrives
+
+    Args:
+        url: Chat completions endpoint
+        headers: Request headers (auth, referer, ...)
+        payload: Request body; "stream" is forced on
+        timeout: Seconds, or (connect, read) where read bounds the gap between chunks
+        session: Session or PooledHttpClient to send through (default: a one-off request)
+        cancel: Once set, the stream ends at the next chunk instead of reading on
+        on_response: Called with the open response before it is read, e.g. so
+            another thread can interrupt a blocked read with close_response()
+
+    Yields:
+        Text deltas in order; joining them gives the full answer
+
+    Raises:
+        requests.RequestException: If the request fails or returns an error status
+        StreamError: If the provider reports an error inside the stream
+    """
+    if cancel is not None and cancel.is_set():
+        return
+    sender = session or requests
+    response = sender.post(url, headers={**headers, "Accept": "text/event-stream"},
+                           json={**payload, "stream": True}, timeout=timeout, stream=True)
+    with response:
+        if on_response is not None:
+            on_response(response)
+        response.raise_for_status()
+        # chunk_size=None hands over each network read as it lands instead of
+        # waiting to fill a fixed-size buffer
+        chunks = response.iter_content(chunk_size=None)
+        for delta in iter_completion_deltas(iter_sse_events(iter_lines(chunks))):
+            if cancel is not None and cancel.is_set():
+                return
+            yield delta
@@ -0,0 +1,218 @@
+"""
+Advisor Dispatch Module
+Hedged requests across AI providers: the first good answer wins
+"""
+
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import ADVISOR_HEDGING
+from .circuit_breaker import HALF_OPEN, BreakerRegistry, CircuitOpenError
+from .request_queue import QueueTimeout
+
+Attempt = Tuple[str, Callable[["AttemptHandle"], Any]]
+
+class AllProvidersFailed(Exception):
+    """Every provider attempt failed; `errors` maps provider name to its exception"""
+
+    def __init__(self, errors: Dict[str, BaseException]):
+        super().__init__("; ".join(f"{name}: {error!r}" for name, error in errors.items()) or "no providers")
+        self.errors = errors
+
+class HedgeResult:
+    """Winning answer and how it was obtained"""
+
+    def __init__(self, provider: str, value: Any, elapsed: float, started: List[str]):
+        self.provider = provider
+        self.value = value
+        self.elapsed = elapsed
+        # Providers that were sent a request, in start order
+        self.started = started
+
+    @property
+    def hedged(self) -> bool:
+        return len(self.started) > 1
+
+class AttemptHandle:
+    """
+    Passed to each attempt's callable; cancelled when the attempt loses the race
+
+    Attempts register what stops their work with on_cancel (closing a response,
+    withdrawing a queued call), and long-running loops can check `cancelled`.
+    Attempts that wait before calling the provider (e.g. in a request queue)
+    call begin() when the call goes out, so the breaker judges only the call.
+    """
+
+    def __init__(self, provider: str):
+        self.provider = provider
+        self.cancelled = threading.Event()
+        self.started_at: Optional[float] = None
+        self._callbacks: List[Callable[[], Any]] = []
+        self._lock = threading.Lock()
+
+    def begin(self):
+        """Mark the provider call as going out now; its latency is measured from here"""
+        self.started_at = time.monotonic()
+
+    def on_cancel(self, callback: Callable[[], Any]):
+        """Run callback when the attempt is cancelled, or straight away if it already was"""
+        with self._lock:
+            if not self.cancelled.is_set():
+                self._callbacks.append(callback)
+                return
+        callback()
+
+    def cancel(self):
+        """Stop the attempt's work; the first call runs every registered callback"""
+        with self._lock:
+            if self.cancelled.is_set():
+                return
+            self.cancelled.set()
+            callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception:
+                # Stopping is best effort: the attempt's result is discarded anyway
+                pass
+
+def _discard(value: Any):
+    """Release a losing answer that finished after the race was decided (e.g. an open stream)"""
+    close = getattr(value, "close", None)
+    if callable(close):
+        close()
+
+class HedgedDispatcher:
+    def __init__(self, hedge_delay: float = ADVISOR_HEDGING["hedge_delay_seconds"],
+                 max_workers: int = ADVISOR_HEDGING["max_workers"],
+                 breakers: Optional[BreakerRegistry] = None):
+        """
+        Create a dispatcher shared by every session in the process
+
+        Args:
+            hedge_delay: Seconds to wait on a provider before also asking the next one
+            max_workers: Threads for in-flight provider calls (losers included)
+            breakers: Per-provider circuit breakers; open ones are skipped and
+                half-open ones are hedged at once rather than after the delay
+        """
+        self.hedge_delay = hedge_delay
+        self.breakers = breakers or BreakerRegistry()
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="advisor-hedge")
+
+    def is_degraded(self, provider: str) -> bool:
+        return self.breakers.get(provider).state == HALF_OPEN
+
+    def _call(self, fn: Callable[[AttemptHandle], Any], handle: AttemptHandle) -> Any:
+        breaker = self.breakers.get(handle.provider)
+        start = time.monotonic()
+        try:
+            value = fn(handle)
+        except QueueTimeout:
+            # Never reached the provider, so it says nothing about its health
+            breaker.release()
+            raise
+        except BaseException:
+            if handle.cancelled.is_set():
+                # Failed because we stopped it, which says nothing about the provider
+                breaker.release()
+            else:
+                breaker.record(False, time.monotonic() - (handle.started_at or start))
+            raise
+        breaker.record(True, time.monotonic() - (handle.started_at or start))
+        return value
+
+    def _abandon(self, future: Future, handle: AttemptHandle):
+        """Stop an attempt: cancel it if it hasn't started, else stop its work and discard its result"""
+        if future.cancel():
+            self.breakers.get(handle.provider).release()
+            return
+        handle.cancel()
+        future.add_done_callback(lambda f: f.exception() is None and _discard(f.result()))
+
+    def run(self, attempts: Sequence[Attempt], timeout: Optional[float] = None,
+            on_wait: Optional[Callable[[], None]] = None, poll_seconds: float = 0.25) -> HedgeResult:
+        """
+        Call providers in priority order, hedging slow or failing ones with the next
+
+        The next provider starts when every running attempt has failed, when the
+        hedge delay passes without an answer, or straight away while every running
+        provider is degraded. Providers whose breaker is open are skipped without
+        a call. An attempt succeeds by returning; raising fails it.
+
+        Args:
+            attempts: (provider name, callable taking an AttemptHandle) in priority order
+            timeout: Overall seconds to wait for any answer (default: no limit)
+            on_wait: Called from the calling thread every poll_seconds while
+                waiting, e.g. to show queue progress
+
+        Returns:
+            The first successful attempt's value. Losers still running are
+            cancelled through their AttemptHandle; late results are closed if closable.
+
+        Raises:
+            AllProvidersFailed: If every attempt failed or the timeout passed
+        """
+        start = time.monotonic()
+        deadline = start + timeout if timeout is not None else None
+        pending = list(attempts)
+        running: Dict[Future, AttemptHandle] = {}
+        started: List[str] = []
+        errors: Dict[str, BaseException] = {}
+        next_hedge = start
+
+        def launch():
+            provider, fn = pending.pop(0)
+            if not self.breakers.get(provider).allow():
+                errors[provider] = CircuitOpenError(f"{provider} is temporarily unavailable")
+                return
+            handle = AttemptHandle(provider)
+            running[self.executor.submit(self._call, fn, handle)] = handle
+            started.append(provider)
+
+        while pending or running:
+            now = time.monotonic()
+            if pending and (not running or now >= next_hedge or
+                            all(self.is_degraded(handle.provider) for handle in running.values())):
+                launch()
+                next_hedge = time.monotonic() + self.hedge_delay
+                continue
+
+            wait_until = next_hedge if pending else deadline
+            if deadline is not None and (wait_until is None or deadline < wait_until):
+                wait_until = deadline
+            if wait_until is not None and wait_until <= now:
+                if deadline is not None and now >= deadline:
+                    break
+                continue
+
+            wait_seconds = None if wait_until is None else wait_until - now
+            if on_wait is not None:
+                wait_seconds = poll_seconds if wait_seconds is None else min(wait_seconds, poll_seconds)
+            done, _ = wait(running, timeout=wait_seconds, return_when=FIRST_COMPLETED)
+            if on_wait is not None and not done:
+                on_wait()
+            for future in done:
+                provider = running.pop(future).provider
+                error = future.exception()
+                if error is not None:
+                    errors[provider] = error
+                    continue
+
+                for loser, handle in running.items():
+                    self._abandon(loser, handle)
+                return HedgeResult(provider, future.result(), time.monotonic() - start, started)
+
+        for loser, handle in running.items():
+            self._abandon(loser, handle)
+            errors.setdefault(handle.provider, TimeoutError(f"no answer within {timeout}s"))
+        raise AllProvidersFailed(errors)
+
+    def shutdown(self):
+        self.executor.shutdown(wait=False, cancel_futures=True)
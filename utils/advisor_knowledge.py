@@ -0,0 +1,229 @@
+"""
+Advisor Knowledge Module
+Retrieves the platform data most relevant to a question, to ground advisor prompts
+"""
+
+import logging
+import math
+import threading
+import pandas as pd
+from collections import Counter, OrderedDict
+from typing import Dict, List, Optional
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import ADVISOR_RETRIEVAL, COURSE_CATALOG_PATH, INDUSTRY_SKILLS_PATH, STEM_FIELDS
+from .response_cache import normalize_prompt, similarity_terms
+
+logger = logging.getLogger(__name__)
+
+GROUNDING_HEADER = "Relevant data from this platform (prefer it over general knowledge):"
+
+def _course_document(course: Dict) -> Dict:
+    price = "free" if course["price_usd"] == 0 else f"${course['price_usd']:,.0f}"
+    return {
+        "kind": "course",
+        "search": f"{course['course_name']} {course['skill_focus']} {course['skill_focus']} {course['industry']} {course['platform']}",
+        "text": f"Course: {course['course_name']} ({course['platform']}; {course['industry']}, {course['skill_focus']}; "
+                f"{course['difficulty']}, {course['duration_weeks']} weeks, {price}, rated {course['rating']})"
+    }
+
+def _skill_document(skill: Dict) -> Dict:
+    return {
+        "kind": "skill",
+        "search": f"{skill['industry']} {skill['skill_name']} {skill['skill_name']} {skill['skill_category']}",
+        "text": f"Skill: {skill['skill_name']} for {skill['industry']} ({skill['skill_category']}, {skill['importance']}, "
+                f"{skill['difficulty']} difficulty, about {skill['learning_hours']} learning hours)"
+    }
+
+def _field_document(name: str, field: Dict) -> Dict:
+    return {
+        "kind": "field",
+        "search": f"{name} {name} {field['description']} {' '.join(field['courses'])}",
+        "text": f"Field: {name}, {field['description'].lower()}; average salary ${field['avg_salary']:,}, "
+                f"growth {field['growth']}; core courses {', '.join(field['courses'])}"
+    }
+
+def _market_documents(snapshot: Dict) -> List[Dict]:
+    documents = []
+    for key, data in snapshot.items():
+        if not (key.endswith("_jobs") and isinstance(data, dict)):
+            continue
+        label = key[:-len("_jobs")].replace("_", " ")
+        label = label.upper() if len(label) <= 2 else label
+        skills = ", ".join(data.get("top_skills", []))
+        documents.append({
+            "kind": "market",
+            "search": f"{label} {label} {skills} {' '.join(data.get('locations', []))}",
+            "text": f"Market ({'live' if data.get('live') else 'baseline'}, {snapshot.get('last_updated', 'recently')}): "
+                    f"{label} jobs, {data['count']:,} openings, growth {data['growth_rate']:.1f}%, "
+                    f"average salary ${data['avg_salary']:,}; top skills {skills}; hubs {', '.join(data.get('locations', []))}"
+        })
+    return documents
+
+class AdvisorKnowledgeIndex:
+    def __init__(self, course_catalog_path: str = COURSE_CATALOG_PATH,
+                 industry_skills_path: str = INDUSTRY_SKILLS_PATH,
+                 stem_fields: Dict = STEM_FIELDS,
+                 top_k: int = ADVISOR_RETRIEVAL["top_k"],
+                 min_score: float = ADVISOR_RETRIEVAL["min_score"],
+                 token_budget: int = ADVISOR_RETRIEVAL["token_budget"],
+                 chars_per_token: int = ADVISOR_RETRIEVAL["chars_per_token"],
+                 cache_entries: int = ADVISOR_RETRIEVAL["cache_entries"]):
+        """
+        Build the TF-IDF index over the static project data
+
+        Args:
+            top_k: Most documents retrieved per question
+            min_score: Cosine below which a document isn't considered relevant
+            token_budget: Estimated tokens the grounding text may take in a prompt
+            chars_per_token: Characters per token used for that estimate
+            cache_entries: Questions whose grounding is kept, least recently used evicted
+        """
+        self.top_k = top_k
+        self.min_score = min_score
+        self.token_budget = token_budget
+        self.chars_per_token = chars_per_token
+        self.cache_entries = cache_entries
+
+        self.static_documents: List[Dict] = []
+        courses = self._read_source(course_catalog_path)
+        if courses is not None:
+            self.static_documents += [_course_document(course) for course in courses.to_dict("records")]
+        skills = self._read_source(industry_skills_path)
+        if skills is not None:
+            self.static_documents += [_skill_document(skill) for skill in skills.to_dict("records")]
+        self.static_documents += [_field_document(name, field) for name, field in stem_fields.items()]
+
+        self.market_version = None
+        self.cache: "OrderedDict[str, str]" = OrderedDict()
+        self.counters = Counter()
+        self._lock = threading.Lock()
+
+        # IDF comes from the static documents alone, so a new market snapshot
+        # re-indexes only its own handful of documents
+        terms = [similarity_terms(document["search"]) for document in self.static_documents]
+        document_frequency = Counter(term for document_terms in terms for term in document_terms)
+        total = len(self.static_documents)
+        self.idf = {term: math.log((1 + total) / (1 + frequency)) + 1 for term, frequency in document_frequency.items()}
+        # Weight of a term no static document contains
+        self.unseen_idf = math.log(1 + total) + 1
+        self.static_postings, self.static_norms = self._index(terms, 0)
+        self._set_market_documents([])
+
+    def _read_source(self, path: str) -> Optional[pd.DataFrame]:
+        """A CSV data source, or None (with a warning) when it is missing"""
+        if not path:
+            return None
+        if not os.path.exists(path):
+            logger.warning("Advisor knowledge source %s is missing; its documents are left out", path)
+            return None
+        return pd.read_csv(path)
+
+    def _index(self, terms: List[Counter], first_id: int):
+        """Postings and norms of documents numbered from first_id"""
+        postings: Dict[str, List] = {}
+        norms = []
+        for doc_id, document_terms in enumerate(terms, first_id):
+            weights = {term: count * self.idf.get(term, self.unseen_idf) for term, count in document_terms.items()}
+            norms.append(math.sqrt(sum(weight * weight for weight in weights.values())) or 1.0)
+            for term, weight in weights.items():
+                postings.setdefault(term, []).append((doc_id, weight))
+        return postings, norms
+
+    def _set_market_documents(self, documents: List[Dict]):
+        terms = [similarity_terms(document["search"]) for document in documents]
+        self.market_postings, market_norms = self._index(terms, len(self.static_documents))
+        self.documents = self.static_documents + documents
+        self.norms = self.static_norms + market_norms
+
+    def update_market(self, snapshot: Optional[Dict]):
+        """Swap in a new market snapshot's documents; a no-op if it's the one already indexed"""
+        version = (snapshot or {}).get("last_updated")
+        if version == self.market_version:
+            return
+        with self._lock:
+            if version == self.market_version:
+                return
+            self._set_market_documents(_market_documents(snapshot or {}))
+            self.market_version = version
+            self.cache.clear()
+
+    def search(self, question: str) -> List[Dict]:
+        """
+        Documents most similar to a question, best first
+
+        Returns:
+            Up to top_k dictionaries with kind, text and score (TF-IDF cosine)
+        """
+        with self._lock:
+            return self._search(question)
+
+    def _search(self, question: str) -> List[Dict]:
+        query = {
+            term: count * self.idf.get(term, self.unseen_idf)
+            for term, count in similarity_terms(question).items()
+            if term in self.static_postings or term in self.market_postings
+        }
+        query_norm = math.sqrt(sum(weight * weight for weight in query.values()))
+        if not query_norm:
+            return []
+
+        scores = Counter()
+        for term, weight in query.items():
+            for postings in (self.static_postings, self.market_postings):
+                for doc_id, doc_weight in postings.get(term, ()):
+                    scores[doc_id] += weight * doc_weight
+
+        results = []
+        for doc_id, dot in scores.most_common():
+            score = dot / (query_norm * self.norms[doc_id])
+            if score >= self.min_score:
+                results.append({**self.documents[doc_id], "score": score})
+        results.sort(key=lambda result: result["score"], reverse=True)
+        return results[:self.top_k]
+
+    def grounding(self, question: str) -> str:
+        """
+        Prompt text with the data relevant to a question, within the token budget
+
+        Cached per normalized question until the market snapshot changes.
+
+        Returns:
+            A header and one line per document, or "" if nothing relevant was found
+        """
+        key = normalize_prompt(question)
+        with self._lock:
+            if key in self.cache:
+                self.cache.move_to_end(key)
+                self.counters["hits"] += 1
+                return self.cache[key]
+            self.counters["misses"] += 1
+
+            budget = self.token_budget * self.chars_per_token - len(GROUNDING_HEADER)
+            lines = []
+            for result in self._search(question):
+                line = f"- {result['text']}"
+                if len(line) + 1 > budget:
+                    continue
+                lines.append(line)
+                budget -= len(line) + 1
+            text = "\n".join([GROUNDING_HEADER] + lines) if lines else ""
+
+            self.cache[key] = text
+            while len(self.cache) > self.cache_entries:
+                self.cache.popitem(last=False)
+            return text
+
+    def stats(self) -> Dict[str, int]:
+        """Indexed documents and grounding cache hits and misses since startup"""
+        with self._lock:
+            return {
+                "documents": len(self.documents),
+                "cached_questions": len(self.cache),
+                "hits": self.counters["hits"],
+                "misses": self.counters["misses"]
+            }
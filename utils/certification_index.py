@@ -0,0 +1,125 @@
+"""
+Certification Index Module
+Matches free-text certifications against a catalog of real certifications
+"""
+
+import re
+import pandas as pd
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import CERTIFICATION_CATALOG_PATH
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+[+#]*")
+
+def tokenize(text: str) -> Tuple[str, ...]:
+    """Normalize text to lowercase word tokens, keeping suffixes like Security+"""
+    return tuple(TOKEN_PATTERN.findall(text.lower()))
+
+class CertificationIndex:
+    def __init__(self, catalog_path: Optional[str] = CERTIFICATION_CATALOG_PATH):
+        """
+        Build the term index from the certification catalog
+
+        Args:
+            catalog_path: Certification CSV; None starts an empty index to fill with add()
+
+        Raises:
+            FileNotFoundError: If the catalog doesn't exist, since every
+                certification would otherwise silently score 0
+        """
+        self.entries: List[Dict] = []
+        self.terms: Dict[Tuple[str, ...], List[int]] = defaultdict(list)
+        self.max_term_length = 0
+
+        if catalog_path is not None:
+            if not os.path.exists(catalog_path):
+                raise FileNotFoundError(f"Certification catalog not found: {catalog_path}")
+            self._load_catalog(catalog_path)
+
+    def _load_catalog(self, catalog_path: str):
+        """Load certifications and index their names, acronyms and aliases"""
+        catalog = pd.read_csv(catalog_path, dtype=str).fillna("")
+
+        for row in catalog.itertuples(index=False):
+            aliases = [alias for alias in row.aliases.split("|") if alias]
+            self.add(row.certification, row.industry, row.acronym, row.vendor, aliases)
+
+    def add(self, name: str, industry: str, acronym: str = "", vendor: str = "",
+            aliases: Optional[List[str]] = None):
+        """
+        Add one certification and all its match terms to the index
+
+        The vendor is kept for display only; a vendor name on its own
+        ("Google", "Cisco") doesn't name a certification, so it isn't a term.
+        """
+        entry_id = len(self.entries)
+        self.entries.append({
+            "certification": name,
+            "acronym": acronym,
+            "vendor": vendor,
+            "industry": industry.upper()
+        })
+
+        for term in [name, acronym] + (aliases or []):
+            tokens = tokenize(term)
+            if tokens and entry_id not in self.terms[tokens]:
+                self.terms[tokens].append(entry_id)
+                self.max_term_length = max(self.max_term_length, len(tokens))
+
+    def match(self, certification: str) -> List[Dict]:
+        """
+        Find catalog entries mentioned in one certification string
+
+        Scans the tokens once, taking the longest indexed term at each
+        position, so "AWS Certified Machine Learning" wins over "Machine Learning".
+        """
+        tokens = tokenize(certification)
+        matched = []
+
+        position = 0
+        while position < len(tokens):
+            longest = min(self.max_term_length, len(tokens) - position)
+            for length in range(longest, 0, -1):
+                entry_ids = self.terms.get(tokens[position:position + length])
+                if entry_ids:
+                    matched.extend(self.entries[entry_id] for entry_id in entry_ids)
+                    position += length
+                    break
+            else:
+                position += 1
+
+        return matched
+
+    def match_industries(self, certifications: List[str]) -> Dict[str, List[Dict]]:
+        """
+        Group a user's certifications by the industries they count toward
+
+        Each certification counts at most once per industry, and listing
+        the same catalog certification twice only counts it once.
+
+        Returns:
+            Dictionary of industry: [{"certification", "matched"}]
+        """
+        by_industry = defaultdict(list)
+        seen = set()
+
+        for certification in certifications:
+            counted = set()
+            for entry in self.match(certification):
+                key = (entry["industry"], entry["certification"])
+                if entry["industry"] in counted or key in seen:
+                    continue
+                counted.add(entry["industry"])
+                seen.add(key)
+                by_industry[entry["industry"]].append({
+                    "certification": certification,
+                    "matched": entry["certification"]
+                })
+
+        return dict(by_industry)
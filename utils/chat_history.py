@@ -0,0 +1,142 @@
+"""
+Chat History Module
+Keeps a session's latest advisor turns in memory and spills older ones to a compressed file
+"""
+
+import gzip
+import json
+import time
+from collections import deque
+from itertools import islice
+from typing import Dict, Iterator, List, Optional
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import CHAT_HISTORY
+
+def _prune_stale(directory: str, retention_seconds: float):
+    """Delete history files of sessions that have been idle longer than the retention"""
+    cutoff = time.time() - retention_seconds
+    for name in os.listdir(directory):
+        path = os.path.join(directory, name)
+        try:
+            if os.path.getmtime(path) < cutoff:
+                os.remove(path)
+        except OSError:
+            # Another process got there first
+            continue
+
+def format_turn(turn: Dict) -> str:
+    """A turn as plain text for export"""
+    return f"Q: {turn['user']}\nA: {turn['ai']}"
+
+class ChatHistory:
+    def __init__(self, session_id: str,
+                 directory: str = CHAT_HISTORY["directory"],
+                 max_turns: int = CHAT_HISTORY["max_turns"],
+                 retention_seconds: float = CHAT_HISTORY["retention_seconds"]):
+        """
+        Start an empty history for a session
+
+        Args:
+            session_id: Names the session's archive and export files
+            directory: Where those files live
+            max_turns: Turns kept in memory; older ones are archived
+            retention_seconds: Idle age after which any session's files are deleted
+        """
+        self.max_turns = max_turns
+        self.archive_path = os.path.join(directory, f"{session_id}.jsonl.gz")
+        self.export_path = os.path.join(directory, f"{session_id}.txt")
+        self.recent_turns = deque()
+        # Turns in the archive, which hold positions 0 .. archived - 1
+        self.archived = 0
+
+        os.makedirs(directory, exist_ok=True)
+        _prune_stale(directory, retention_seconds)
+
+    def __len__(self) -> int:
+        return self.archived + len(self.recent_turns)
+
+    def append(self, turn: Dict):
+        """Add a turn, archiving the oldest in-memory turn once over max_turns"""
+        self.recent_turns.append(turn)
+        if len(self.recent_turns) > self.max_turns:
+            oldest = self.recent_turns.popleft()
+            # Appending opens a new gzip member; gzip readers see one continuous stream
+            with gzip.open(self.archive_path, "at", encoding="utf-8") as f:
+                f.write(json.dumps(oldest) + "\n")
+            self.archived += 1
+
+    def _read_archive(self, start: int, stop: int) -> Iterator[Dict]:
+        try:
+            f = gzip.open(self.archive_path, "rt", encoding="utf-8")
+        except FileNotFoundError:
+            # Pruned after the session sat idle past the retention
+            return
+        with f:
+            for line in islice(f, start, stop):
+                yield json.loads(line)
+
+    def turns(self, start: int = 0, stop: Optional[int] = None) -> List[Dict]:
+        """
+        Turns start .. stop - 1 in the order they were asked
+
+        Archived turns are decompressed only when the range reaches into the
+        archive, and only up to the end of the range.
+        """
+        stop = len(self) if stop is None else min(stop, len(self))
+        start = max(0, start)
+        result = []
+        if start < min(stop, self.archived):
+            result.extend(self._read_archive(start, min(stop, self.archived)))
+        in_memory = list(self.recent_turns)
+        result.extend(in_memory[max(start - self.archived, 0):max(stop - self.archived, 0)])
+        return result
+
+    def latest(self, count: int) -> List[Dict]:
+        """The last `count` turns, oldest first"""
+        return self.turns(len(self) - count)
+
+    def iter_turns(self) -> Iterator[Dict]:
+        """Every turn oldest first, streaming the archive rather than loading it"""
+        if self.archived:
+            yield from self._read_archive(0, self.archived)
+        yield from list(self.recent_turns)
+
+    def export(self) -> str:
+        """
+        Write the whole conversation as Q/A text to the session's export file
+
+        Turns are written one at a time, so the archive is never held in
+        memory at once.
+
+        Returns:
+            Path of the export file
+        """
+        with open(self.export_path, "w", encoding="utf-8") as f:
+            for i, turn in enumerate(self.iter_turns()):
+                if i:
+                    f.write("\n\n")
+                f.write(format_turn(turn))
+        return self.export_path
+
+    def memory_bytes(self) -> int:
+        """Approximate memory held by the in-memory turns"""
+        size = sys.getsizeof(self.recent_turns)
+        for turn in self.recent_turns:
+            size += sys.getsizeof(turn)
+            size += sum(sys.getsizeof(key) + sys.getsizeof(value) for key, value in turn.items())
+        return size
+
+    def clear(self):
+        """Forget every turn and delete the session's files"""
+        self.recent_turns.clear()
+        self.archived = 0
+        for path in (self.archive_path, self.export_path):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
@@ -0,0 +1,174 @@
+"""
+Circuit Breaker Module
+Tracks provider health over a rolling window and fails fast while a provider is down
+"""
+
+import threading
+import time
+from collections import deque
+from typing import Dict, List, Optional
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import ADVISOR_CIRCUIT_BREAKER
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+class CircuitOpenError(Exception):
+    """The provider's breaker is open, so the call was not attempted"""
+
+class CircuitBreaker:
+    def __init__(self, name: str,
+                 window_seconds: float = ADVISOR_CIRCUIT_BREAKER["window_seconds"],
+                 min_requests: int = ADVISOR_CIRCUIT_BREAKER["min_requests"],
+                 error_rate_threshold: float = ADVISOR_CIRCUIT_BREAKER["error_rate_threshold"],
+                 slow_call_seconds: float = ADVISOR_CIRCUIT_BREAKER["slow_call_seconds"],
+                 slow_call_rate_threshold: float = ADVISOR_CIRCUIT_BREAKER["slow_call_rate_threshold"],
+                 open_seconds: float = ADVISOR_CIRCUIT_BREAKER["open_seconds"],
+                 half_open_probes: int = ADVISOR_CIRCUIT_BREAKER["half_open_probes"]):
+        """
+        Create a closed breaker for one provider
+
+        Args:
+            name: Provider name, for display
+            window_seconds: Age of the oldest call the rates are computed over
+            min_requests: Calls needed in the window before the breaker can trip
+            error_rate_threshold: Failed fraction of windowed calls that opens the breaker
+            slow_call_seconds: Calls taking longer than this count as slow
+            slow_call_rate_threshold: Slow fraction of windowed calls that opens the breaker
+            open_seconds: How long to fail fast before letting a probe through
+            half_open_probes: Concurrent trial calls allowed while half-open
+        """
+        self.name = name
+        self.window_seconds = window_seconds
+        self.min_requests = min_requests
+        self.error_rate_threshold = error_rate_threshold
+        self.slow_call_seconds = slow_call_seconds
+        self.slow_call_rate_threshold = slow_call_rate_threshold
+        self.open_seconds = open_seconds
+        self.half_open_probes = half_open_probes
+
+        self.state = CLOSED
+        self.opened_at: Optional[float] = None
+        self.probes_in_flight = 0
+        self.rejected = 0
+        # (finished at, ok, elapsed seconds) for calls within the window
+        self.calls = deque()
+        self._lock = threading.Lock()
+
+    def _prune(self, now: float):
+        while self.calls and self.calls[0][0] < now - self.window_seconds:
+            self.calls.popleft()
+
+    def _rates(self):
+        total = len(self.calls)
+        if not total:
+            return 0, 0.0, 0.0
+        errors = sum(not ok for _, ok, _ in self.calls)
+        slow = sum(elapsed > self.slow_call_seconds for _, _, elapsed in self.calls)
+        return total, errors / total, slow / total
+
+    def _open(self, now: float):
+        self.state = OPEN
+        self.opened_at = now
+        self.probes_in_flight = 0
+
+    def allow(self) -> bool:
+        """
+        Ask to make a call; every True must be followed by record() or release()
+
+        Returns:
+            False while the breaker is open (or half-open with all probes in flight)
+        """
+        with self._lock:
+            now = time.monotonic()
+            if self.state == OPEN and now - self.opened_at >= self.open_seconds:
+                self.state = HALF_OPEN
+                self.probes_in_flight = 0
+
+            if self.state == CLOSED:
+                return True
+            if self.state == HALF_OPEN and self.probes_in_flight < self.half_open_probes:
+                self.probes_in_flight += 1
+                return True
+
+            self.rejected += 1
+            return False
+
+    def release(self):
+        """Give back a permit from allow() for a call that never ran"""
+        with self._lock:
+            if self.state == HALF_OPEN and self.probes_in_flight:
+                self.probes_in_flight -= 1
+
+    def record(self, ok: bool, elapsed: float):
+        """Record the outcome of an allowed call and trip or reset the breaker"""
+        with self._lock:
+            now = time.monotonic()
+            healthy = ok and elapsed <= self.slow_call_seconds
+
+            if self.state == HALF_OPEN:
+                self.probes_in_flight = max(0, self.probes_in_flight - 1)
+                if healthy:
+                    # Recovered: judge the provider afresh from here on
+                    self.state = CLOSED
+                    self.opened_at = None
+                    self.calls.clear()
+                else:
+                    self._open(now)
+                return
+            if self.state == OPEN:
+                # A call allowed before the breaker opened; it can't change the verdict
+                return
+
+            self.calls.append((now, ok, elapsed))
+            self._prune(now)
+            total, error_rate, slow_rate = self._rates()
+            if total >= self.min_requests and (error_rate >= self.error_rate_threshold or
+                                               slow_rate >= self.slow_call_rate_threshold):
+                self._open(now)
+
+    def snapshot(self) -> Dict:
+        """State and windowed health figures for display"""
+        with self._lock:
+            now = time.monotonic()
+            self._prune(now)
+            total, error_rate, slow_rate = self._rates()
+            elapsed = sorted(elapsed for _, _, elapsed in self.calls)
+            retry_in = None
+            if self.state == OPEN:
+                retry_in = max(0.0, self.open_seconds - (now - self.opened_at))
+            return {
+                "name": self.name,
+                "state": self.state,
+                "requests": total,
+                "error_rate": error_rate,
+                "slow_rate": slow_rate,
+                "p95_seconds": elapsed[int(0.95 * (len(elapsed) - 1))] if elapsed else None,
+                "rejected": self.rejected,
+                "retry_in_seconds": retry_in
+            }
+
+class BreakerRegistry:
+    """One breaker per provider name, created on first use"""
+
+    def __init__(self, **settings):
+        self.settings = settings
+        self.breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def get(self, name: str) -> CircuitBreaker:
+        with self._lock:
+            if name not in self.breakers:
+                self.breakers[name] = CircuitBreaker(name, **self.settings)
+            return self.breakers[name]
+
+    def snapshots(self) -> List[Dict]:
+        with self._lock:
+            breakers = list(self.breakers.values())
+        return [breaker.snapshot() for breaker in breakers]
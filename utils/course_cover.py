@@ -0,0 +1,217 @@
+"""
+Course Cover Module
+Finds the smallest or cheapest set of courses that covers every skill gap
+"""
+
+import numpy as np
+from typing import Dict, List, Optional, Tuple, Union
+
+from .course_recommender import CourseRecommender, gap_spellings, parse_gaps
+
+# Instances up to these sizes are solved exactly; larger ones use greedy
+EXACT_MAX_SKILLS = 24
+EXACT_MAX_COURSES = 400
+# Branch-and-bound gives up (keeping the best cover so far) after this many nodes
+EXACT_NODE_LIMIT = 200_000
+
+# Added to every course's price so free courses still count toward set size
+PRICE_PER_COURSE = 1.0
+
+COST_MODES = ("count", "price", "duration")
+
+def _popcount(mask: int) -> int:
+    return bin(mask).count("1")
+
+class CourseCoverPlanner:
+    def __init__(self, recommender: Optional[CourseRecommender] = None):
+        """Reuse the recommender's course x skill coverage matrix"""
+        self.recommender = recommender or CourseRecommender()
+
+    def _course_costs(self, cost: str) -> np.ndarray:
+        courses = self.recommender.store.courses
+        if cost == "price":
+            return courses["price_usd"].to_numpy(dtype=np.float64) + PRICE_PER_COURSE
+        if cost == "duration":
+            return np.maximum(courses["duration_weeks"].to_numpy(dtype=np.float64), 1.0)
+        return np.ones(len(courses))
+
+    def _candidates(self, skill_ids: List[int], costs: np.ndarray,
+                    industry: Optional[str]) -> List[Tuple[int, float, int]]:
+        """
+        Courses as (skill bitmask, cost, course id), reduced to non-dominated options
+
+        Bit i of a mask is set when the course covers gap skill_ids[i].
+        """
+        columns = self.recommender.coverage_by_skill
+        in_scope = None
+        if industry:
+            in_scope = np.zeros(columns.shape[0], dtype=bool)
+            in_scope[self.recommender.store.filter_positions(industry=industry)] = True
+
+        masks: Dict[int, int] = {}
+        for bit, skill_id in enumerate(skill_ids):
+            for course_id in columns.indices[columns.indptr[skill_id]:columns.indptr[skill_id + 1]]:
+                if in_scope is None or in_scope[course_id]:
+                    masks[course_id] = masks.get(course_id, 0) | (1 << bit)
+
+        # Keep the cheapest course per distinct mask
+        cheapest: Dict[int, Tuple[float, int]] = {}
+        for course_id, mask in masks.items():
+            option = (float(costs[course_id]), int(course_id))
+            if mask not in cheapest or option < cheapest[mask]:
+                cheapest[mask] = option
+
+        # Drop options whose skills a no-more-expensive option already covers
+        options = sorted(((mask, cost, course_id) for mask, (cost, course_id) in cheapest.items()),
+                         key=lambda option: (-_popcount(option[0]), option[1]))
+        kept = []
+        for mask, cost, course_id in options:
+            if not any(mask & other == mask and other_cost <= cost for other, other_cost, _ in kept):
+                kept.append((mask, cost, course_id))
+        return kept
+
+    def _greedy(self, universe: int, options: List[Tuple[int, float, int]]) -> List[int]:
+        """Repeatedly take the option with the lowest cost per newly covered skill"""
+        uncovered = universe
+        chosen = []
+        while uncovered:
+            best, best_ratio = None, None
+            for index, (mask, cost, _) in enumerate(options):
+                gain = _popcount(mask & uncovered)
+                if gain and (best_ratio is None or cost / gain < best_ratio):
+                    best, best_ratio = index, cost / gain
+            chosen.append(best)
+            uncovered &= ~options[best][0]
+
+        # Remove picks made redundant by later ones, most expensive first
+        for index in sorted(chosen, key=lambda i: -options[i][1]):
+            rest = 0
+            for other in chosen:
+                if other != index:
+                    rest |= options[other][0]
+            if rest & universe == universe:
+                chosen.remove(index)
+        return chosen
+
+    def _branch_and_bound(self, universe: int, options: List[Tuple[int, float, int]],
+                          incumbent: List[int]) -> Tuple[List[int], bool]:
+        """
+        Exact weighted set cover by depth-first search
+
+        Branches on the uncovered skill with the fewest covering options and
+        prunes with a per-skill cost-share lower bound.
+
+        Returns:
+            Best cover found, and whether it is proven optimal
+        """
+        bits = [1 << bit for bit in range(universe.bit_length()) if universe >> bit & 1]
+        covering = {bit: sorted((i for i, option in enumerate(options) if option[0] & bit),
+                                key=lambda i: options[i][1]) for bit in bits}
+
+        best = list(incumbent)
+        best_cost = sum(options[i][1] for i in best)
+        nodes = 0
+        complete = True
+
+        def lower_bound(uncovered: int) -> float:
+            # Any cover pays at least the cheapest per-skill share for each uncovered skill
+            bound = 0.0
+            for bit in bits:
+                if uncovered & bit:
+                    bound += min(options[i][1] / _popcount(options[i][0] & uncovered) for i in covering[bit])
+            return bound
+
+        def search(uncovered: int, chosen: List[int], cost: float):
+            nonlocal best, best_cost, nodes, complete
+            nodes += 1
+            if nodes > EXACT_NODE_LIMIT:
+                complete = False
+                return
+            if not uncovered:
+                if cost < best_cost - 1e-9:
+                    best, best_cost = list(chosen), cost
+                return
+            if cost + lower_bound(uncovered) >= best_cost - 1e-9:
+                return
+
+            branch_bit = min((bit for bit in bits if uncovered & bit), key=lambda bit: len(covering[bit]))
+            for index in covering[branch_bit]:
+                chosen.append(index)
+                search(uncovered & ~options[index][0], chosen, cost + options[index][1])
+                chosen.pop()
+
+        search(universe, [], 0.0)
+        return best, complete
+
+    def minimum_cover(self, gaps: Union[List[str], Dict[str, float]], cost: str = "count",
+                      industry: Optional[str] = None, exact: Optional[bool] = None) -> Dict:
+        """
+        Choose the fewest (or cheapest) courses that together cover every gap
+
+        Args:
+            gaps: Gap list from ReadinessCalculator or CareerMapper, or skill -> weight
+            cost: "count" for fewest courses, "price" for lowest total price,
+                "duration" for fewest total weeks
+            industry: Only use courses from this industry
+            exact: Force branch-and-bound on or off (default: by instance size)
+
+        Returns:
+            Selected courses, covered and uncoverable gaps, totals and the method used
+        """
+        if cost not in COST_MODES:
+            raise ValueError(f"cost must be one of {', '.join(COST_MODES)}")
+
+        recommender = self.recommender
+        gap_names = list(parse_gaps(gaps))
+        skill_ids = []
+        for name in gap_names:
+            skill_id = recommender.skill_ids.get(name)
+            if skill_id is not None and skill_id not in skill_ids:
+                skill_ids.append(skill_id)
+
+        costs = self._course_costs(cost)
+        options = self._candidates(skill_ids, costs, industry)
+
+        coverable = 0
+        for mask, _, _ in options:
+            coverable |= mask
+        covered_ids = [skill_id for bit, skill_id in enumerate(skill_ids) if coverable >> bit & 1]
+        spellings = gap_spellings(gaps)
+        uncovered = [spellings[name] for name in gap_names if recommender.skill_ids.get(name) not in covered_ids]
+
+        chosen = self._greedy(coverable, options) if coverable else []
+        method, optimal = "greedy", False
+
+        use_exact = exact if exact is not None else (
+            len(covered_ids) <= EXACT_MAX_SKILLS and len(options) <= EXACT_MAX_COURSES
+        )
+        if use_exact and coverable:
+            chosen, optimal = self._branch_and_bound(coverable, options, chosen)
+            method = "branch_and_bound"
+
+        courses = recommender.store.courses
+        selected = []
+        for index in sorted(chosen, key=lambda i: -_popcount(options[i][0])):
+            mask, _, course_id = options[index]
+            course = courses.iloc[course_id]
+            selected.append({
+                "course_name": course["course_name"],
+                "platform": course["platform"],
+                "industry": course["industry"],
+                "difficulty": course["difficulty"],
+                "duration_weeks": int(course["duration_weeks"]),
+                "price_usd": round(float(course["price_usd"]), 2),
+                "rating": round(float(course["rating"]), 1),
+                "url": course["url"],
+                "covers": [recommender.skills[skill_id] for bit, skill_id in enumerate(skill_ids) if mask >> bit & 1]
+            })
+
+        return {
+            "courses": selected,
+            "covered_gaps": [recommender.skills[skill_id] for skill_id in covered_ids],
+            "uncovered_gaps": uncovered,
+            "total_price": round(sum(course["price_usd"] for course in selected), 2),
+            "total_weeks": sum(course["duration_weeks"] for course in selected),
+            "method": method,
+            "optimal": optimal
+        }
@@ -0,0 +1,212 @@
+"""
+Course Recommender Module
+Ranks catalog courses by how well they cover a user's skill gaps
+"""
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+from typing import Dict, List, Optional, Union
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import INDUSTRY_SKILLS_PATH
+from .certification_index import tokenize
+from .course_store import CourseStore
+
+# Weight of each gap by the prefix ReadinessCalculator puts on it
+GAP_WEIGHTS = {
+    "essential": 1.0,
+    "preferred": 0.6
+}
+
+# How strongly a course covers a skill
+FOCUS_COVERAGE = 1.0
+TITLE_COVERAGE = 0.5
+
+# Blend of normalized signals in the final course score
+RANKING_WEIGHTS = {
+    "coverage": 0.6,
+    "rating": 0.2,
+    "price": 0.1,
+    "duration": 0.1
+}
+
+def parse_gaps(gaps: Union[List[str], Dict[str, float]]) -> Dict[str, float]:
+    """
+    Turn gap lists from ReadinessCalculator ("Essential: Python") or
+    CareerMapper (plain skill names) into lowercase skill -> weight
+    """
+    if isinstance(gaps, dict):
+        return {skill.strip().lower(): float(weight) for skill, weight in gaps.items()}
+
+    weights = {}
+    for gap in gaps:
+        prefix, _, skill = gap.partition(":")
+        if skill and prefix.strip().lower() in GAP_WEIGHTS:
+            weight = GAP_WEIGHTS[prefix.strip().lower()]
+        else:
+            skill, weight = gap, 1.0
+        key = skill.strip().lower()
+        weights[key] = max(weight, weights.get(key, 0.0))
+    return weights
+
+def gap_spellings(gaps: Union[List[str], Dict[str, float]]) -> Dict[str, str]:
+    """Lowercase skill from parse_gaps -> the skill as the caller first spelled it"""
+    if isinstance(gaps, dict):
+        return {skill.strip().lower(): skill.strip() for skill in gaps}
+
+    spellings = {}
+    for gap in gaps:
+        prefix, _, skill = gap.partition(":")
+        if not (skill and prefix.strip().lower() in GAP_WEIGHTS):
+            skill = gap
+        spellings.setdefault(skill.strip().lower(), skill.strip())
+    return spellings
+
+def _normalized(values: np.ndarray) -> np.ndarray:
+    """Scale to 0-1; a constant column scores 1 everywhere"""
+    low, high = np.nanmin(values), np.nanmax(values)
+    if not np.isfinite(low) or high <= low:
+        return np.ones(len(values), dtype=np.float32)
+    return ((np.nan_to_num(values, nan=low) - low) / (high - low)).astype(np.float32)
+
+class CourseRecommender:
+    def __init__(self, store: Optional[CourseStore] = None, skills_path: str = INDUSTRY_SKILLS_PATH):
+        """Build the course x skill coverage matrix from the skill and course catalogs"""
+        self.store = store or CourseStore()
+        courses = self.store.courses
+
+        skill_names = pd.read_csv(skills_path, usecols=["skill_name"])["skill_name"].tolist()
+        skill_names += courses["skill_focus"].astype(str).tolist()
+        self.skills: List[str] = []
+        self.skill_ids: Dict[str, int] = {}
+        for name in skill_names:
+            key = name.strip().lower()
+            if key and key not in self.skill_ids:
+                self.skill_ids[key] = len(self.skills)
+                self.skills.append(name.strip())
+
+        self.coverage = self._build_coverage(courses)
+        # Column view for finding which courses cover a given skill
+        self.coverage_by_skill = self.coverage.tocsc()
+
+        # Higher is better for every signal, so cheap and short courses score high
+        self.signals = {
+            "rating": _normalized(courses["rating"].to_numpy(dtype=np.float32)),
+            "price": 1 - _normalized(courses["price_usd"].to_numpy(dtype=np.float32)),
+            "duration": 1 - _normalized(courses["duration_weeks"].to_numpy(dtype=np.float32))
+        }
+
+    def _build_coverage(self, courses: pd.DataFrame) -> sparse.csr_matrix:
+        """Sparse courses x skills matrix: full credit for a course's focus skill, partial for title mentions"""
+        rows, cols, values = [], [], []
+
+        # Index skills by their first token so title matching only checks plausible skills
+        by_first_token: Dict[str, List[tuple]] = {}
+        for skill_id, skill in enumerate(self.skills):
+            tokens = tokenize(skill)
+            if tokens:
+                by_first_token.setdefault(tokens[0], []).append((tokens, skill_id))
+
+        focus = courses["skill_focus"].astype(str).str.strip().str.lower().to_numpy()
+        for course_id, (name, focus_skill) in enumerate(zip(courses["course_name"].astype(str), focus)):
+            covered = {}
+            focus_id = self.skill_ids.get(focus_skill)
+            if focus_id is not None:
+                covered[focus_id] = FOCUS_COVERAGE
+
+            title = tokenize(name)
+            for position, token in enumerate(title):
+                for tokens, skill_id in by_first_token.get(token, ()):
+                    if title[position:position + len(tokens)] == tokens and skill_id not in covered:
+                        covered[skill_id] = TITLE_COVERAGE
+
+            rows.extend([course_id] * len(covered))
+            cols.extend(covered.keys())
+            values.extend(covered.values())
+
+        return sparse.csr_matrix(
+            (np.array(values, dtype=np.float32), (rows, cols)),
+            shape=(len(courses), len(self.skills))
+        )
+
+    def recommend(self, gaps: Union[List[str], Dict[str, float]], top_k: int = 5,
+                  industry: Optional[str] = None) -> Dict:
+        """
+        Recommend the courses that best close a set of skill gaps
+
+        Args:
+            gaps: Gap list from ReadinessCalculator or CareerMapper, or skill -> weight
+            top_k: Number of courses to return (0 returns no courses, only the uncovered gaps)
+            industry: Only recommend courses from this industry
+
+        Returns:
+            Dictionary with ranked courses (with the gaps each covers) and
+            the gaps no course in the catalog covers, as the caller spelled them
+
+        Raises:
+            ValueError: If top_k is negative
+        """
+        if top_k < 0:
+            raise ValueError(f"top_k must be 0 or more, got {top_k}")
+        gap_weights = parse_gaps(gaps)
+        gap_vector = np.zeros(len(self.skills), dtype=np.float32)
+        for skill, weight in gap_weights.items():
+            skill_id = self.skill_ids.get(skill)
+            if skill_id is not None:
+                gap_vector[skill_id] = weight
+
+        # One sparse mat-vec scores every course's gap coverage at once
+        coverage = self.coverage @ gap_vector
+        candidates = np.flatnonzero(coverage)
+        if industry:
+            candidates = np.intersect1d(candidates, self.store.filter_positions(industry=industry), assume_unique=True)
+
+        in_scope = np.zeros(len(coverage), dtype=bool)
+        in_scope[candidates] = True
+        spellings = gap_spellings(gaps)
+        uncovered = []
+        for skill in gap_weights:
+            skill_id = self.skill_ids.get(skill)
+            if skill_id is not None:
+                start, end = self.coverage_by_skill.indptr[skill_id:skill_id + 2]
+                if in_scope[self.coverage_by_skill.indices[start:end]].any():
+                    continue
+            uncovered.append(spellings[skill])
+
+        total_weight = gap_vector.sum() or 1.0
+        scores = RANKING_WEIGHTS["coverage"] * coverage[candidates] / total_weight
+        for signal in ("rating", "price", "duration"):
+            scores += RANKING_WEIGHTS[signal] * self.signals[signal][candidates]
+
+        # Partial selection of the top k, then order just those (ties by catalog order)
+        if top_k == 0:
+            selected = np.arange(0)
+        elif len(candidates) > top_k:
+            selected = np.argpartition(-scores, top_k - 1)[:top_k]
+        else:
+            selected = np.arange(len(candidates))
+        selected = selected[np.lexsort((candidates[selected], -scores[selected]))]
+
+        recommendations = []
+        rows = self.store.courses.iloc[candidates[selected]].to_dict("records")
+        for index, course in zip(selected, rows):
+            row = self.coverage.getrow(candidates[index])
+            recommendations.append({
+                "course_name": course["course_name"],
+                "platform": course["platform"],
+                "industry": course["industry"],
+                "difficulty": course["difficulty"],
+                "duration_weeks": int(course["duration_weeks"]),
+                "price_usd": round(float(course["price_usd"]), 2),
+                "rating": round(float(course["rating"]), 1),
+                "url": course["url"],
+                "covers": [self.skills[skill_id] for skill_id in row.indices if gap_vector[skill_id] > 0],
+                "score": round(float(scores[index]), 4)
+            })
+
+        return {"courses": recommendations, "uncovered_gaps": uncovered}
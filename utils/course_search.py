@@ -0,0 +1,323 @@
+"""
+Course Search Module
+Incremental inverted index over the course catalog with BM25 ranking and facet counts
+"""
+
+import hashlib
+import threading
+import numpy as np
+import pandas as pd
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
+
+from .certification_index import tokenize
+from .course_store import DIFFICULTY_LEVELS, PRICE_BANDS
+
+# BM25 term-frequency saturation and length normalization
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# Course fields that are searchable, with how many times each counts toward term frequency
+SEARCH_FIELDS = {
+    "course_name": 2,
+    "skill_focus": 2,
+    "platform": 1,
+    "industry": 1
+}
+
+# Facet labels; rating and duration bands are (label, lower bound)
+RATING_BANDS = [("4.5+", 4.5), ("4.0-4.5", 4.0), ("Under 4.0", -np.inf)]
+DURATION_BANDS = [("Over 12 weeks", 13), ("9-12 weeks", 9), ("5-8 weeks", 5), ("Up to 4 weeks", -np.inf)]
+
+FACET_LABELS = {
+    "difficulty": DIFFICULTY_LEVELS,
+    "price_band": list(PRICE_BANDS),
+    "rating_band": [label for label, _ in RATING_BANDS],
+    "duration_band": [label for label, _ in DURATION_BANDS]
+}
+
+def _band(value: float, bands: List[Tuple[str, float]]) -> str:
+    for label, lower in bands:
+        if value >= lower:
+            return label
+    return bands[-1][0]
+
+def _price_band(price: float) -> str:
+    for label, upper in PRICE_BANDS.items():
+        if price <= upper:
+            return label
+    return list(PRICE_BANDS)[-1]
+
+def course_key(course: Dict) -> str:
+    """Stable identity of a course across catalog reloads"""
+    return course.get("url") or f"{course.get('course_name')}|{course.get('platform')}"
+
+class CourseSearchIndex:
+    def __init__(self, courses: Optional[pd.DataFrame] = None):
+        """Create an empty index, optionally filled from a catalog DataFrame"""
+        self.postings: Dict[str, Dict[int, int]] = {}
+        self._posting_arrays: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
+
+        self.keys: List[Optional[str]] = []
+        self.doc_ids: Dict[str, int] = {}
+        self.records: List[Optional[Dict]] = []
+        self.doc_terms: List[Optional[Counter]] = []
+        self.fingerprints: List[Optional[str]] = []
+        # Slots of removed courses, handed to the next added ones
+        self.free_slots: List[int] = []
+
+        self.doc_lengths = np.zeros(0, dtype=np.float32)
+        self.ratings = np.zeros(0, dtype=np.float32)
+        self.alive = np.zeros(0, dtype=bool)
+        self.facet_codes = {facet: np.zeros(0, dtype=np.int8) for facet in FACET_LABELS}
+        self.total_length = 0.0
+        self.live_count = 0
+        self.version = None
+        self._lock = threading.Lock()
+
+        if courses is not None:
+            self.sync(courses)
+
+    def __len__(self) -> int:
+        return self.live_count
+
+    def _grow(self, size: int):
+        """Grow per-document arrays geometrically so appends stay amortized O(1)"""
+        capacity = len(self.alive)
+        if size <= capacity:
+            return
+        new_capacity = max(size, capacity * 2, 64)
+
+        def grown(array):
+            result = np.zeros(new_capacity, dtype=array.dtype)
+            result[:capacity] = array
+            return result
+
+        self.doc_lengths = grown(self.doc_lengths)
+        self.ratings = grown(self.ratings)
+        self.alive = grown(self.alive)
+        self.facet_codes = {facet: grown(codes) for facet, codes in self.facet_codes.items()}
+
+    def _fingerprint(self, course: Dict) -> str:
+        payload = "\x1f".join(str(course.get(field, "")) for field in sorted(course))
+        return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+    def _terms(self, course: Dict) -> Counter:
+        terms = Counter()
+        for field, weight in SEARCH_FIELDS.items():
+            for token in tokenize(str(course.get(field, "") or "")):
+                terms[token] += weight
+        return terms
+
+    def add(self, course: Dict) -> int:
+        """
+        Index one course, replacing any previous version with the same key
+
+        A replaced course keeps its slot, and new courses fill slots freed by
+        removals before the arrays grow.
+        """
+        key = course_key(course)
+        if key in self.doc_ids:
+            self.remove(key)
+
+        terms = self._terms(course)
+        if self.free_slots:
+            doc = self.free_slots.pop()
+            self.keys[doc] = key
+            self.records[doc] = dict(course)
+            self.doc_terms[doc] = terms
+            self.fingerprints[doc] = self._fingerprint(course)
+        else:
+            doc = len(self.keys)
+            self._grow(doc + 1)
+            self.keys.append(key)
+            self.records.append(dict(course))
+            self.doc_terms.append(terms)
+            self.fingerprints.append(self._fingerprint(course))
+        self.doc_ids[key] = doc
+
+        for term, frequency in terms.items():
+            self.postings.setdefault(term, {})[doc] = frequency
+            self._posting_arrays.pop(term, None)
+
+        length = float(sum(terms.values()))
+        rating = float(course.get("rating") or 0)
+        self.doc_lengths[doc] = length
+        self.ratings[doc] = rating
+        self.alive[doc] = True
+        self.total_length += length
+        self.live_count += 1
+
+        values = {
+            "difficulty": course.get("difficulty"),
+            "price_band": _price_band(float(course.get("price_usd") or 0)),
+            "rating_band": _band(rating, RATING_BANDS),
+            "duration_band": _band(float(course.get("duration_weeks") or 0), DURATION_BANDS)
+        }
+        for facet, value in values.items():
+            labels = FACET_LABELS[facet]
+            self.facet_codes[facet][doc] = labels.index(value) if value in labels else -1
+
+        return doc
+
+    def remove(self, key: str) -> bool:
+        """Drop a course from the index, freeing its slot for the next add"""
+        doc = self.doc_ids.pop(key, None)
+        if doc is None:
+            return False
+
+        for term in self.doc_terms[doc]:
+            postings = self.postings[term]
+            del postings[doc]
+            if not postings:
+                del self.postings[term]
+            self._posting_arrays.pop(term, None)
+
+        self.total_length -= float(self.doc_lengths[doc])
+        self.live_count -= 1
+        self.alive[doc] = False
+        self.keys[doc] = None
+        self.records[doc] = None
+        self.doc_terms[doc] = None
+        self.fingerprints[doc] = None
+        self.free_slots.append(doc)
+        return True
+
+    def needs_sync(self, version) -> bool:
+        """Whether sync(courses, version) would do any work; lets callers skip building the catalog frame"""
+        return version is None or version != self.version
+
+    def sync(self, courses: pd.DataFrame, version=None) -> Dict[str, int]:
+        """
+        Bring the index in line with a catalog, touching only changed courses
+
+        Args:
+            courses: Full catalog
+            version: Catalog version tag; a sync with the current version is a no-op
+
+        Returns:
+            Counts of added, updated and removed courses
+        """
+        with self._lock:
+            if not self.needs_sync(version):
+                return {"added": 0, "updated": 0, "removed": 0}
+            counts = self._sync(courses)
+            self.version = version
+            return counts
+
+    def _sync(self, courses: pd.DataFrame) -> Dict[str, int]:
+        records = courses.astype(object).where(courses.notna(), None).to_dict("records")
+        seen = set()
+        counts = {"added": 0, "updated": 0, "removed": 0}
+
+        for course in records:
+            key = course_key(course)
+            seen.add(key)
+            doc = self.doc_ids.get(key)
+            if doc is None:
+                self.add(course)
+                counts["added"] += 1
+            elif self.fingerprints[doc] != self._fingerprint(course):
+                self.add(course)
+                counts["updated"] += 1
+
+        for key in [key for key in self.doc_ids if key not in seen]:
+            self.remove(key)
+            counts["removed"] += 1
+
+        return counts
+
+    def _term_arrays(self, term: str) -> Tuple[np.ndarray, np.ndarray]:
+        """Posting list as (doc ids, term frequencies) arrays, cached until the term changes"""
+        arrays = self._posting_arrays.get(term)
+        if arrays is None:
+            postings = self.postings[term]
+            arrays = (
+                np.fromiter(postings.keys(), dtype=np.int32, count=len(postings)),
+                np.fromiter(postings.values(), dtype=np.float32, count=len(postings))
+            )
+            self._posting_arrays[term] = arrays
+        return arrays
+
+    def _score(self, query_terms: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+        """BM25 scores for every document matching any query term"""
+        size = len(self.keys)
+        scores = np.zeros(size, dtype=np.float32)
+        matched = np.zeros(size, dtype=bool)
+        average_length = self.total_length / self.live_count
+
+        for term in set(query_terms):
+            if term not in self.postings:
+                continue
+            docs, frequencies = self._term_arrays(term)
+            document_frequency = len(docs)
+            idf = np.log(1 + (self.live_count - document_frequency + 0.5) / (document_frequency + 0.5))
+            norm = BM25_K1 * (1 - BM25_B + BM25_B * self.doc_lengths[docs] / average_length)
+            scores[docs] += idf * frequencies * (BM25_K1 + 1) / (frequencies + norm)
+            matched[docs] = True
+
+        return scores, matched
+
+    def search(self, query: str = "", filters: Optional[Dict[str, List[str]]] = None,
+               limit: int = 20, offset: int = 0) -> Dict:
+        """
+        Rank courses for a text query and count facet values among the matches
+
+        Args:
+            query: Free text; empty matches every course, ranked by rating
+            filters: Facet name -> accepted labels (difficulty, price_band,
+                rating_band, duration_band)
+            limit: Number of results to return
+            offset: Number of top results to skip, for paging
+
+        Returns:
+            Dictionary with total, results [{course, score}] and
+            facets {facet: {label: count}}
+        """
+        with self._lock:
+            return self._search(query, filters, limit, offset)
+
+    def _search(self, query: str, filters: Optional[Dict[str, List[str]]], limit: int, offset: int) -> Dict:
+        size = len(self.keys)
+        if self.live_count == 0:
+            return {"total": 0, "results": [], "facets": {facet: {} for facet in FACET_LABELS}}
+
+        query_terms = list(tokenize(query))
+        if query_terms:
+            scores, matched = self._score(query_terms)
+        else:
+            scores, matched = self.ratings[:size].copy(), self.alive[:size].copy()
+
+        # Each facet's counts respect every other facet's filter, but not its own
+        filter_masks = {}
+        for facet, labels in (filters or {}).items():
+            if not labels or facet not in FACET_LABELS:
+                continue
+            accepted = np.zeros(len(FACET_LABELS[facet]) + 1, dtype=bool)
+            accepted[[FACET_LABELS[facet].index(label) for label in labels if label in FACET_LABELS[facet]]] = True
+            filter_masks[facet] = accepted[self.facet_codes[facet][:size]]
+
+        facets = {}
+        for facet, labels in FACET_LABELS.items():
+            mask = matched.copy()
+            for other, other_mask in filter_masks.items():
+                if other != facet:
+                    mask &= other_mask
+            codes = self.facet_codes[facet][:size][mask]
+            counts = np.bincount(codes[codes >= 0], minlength=len(labels))
+            facets[facet] = {label: int(count) for label, count in zip(labels, counts)}
+
+        for mask in filter_masks.values():
+            matched &= mask
+        candidates = np.flatnonzero(matched)
+        total = len(candidates)
+
+        # Partial selection of the requested page instead of a full sort
+        wanted = min(offset + limit, total)
+        if wanted < total:
+            top = np.argpartition(-scores[candidates], wanted - 1)[:wanted]
+            candidates = candidates[top]
+        order = candidates[np.lexsort((candidates, -scores[candidates]))][offset:offset + limit]
+
+        results = [{"course": self.records[doc], "score": round(float(scores[doc]), 4)} for doc in order]
+        return {"total": total, "results": results, "facets": facets}
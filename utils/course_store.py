@@ -0,0 +1,208 @@
+"""
+Course Store Module
+Loads the course catalog into a typed DataFrame with facet indexes for fast filtering
+"""
+
+import numpy as np
+import pandas as pd
+from typing import Dict, List, Optional, Sequence, Union
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import COURSE_CATALOG_PATH
+
+DIFFICULTY_LEVELS = ["Beginner", "Intermediate", "Advanced"]
+
+# Upper bounds (USD) of each price band
+PRICE_BANDS = {
+    "Free": 0,
+    "Up to $50": 50,
+    "$50-$200": 200,
+    "Over $200": np.inf
+}
+
+# Columns with a position index, keyed by the name filters use
+FACETS = {
+    "industry": "industry_key",
+    "platform": "platform",
+    "difficulty": "difficulty",
+    "price_band": "price_band"
+}
+
+# Columns the catalog can be sorted by
+SORTABLE_COLUMNS = ("rating", "price_usd", "duration_weeks", "course_name")
+
+FacetValue = Optional[Union[str, Sequence[str]]]
+
+class CourseStore:
+    def __init__(self, catalog_path: str = COURSE_CATALOG_PATH, courses: Optional[pd.DataFrame] = None):
+        """Load the catalog once and build the facet indexes"""
+        raw = courses if courses is not None else pd.read_csv(catalog_path, dtype={
+            "course_name": str,
+            "platform": "category",
+            "industry": "category",
+            "skill_focus": "category",
+            "url": str
+        })
+        self.courses = self._normalize(raw)
+        self.indexes = self._build_indexes(self.courses)
+        self.codes = {facet: self.courses[column].cat.codes.to_numpy() for facet, column in FACETS.items()}
+        # Precomputed sort ranks, so ordering a result set is an integer argsort
+        self.sort_ranks = {
+            column: np.argsort(np.argsort(self.courses[column].to_numpy(), kind="stable"), kind="stable").astype(np.int32)
+            for column in SORTABLE_COLUMNS
+        }
+        self.category_codes = {
+            facet: {value: code for code, value in enumerate(self.courses[column].cat.categories)}
+            for facet, column in FACETS.items()
+        }
+
+    def _normalize(self, raw: pd.DataFrame) -> pd.DataFrame:
+        """Compact dtypes: categoricals for repeated strings, small numerics elsewhere"""
+        courses = raw.reset_index(drop=True).copy()
+
+        for column in ("platform", "industry", "skill_focus"):
+            courses[column] = courses[column].astype("category")
+        courses["industry_key"] = courses["industry"].astype(str).str.upper().astype("category")
+        courses["difficulty"] = pd.Categorical(courses["difficulty"], categories=DIFFICULTY_LEVELS, ordered=True)
+
+        courses["duration_weeks"] = pd.to_numeric(courses["duration_weeks"], errors="coerce").fillna(0).astype("int16")
+        courses["price_usd"] = pd.to_numeric(courses["price_usd"], errors="coerce").fillna(0).astype("float32")
+        courses["rating"] = pd.to_numeric(courses["rating"], errors="coerce").astype("float32")
+
+        bounds = [-np.inf] + list(PRICE_BANDS.values())
+        courses["price_band"] = pd.cut(courses["price_usd"], bins=bounds, labels=list(PRICE_BANDS), right=True)
+
+        return courses
+
+    def _build_indexes(self, courses: pd.DataFrame) -> Dict[str, Dict[str, np.ndarray]]:
+        """Sorted row positions for every value of every facet column"""
+        indexes = {}
+        for facet, column in FACETS.items():
+            codes = courses[column].cat.codes.to_numpy()
+            order = np.argsort(codes, kind="stable").astype(np.int32)
+            boundaries = np.searchsorted(codes[order], np.arange(len(courses[column].cat.categories) + 1))
+            indexes[facet] = {
+                category: order[boundaries[code]:boundaries[code + 1]]
+                for code, category in enumerate(courses[column].cat.categories)
+            }
+        return indexes
+
+    def __len__(self) -> int:
+        return len(self.courses)
+
+    def facet_values(self, facet: str) -> List[str]:
+        """Values of a facet that have at least one course, in category order"""
+        column = FACETS[facet]
+        return [str(value) for value in self.courses[column].cat.categories if len(self.indexes[facet][value])]
+
+    def _normalize_values(self, facet: str, values: FacetValue) -> List[str]:
+        if isinstance(values, str):
+            values = [values]
+        if facet == "industry":
+            values = [value.upper() for value in values]
+        return [value for value in values if value in self.indexes[facet]]
+
+    def _positions_for(self, facet: str, values: List[str]) -> np.ndarray:
+        """Row positions matching any of the given facet values"""
+        matches = [self.indexes[facet][value] for value in values]
+        if not matches:
+            return np.empty(0, dtype=np.int32)
+        if len(matches) == 1:
+            return matches[0]
+        return np.sort(np.concatenate(matches))
+
+    def filter_positions(self, industry: FacetValue = None, platform: FacetValue = None,
+                         difficulty: FacetValue = None, price_band: FacetValue = None) -> np.ndarray:
+        """
+        Row positions matching every given facet
+
+        Each facet accepts one value or a list (any of). Starts from the
+        most selective facet's index and checks the others by category code,
+        so cost scales with the matches rather than the catalog size.
+        """
+        requested = {"industry": industry, "platform": platform, "difficulty": difficulty, "price_band": price_band}
+        requested = {facet: self._normalize_values(facet, values) for facet, values in requested.items() if values}
+        if not requested:
+            return np.arange(len(self.courses), dtype=np.int32)
+
+        selectivity = {
+            facet: sum(len(self.indexes[facet][value]) for value in values)
+            for facet, values in requested.items()
+        }
+        driver = min(selectivity, key=selectivity.get)
+        positions = self._positions_for(driver, requested.pop(driver))
+
+        for facet, values in requested.items():
+            if len(positions) == 0:
+                break
+            category_codes = self.category_codes[facet]
+            wanted = np.zeros(len(category_codes) + 1, dtype=bool)
+            wanted[[category_codes[value] for value in values]] = True
+            # Code -1 (missing) lands on the trailing False slot
+            positions = positions[wanted[self.codes[facet][positions]]]
+        return positions
+
+    def filter(self, industry: FacetValue = None, platform: FacetValue = None,
+               difficulty: FacetValue = None, price_band: FacetValue = None,
+               min_rating: Optional[float] = None) -> pd.DataFrame:
+        """
+        Courses matching every given facet
+
+        Args:
+            industry: Industry name(s), case-insensitive
+            platform: Platform name(s)
+            difficulty: Beginner, Intermediate and/or Advanced
+            price_band: Free, Up to $50, $50-$200 and/or Over $200
+            min_rating: Lowest rating to include
+
+        Returns:
+            Matching rows of the catalog DataFrame
+        """
+        positions = self.filter_positions(industry, platform, difficulty, price_band)
+        result = self.courses.iloc[positions]
+        if min_rating is not None:
+            result = result[result["rating"] >= min_rating]
+        return result
+
+    def page(self, positions: Optional[np.ndarray] = None, sort_by: str = "rating", descending: bool = True,
+             page: int = 0, page_size: int = 20) -> Dict:
+        """
+        One sorted page of a result set
+
+        Args:
+            positions: Row positions to page through (default: whole catalog)
+            sort_by: One of SORTABLE_COLUMNS
+            descending: Sort direction
+            page: Zero-based page number, clamped to the last page
+            page_size: Rows per page
+
+        Returns:
+            Dictionary with total, pages, page and the page's rows
+        """
+        if sort_by not in self.sort_ranks:
+            raise ValueError(f"sort_by must be one of {', '.join(SORTABLE_COLUMNS)}")
+        if positions is None:
+            positions = np.arange(len(self.courses), dtype=np.int32)
+
+        total = len(positions)
+        pages = max(1, -(-total // page_size))
+        page = min(max(page, 0), pages - 1)
+
+        ranks = self.sort_ranks[sort_by][positions]
+        if descending:
+            ranks = -ranks
+        end = min((page + 1) * page_size, total)
+
+        # Only the rows up to the end of the requested page need ordering
+        if end < total:
+            head = np.argpartition(ranks, end - 1)[:end]
+            order = head[np.argsort(ranks[head], kind="stable")]
+        else:
+            order = np.argsort(ranks, kind="stable")
+
+        rows = self.courses.iloc[positions[order[page * page_size:end]]]
+        return {"total": total, "pages": pages, "page": page, "rows": rows}
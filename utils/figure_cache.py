@@ -0,0 +1,115 @@
+"""
+Figure Cache Module
+Keeps built chart specs, keyed by a hash of their inputs, so unchanged charts skip rebuilding
+"""
+
+import hashlib
+import json
+import threading
+import pandas as pd
+from collections import Counter, OrderedDict
+from typing import Any, Callable, Dict, Optional
+import plotly.graph_objects as go
+from plotly.basedatatypes import BaseFigure
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import FIGURE_CACHE
+from .single_flight import SingleFlight
+
+def _canonical(value: Any) -> Any:
+    """JSON stand-in for inputs json can't encode; frames become a hash of their contents"""
+    if isinstance(value, pd.DataFrame):
+        rows = pd.util.hash_pandas_object(value, index=False).values.tobytes()
+        return {
+            "columns": [str(column) for column in value.columns],
+            "rows": hashlib.sha256(rows).hexdigest(),
+            "attrs": value.attrs
+        }
+    return str(value)
+
+def figure_key(name: str, data: Any, theme: Any) -> str:
+    """Content hash identifying a chart built from these inputs with this theme"""
+    payload = json.dumps([name, data, theme], sort_keys=True, default=_canonical)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+class FigureCache:
+    def __init__(self, max_entries: int = FIGURE_CACHE["max_entries"],
+                 single_flight: Optional[SingleFlight] = None):
+        """
+        Create an empty cache shared by every session in the process
+
+        Args:
+            max_entries: Chart specs kept; the least recently used is evicted
+            single_flight: Shares one build between sessions missing the same key
+        """
+        self.max_entries = max_entries
+        self.single_flight = single_flight or SingleFlight()
+        self.specs: "OrderedDict[str, Dict]" = OrderedDict()
+        # JSON size of each spec, measured once when it is stored
+        self.sizes: Dict[str, int] = {}
+        self.counters = Counter()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[go.Figure]:
+        """The cached chart for a key, or None"""
+        with self._lock:
+            spec = self.specs.get(key)
+            if spec is None:
+                self.counters["misses"] += 1
+                return None
+            self.specs.move_to_end(key)
+            self.counters["hits"] += 1
+        return go.Figure(spec)
+
+    def set(self, key: str, figure: BaseFigure) -> go.Figure:
+        """Store a built figure's spec under a key and return the figure"""
+        spec = figure.to_dict()
+        size = len(figure.to_json())
+        with self._lock:
+            self.specs[key] = spec
+            self.sizes[key] = size
+            self.specs.move_to_end(key)
+            while len(self.specs) > self.max_entries:
+                evicted, _ = self.specs.popitem(last=False)
+                del self.sizes[evicted]
+        return figure
+
+    def get_or_build(self, name: str, data: Any, theme: Any,
+                     build: Callable[[], Optional[BaseFigure]]) -> Optional[BaseFigure]:
+        """
+        The chart built from data with theme, calling build only on a miss
+
+        Args:
+            name: Which chart this is
+            data: Everything the chart is drawn from (JSON-like; DataFrames allowed), or a
+                version that changes whenever that data does, which is cheaper to hash
+            theme: Whatever styling the spec depends on
+            build: Builds the go.Figure from those inputs, or returns None on failure
+
+        Returns:
+            The chart, rebuilt from its cached spec on a hit, or None if build
+            failed (failures aren't cached)
+        """
+        key = figure_key(name, data, theme)
+        cached = self.get(key)
+        if cached is not None:
+            return cached
+
+        def build_and_store():
+            figure = build()
+            return None if figure is None else self.set(key, figure)
+        return self.single_flight.do(("figures", key), build_and_store)
+
+    def stats(self) -> Dict[str, int]:
+        """Cached charts, their total JSON size, and hits and misses since startup"""
+        with self._lock:
+            return {
+                "entries": len(self.specs),
+                "bytes": sum(self.sizes.values()),
+                "hits": self.counters["hits"],
+                "misses": self.counters["misses"]
+            }
@@ -0,0 +1,126 @@
+"""
+HTTP Cache Module
+Persists response bodies with their ETag / Last-Modified validators for conditional requests
+"""
+
+import hashlib
+import json
+import tempfile
+import time
+import requests
+from typing import Dict, Optional
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import HTTP_CACHE
+from .single_flight import SingleFlight
+
+class HttpCacheResponse:
+    """Body of a cached GET and how it was obtained"""
+
+    def __init__(self, url: str, content: bytes, status: str, fetched_at: float):
+        self.url = url
+        self.content = content
+        # "fetched" (200), "not_modified" (304 served from disk) or "stale" (upstream failed)
+        self.status = status
+        self.fetched_at = fetched_at
+
+    @property
+    def from_cache(self) -> bool:
+        return self.status != "fetched"
+
+    def json(self):
+        return json.loads(self.content)
+
+class HttpCache:
+    def __init__(self, directory: str = HTTP_CACHE["directory"], timeout: float = HTTP_CACHE["timeout"],
+                 single_flight: Optional[SingleFlight] = None):
+        """Open (or create) the on-disk response cache; concurrent GETs of a URL share one request"""
+        self.directory = directory
+        self.timeout = timeout
+        self.single_flight = single_flight or SingleFlight()
+        self.session = requests.Session()
+        os.makedirs(directory, exist_ok=True)
+
+    def _paths(self, url: str):
+        key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        base = os.path.join(self.directory, key)
+        return base + ".json", base + ".body"
+
+    def _load(self, url: str) -> Optional[Dict]:
+        """Read stored validators and body, or None if nothing usable is cached"""
+        meta_path, body_path = self._paths(url)
+        try:
+            with open(meta_path) as f:
+                meta = json.load(f)
+            with open(body_path, "rb") as f:
+                meta["content"] = f.read()
+        except (OSError, ValueError):
+            return None
+
+        # Guard against a body replaced by another process between the two reads
+        if meta.get("url") != url or hashlib.sha256(meta["content"]).hexdigest() != meta.get("sha256"):
+            return None
+        return meta
+
+    def _write_atomic(self, path: str, data: bytes):
+        fd, temp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(temp_path, path)
+
+    def _store(self, url: str, response: requests.Response, fetched_at: float):
+        meta_path, body_path = self._paths(url)
+        meta = {
+            "url": url,
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+            "sha256": hashlib.sha256(response.content).hexdigest(),
+            "fetched_at": fetched_at
+        }
+        # Body first, so the metadata never points at a body it doesn't describe
+        self._write_atomic(body_path, response.content)
+        self._write_atomic(meta_path, json.dumps(meta).encode("utf-8"))
+
+    def get(self, url: str, timeout: Optional[float] = None) -> HttpCacheResponse:
+        """
+        GET a URL, revalidating any stored copy with If-None-Match / If-Modified-Since
+
+        Args:
+            url: Resource to fetch
+            timeout: Request timeout in seconds (default: the cache's timeout)
+
+        Returns:
+            The response body; a 304 or an upstream failure serves the stored copy
+
+        Raises:
+            requests.RequestException: If the request fails and nothing is cached
+        """
+        return self.single_flight.do(("http_cache", url), lambda: self._get(url, timeout))
+
+    def _get(self, url: str, timeout: Optional[float]) -> HttpCacheResponse:
+        cached = self._load(url)
+        headers = {}
+        if cached:
+            if cached.get("etag"):
+                headers["If-None-Match"] = cached["etag"]
+            if cached.get("last_modified"):
+                headers["If-Modified-Since"] = cached["last_modified"]
+
+        now = time.time()
+        try:
+            response = self.session.get(url, headers=headers, timeout=timeout or self.timeout)
+            if response.status_code == 304 and cached:
+                return HttpCacheResponse(url, cached["content"], "not_modified", now)
+            response.raise_for_status()
+        except requests.RequestException:
+            if cached:
+                return HttpCacheResponse(url, cached["content"], "stale", cached["fetched_at"])
+            raise
+
+        if response.headers.get("ETag") or response.headers.get("Last-Modified"):
+            self._store(url, response, now)
+        return HttpCacheResponse(url, response.content, "fetched", now)
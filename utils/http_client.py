@@ -0,0 +1,190 @@
+"""
+HTTP Client Module
+Keep-alive connection pools per host with jittered retries and request timing
+"""
+
+import random
+import threading
+import time
+import requests
+from collections import deque
+from requests.adapters import HTTPAdapter
+from typing import Dict, List, Optional
+from urllib.parse import urlsplit
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import ADVISOR_HTTP
+
+# Statuses worth retrying: rate limited or a transient upstream failure
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# Longest Retry-After the client will honor before giving up on a retry
+MAX_RETRY_AFTER_SECONDS = 10.0
+
+class RequestCancelled(requests.RequestException):
+    """The caller cancelled the request before another attempt was sent"""
+
+class RequestTiming:
+    """Outcome and timing of one logical request (all attempts)"""
+
+    def __init__(self, host: str, method: str):
+        self.host = host
+        self.method = method
+        self.started = time.time()
+        self.attempts = 0
+        self.status: Optional[int] = None
+        # Seconds until response headers arrived, over all attempts and backoff sleeps
+        self.elapsed = 0.0
+        self.error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and self.status is not None and self.status < 400
+
+    def to_dict(self) -> Dict:
+        return {
+            "host": self.host,
+            "method": self.method,
+            "started": self.started,
+            "attempts": self.attempts,
+            "status": self.status,
+            "elapsed": self.elapsed,
+            "error": self.error
+        }
+
+class PooledHttpClient:
+    def __init__(self, pool_connections: int = ADVISOR_HTTP["pool_connections"],
+                 pool_maxsize: int = ADVISOR_HTTP["pool_maxsize"],
+                 retries: int = ADVISOR_HTTP["retries"],
+                 backoff_seconds: float = ADVISOR_HTTP["backoff_seconds"],
+                 backoff_max_seconds: float = ADVISOR_HTTP["backoff_max_seconds"],
+                 history_size: int = 500):
+        """
+        Create a client whose connections stay open between requests
+
+        Args:
+            pool_connections: Number of hosts to keep a connection pool for
+            pool_maxsize: Open connections kept per host
+            retries: Extra attempts after a 429/5xx or connection failure
+            backoff_seconds: Base delay, doubled each retry (full jitter)
+            backoff_max_seconds: Cap on a single backoff delay
+            history_size: Recent requests kept for timing stats
+        """
+        self.retries = retries
+        self.backoff_seconds = backoff_seconds
+        self.backoff_max_seconds = backoff_max_seconds
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        self.history = deque(maxlen=history_size)
+        self._lock = threading.Lock()
+
+    def _backoff(self, attempt: int, response: Optional[requests.Response]) -> float:
+        """Delay before retry number `attempt` (1-based), honoring a numeric Retry-After"""
+        if response is not None:
+            retry_after = response.headers.get("Retry-After", "")
+            try:
+                return min(float(retry_after), MAX_RETRY_AFTER_SECONDS)
+            except ValueError:
+                pass
+        ceiling = min(self.backoff_max_seconds, self.backoff_seconds * 2 ** (attempt - 1))
+        return random.uniform(0, ceiling)
+
+    def request(self, method: str, url: str, cancel: Optional[threading.Event] = None,
+                **kwargs) -> requests.Response:
+        """
+        Send a request through the pooled session, retrying 429/5xx with jittered backoff
+
+        Takes the same keyword arguments as requests.request. Timeouts are not
+        retried, since another attempt would double the wait the caller bounded.
+        Once `cancel` is set no further attempt is sent and backoff stops early.
+
+        Returns:
+            The final response (which may still be an error status after the last retry)
+
+        Raises:
+            RequestCancelled: If cancel was set before an attempt could be sent
+            requests.RequestException: If the last attempt fails without a response
+        """
+        timing = RequestTiming(urlsplit(url).netloc, method.upper())
+        start = time.perf_counter()
+        try:
+            for attempt in range(self.retries + 1):
+                if cancel is not None and cancel.is_set():
+                    raise RequestCancelled(f"{method.upper()} {url} cancelled")
+                timing.attempts = attempt + 1
+                response = None
+                try:
+                    response = self.session.request(method, url, **kwargs)
+                except requests.ConnectionError as e:
+                    if attempt == self.retries or isinstance(e, requests.ConnectTimeout):
+                        raise
+                else:
+                    timing.status = response.status_code
+                    if response.status_code not in RETRY_STATUSES or attempt == self.retries:
+                        return response
+
+                delay = self._backoff(attempt + 1, response)
+                if response is not None:
+                    # Release the connection back to the pool before sleeping
+                    response.close()
+                if cancel is not None:
+                    cancel.wait(delay)
+                else:
+                    time.sleep(delay)
+        except requests.RequestException as e:
+            timing.error = type(e).__name__
+            raise
+        finally:
+            timing.elapsed = time.perf_counter() - start
+            with self._lock:
+                self.history.append(timing)
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        return self.request("POST", url, **kwargs)
+
+    def recent(self, limit: int = 50) -> List[Dict]:
+        """Most recent request timings, newest first"""
+        with self._lock:
+            return [timing.to_dict() for timing in list(self.history)[-limit:][::-1]]
+
+    def stats(self) -> Dict[str, Dict]:
+        """
+        Per-host summary of recent requests
+
+        Returns:
+            host -> requests, errors (error status or exception), retries,
+            and mean / p50 / p95 seconds to response headers
+        """
+        with self._lock:
+            timings = list(self.history)
+
+        by_host: Dict[str, List[RequestTiming]] = {}
+        for timing in timings:
+            by_host.setdefault(timing.host, []).append(timing)
+
+        summary = {}
+        for host, host_timings in by_host.items():
+            elapsed = sorted(timing.elapsed for timing in host_timings)
+            summary[host] = {
+                "requests": len(host_timings),
+                "errors": sum(not timing.ok for timing in host_timings),
+                "retries": sum(timing.attempts - 1 for timing in host_timings),
+                "mean_seconds": sum(elapsed) / len(elapsed),
+                "p50_seconds": elapsed[int(0.5 * (len(elapsed) - 1))],
+                "p95_seconds": elapsed[int(0.95 * (len(elapsed) - 1))]
+            }
+        return summary
+
+    def close(self):
+        self.session.close()
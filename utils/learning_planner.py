@@ -0,0 +1,168 @@
+"""
+Learning Planner Module
+Picks the skills that raise readiness the most within a learning-hour budget
+"""
+
+import numpy as np
+import pandas as pd
+from functools import reduce
+from math import gcd
+from typing import Dict, List
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import INDUSTRY_SKILLS_PATH
+from .readiness_score import ReadinessCalculator
+
+# Knapsack values are readiness points on the 0-100 score scale:
+#   value = score_gain + importance_weight * IMPORTANCE_SHARE[importance]
+# score_gain is what the readiness model projects a skill adds; catalog skills
+# it does not track gain 0 there and are ranked by importance alone. The default
+# weight of 1 point is half the smallest gain of any tracked skill (2 points for
+# a foundational one), so importance only breaks ties and never outranks a
+# skill that moves the score.
+IMPORTANCE_SHARE = {
+    "Essential": 1.0,
+    "Important": 0.5,
+    "Optional": 0.25
+}
+IMPORTANCE_WEIGHT = 1.0
+
+# Above this many DP cells (skills x budget slots) fall back to greedy
+MAX_DP_CELLS = 4_000_000
+
+class LearningPlanner:
+    def __init__(self, skills_path: str = INDUSTRY_SKILLS_PATH, calculator: ReadinessCalculator = None):
+        """Initialize planner with the industry skill catalog"""
+        self.calculator = calculator or ReadinessCalculator()
+        self.industry_skills = self._load_industry_skills(skills_path)
+
+    def _load_industry_skills(self, skills_path: str) -> pd.DataFrame:
+        """Load skill catalog with learning hours and importance"""
+        skills = pd.read_csv(skills_path)
+        skills["industry_key"] = skills["industry"].str.upper()
+        skills["learning_hours"] = skills["learning_hours"].astype(int)
+        return skills
+
+    def optimize_learning_plan(self, user_profile: Dict, target_industry: str, hour_budget: int,
+                               importance_weight: float = IMPORTANCE_WEIGHT) -> Dict:
+        """
+        Choose the skills that maximize readiness gain within an hour budget
+
+        Args:
+            user_profile: User's profile with skills, experience, education
+            target_industry: Target STEM industry
+            hour_budget: Total learning hours available
+            importance_weight: Readiness points credited to an Essential skill on top of its score gain
+
+        Returns:
+            Selected skills, hours used and projected readiness
+        """
+        industry = target_industry.upper()
+        user_skills = user_profile.get("skills", {})
+
+        all_user_skills = []
+        for category, skills in user_skills.items():
+            all_user_skills.extend([s.lower() for s in skills])
+
+        catalog = self.industry_skills[self.industry_skills["industry_key"] == industry]
+        catalog = catalog[~catalog["skill_name"].str.lower().isin(all_user_skills)]
+        catalog = catalog[(catalog["learning_hours"] > 0) & (catalog["learning_hours"] <= hour_budget)]
+
+        skill_names = catalog["skill_name"].tolist()
+        gains = self.calculator.calculate_marginal_gains(user_profile, industry, candidate_skills=skill_names)
+        gain_by_skill = {gain["candidate"]: gain["score_gain"] for gain in gains}
+
+        hours = catalog["learning_hours"].to_numpy()
+        importance = catalog["importance"].to_numpy()
+        difficulty = catalog["difficulty"].to_numpy()
+        score_gains = np.array([gain_by_skill.get(name, 0.0) for name in skill_names])
+        values = score_gains + importance_weight * np.array([IMPORTANCE_SHARE.get(level, 0.0) for level in importance])
+
+        # Learning hours come in coarse steps, so shrink the DP table by their GCD
+        unit = reduce(gcd, hours.tolist()) if len(hours) else 1
+        if len(skill_names) * (hour_budget // unit + 1) > MAX_DP_CELLS:
+            selected, method = self._solve_greedy(hours, values, hour_budget), "greedy"
+        else:
+            selected, method = self._solve_knapsack(hours // unit, values, hour_budget // unit), "dynamic_programming"
+
+        plan = [
+            {
+                "skill": skill_names[i],
+                "learning_hours": int(hours[i]),
+                "importance": importance[i],
+                "difficulty": difficulty[i],
+                "score_gain": float(score_gains[i]),
+                "value": round(float(values[i]), 2)
+            }
+            for i in selected
+        ]
+        plan.sort(key=lambda item: (-item["score_gain"], item["learning_hours"]))
+
+        # Re-score once with the chosen skills, since gains cap at 100
+        planned_profile = dict(user_profile)
+        planned_profile["skills"] = dict(user_skills)
+        planned_profile["skills"]["planned"] = [item["skill"] for item in plan]
+        current_score = self.calculator.calculate_readiness_score(user_profile, industry)["overall_score"]
+        projected_score = self.calculator.calculate_readiness_score(planned_profile, industry)["overall_score"]
+
+        return {
+            "industry": industry,
+            "hour_budget": hour_budget,
+            "total_hours": int(sum(item["learning_hours"] for item in plan)),
+            "skills": plan,
+            "current_score": current_score,
+            "projected_score": projected_score,
+            "score_gain": round(projected_score - current_score, 1),
+            "method": method
+        }
+
+    def _solve_knapsack(self, weights: np.ndarray, values: np.ndarray, capacity: int) -> List[int]:
+        """Exact 0/1 knapsack over integer budget slots"""
+        if len(weights) == 0:
+            return []
+
+        best = np.zeros(capacity + 1)
+        taken = np.zeros((len(weights), capacity + 1), dtype=bool)
+
+        for i, (weight, value) in enumerate(zip(weights, values)):
+            if value <= 0 or weight > capacity:
+                continue
+            candidate = best[:capacity + 1 - weight] + value
+            taken[i, weight:] = candidate > best[weight:]
+            np.maximum(best[weight:], candidate, out=best[weight:])
+
+        selected = []
+        slot = int(np.argmax(best))
+        for i in range(len(weights) - 1, -1, -1):
+            if taken[i, slot]:
+                selected.append(i)
+                slot -= weights[i]
+
+        return selected[::-1]
+
+    def _solve_greedy(self, hours: np.ndarray, values: np.ndarray, hour_budget: int) -> List[int]:
+        """Value-per-hour greedy fill for catalogs too large for the DP table"""
+        if len(hours) == 0:
+            return []
+
+        order = np.argsort(-(values / hours), kind="stable")
+
+        selected = []
+        remaining = hour_budget
+        for i in order:
+            if values[i] <= 0:
+                break
+            if hours[i] <= remaining:
+                selected.append(int(i))
+                remaining -= hours[i]
+
+        # Classic 1/2-approximation guard: a single high-value skill may beat the fill
+        best_single = int(np.argmax(values))
+        if values[best_single] > values[selected].sum():
+            selected = [best_single]
+
+        return sorted(selected)
@@ -0,0 +1,262 @@
+"""
+Market Data Module
+Fetches job market data from all configured sources concurrently
+"""
+
+import asyncio
+import logging
+import random
+import requests
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import MARKET_DATA_SOURCES, MARKET_DATA_REFRESH_SECONDS
+from .market_history import MarketHistoryStore
+from .single_flight import SingleFlight
+
+logger = logging.getLogger(__name__)
+
+# Baseline figures used for any field no source reports
+BASELINE_JOB_DATA = {
+    'ai_ml_jobs': {
+        'count': 15420,
+        'growth_rate': 23.5,
+        'avg_salary': 145000,
+        'top_skills': ['Python', 'TensorFlow', 'PyTorch', 'Machine Learning', 'Deep Learning'],
+        'locations': ['San Francisco', 'Seattle', 'New York', 'Austin', 'Boston'],
+        'source': 'LinkedIn API, Indeed API, Glassdoor API'
+    },
+    'data_science_jobs': {
+        'count': 12850,
+        'growth_rate': 18.2,
+        'avg_salary': 125000,
+        'top_skills': ['Python', 'SQL', 'R', 'Tableau', 'Statistics'],
+        'locations': ['San Francisco', 'New York', 'Chicago', 'Los Angeles', 'Denver'],
+        'source': 'Bureau of Labor Statistics, Kaggle Jobs, Stack Overflow'
+    },
+    'cybersecurity_jobs': {
+        'count': 9340,
+        'growth_rate': 15.8,
+        'avg_salary': 110000,
+        'top_skills': ['Network Security', 'Penetration Testing', 'CISSP', 'Incident Response'],
+        'locations': ['Washington DC', 'San Francisco', 'Austin', 'New York', 'Atlanta'],
+        'source': 'CyberSeek.org, SANS Institute, ISACA'
+    },
+    'cloud_jobs': {
+        'count': 18750,
+        'growth_rate': 28.3,
+        'avg_salary': 135000,
+        'top_skills': ['AWS', 'Azure', 'Kubernetes', 'Docker', 'DevOps'],
+        'locations': ['Seattle', 'San Francisco', 'Austin', 'Raleigh', 'Boston'],
+        'source': 'AWS Jobs Portal, Azure Careers, Google Cloud'
+    },
+    'biotech_jobs': {
+        'count': 6720,
+        'growth_rate': 12.4,
+        'avg_salary': 95000,
+        'top_skills': ['Bioinformatics', 'R', 'Python', 'CRISPR', 'Genomics'],
+        'locations': ['Boston', 'San Francisco', 'San Diego', 'Research Triangle', 'Philadelphia'],
+        'source': 'BioPharma Dive, Nature Careers, Science Careers'
+    }
+}
+
+NUMERIC_FIELDS = ('count', 'growth_rate', 'avg_salary')
+LIST_FIELDS = ('top_skills', 'locations')
+
+def _simulated_baseline(field: str) -> Dict:
+    """Baseline figures with small random drift, as shown when no source is live"""
+    base = BASELINE_JOB_DATA[field]
+    drift = {'count': base['count'] * 0.01, 'growth_rate': 2.0, 'avg_salary': base['avg_salary'] * 0.04}
+
+    data = dict(base)
+    data['count'] = int(base['count'] + random.uniform(-drift['count'], drift['count']))
+    data['growth_rate'] = base['growth_rate'] + random.uniform(-drift['growth_rate'], drift['growth_rate'])
+    data['avg_salary'] = int(base['avg_salary'] + random.uniform(-drift['avg_salary'], drift['avg_salary']))
+    data['live'] = False
+    return data
+
+def _fetch_source(source: Dict) -> Dict:
+    """Blocking HTTP fetch of one source, run on the executor"""
+    response = requests.get(source["url"], timeout=source["timeout"])
+    response.raise_for_status()
+    payload = response.json()
+    if not isinstance(payload, dict):
+        raise ValueError("expected a JSON object")
+    return payload
+
+async def _fetch_with_timeout(loop, executor, source: Dict) -> Tuple[str, str, Optional[Dict]]:
+    """Fetch one source, turning timeouts and errors into a status instead of raising"""
+    try:
+        payload = await asyncio.wait_for(
+            loop.run_in_executor(executor, _fetch_source, source),
+            timeout=source["timeout"]
+        )
+        return source["name"], "ok", payload
+    except (asyncio.TimeoutError, requests.Timeout):
+        return source["name"], "timeout", None
+    except (requests.RequestException, ValueError):
+        return source["name"], "error", None
+
+async def fetch_all_sources(sources: List[Dict]) -> List[Tuple[str, str, Optional[Dict]]]:
+    """
+    Fan out to every configured source at once
+
+    Total latency is bounded by the slowest source's timeout rather
+    than the sum of all of them.
+
+    Returns:
+        List of (source name, status, payload) in configuration order
+    """
+    active = [source for source in sources if source.get("url")]
+    if not active:
+        return []
+
+    loop = asyncio.get_running_loop()
+    executor = ThreadPoolExecutor(max_workers=len(active))
+    try:
+        return await asyncio.gather(*[
+            _fetch_with_timeout(loop, executor, source) for source in active
+        ])
+    finally:
+        # Don't wait on requests that already timed out; their threads finish on their own
+        executor.shutdown(wait=False)
+
+def merge_source_data(results: List[Tuple[str, str, Optional[Dict]]]) -> Dict:
+    """
+    Combine per-source payloads into the job data dictionary the app displays
+
+    Numeric figures are averaged over the sources that report them; lists
+    come from the first source that has them. Fields no source reports keep
+    their baseline values.
+    """
+    job_data = {}
+
+    for field in BASELINE_JOB_DATA:
+        reports = [
+            (name, payload[field]) for name, status, payload in results
+            if status == "ok" and isinstance(payload.get(field), dict)
+        ]
+        if not reports:
+            job_data[field] = _simulated_baseline(field)
+            continue
+
+        data = dict(BASELINE_JOB_DATA[field])
+        for key in NUMERIC_FIELDS:
+            values = [report[key] for _, report in reports if isinstance(report.get(key), (int, float))]
+            if values:
+                data[key] = sum(values) / len(values)
+        data['count'] = int(data['count'])
+        data['avg_salary'] = int(data['avg_salary'])
+
+        for key in LIST_FIELDS:
+            lists = [report[key] for _, report in reports if isinstance(report.get(key), list)]
+            if lists:
+                data[key] = lists[0]
+
+        data['source'] = ', '.join(name for name, _ in reports)
+        data['live'] = True
+        job_data[field] = data
+
+    return job_data
+
+def _build_job_data(results: List[Tuple[str, str, Optional[Dict]]], sources: List[Dict]) -> Dict:
+    """Merge source results and add the summary fields the app displays"""
+    job_data = merge_source_data(results)
+
+    job_data['last_updated'] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    job_data['market_sentiment'] = random.choice(['Bullish', 'Optimistic', 'Stable', 'Growing'])
+    job_data['total_stem_jobs'] = sum([field['count'] for field in job_data.values() if isinstance(field, dict) and 'count' in field])
+
+    status = {source["name"]: "not configured" for source in sources}
+    status.update({name: result for name, result, _ in results})
+    job_data['source_status'] = status
+
+    return job_data
+
+def fetch_market_data(sources: List[Dict] = MARKET_DATA_SOURCES) -> Dict:
+    """
+    Fetch and merge job market data from all sources concurrently
+
+    Args:
+        sources: Source configs with name, url and timeout
+
+    Returns:
+        Job data keyed by field, plus last_updated, market_sentiment,
+        total_stem_jobs and the status of each configured source
+    """
+    results = asyncio.run(fetch_all_sources(sources))
+    return _build_job_data(results, sources)
+
+class MarketDataRefresher:
+    def __init__(self, interval_seconds: int = MARKET_DATA_REFRESH_SECONDS,
+                 sources: List[Dict] = MARKET_DATA_SOURCES,
+                 history: Optional[MarketHistoryStore] = None,
+                 single_flight: Optional[SingleFlight] = None):
+        """
+        Keep one market data snapshot fresh for every session in the process
+
+        Starts from baseline figures so the first page load never waits
+        on the network. Each fetched snapshot is also appended to history.
+        Overlapping refresh() calls share one fetch through single_flight.
+        """
+        self.interval_seconds = interval_seconds
+        self.sources = sources
+        self.history = history
+        self.single_flight = single_flight or SingleFlight()
+        self._snapshot = _build_job_data([], sources)
+        self._stop = threading.Event()
+        self._thread = None
+        self._lock = threading.Lock()
+
+    @property
+    def snapshot(self) -> Dict:
+        """Latest job data; treat as read-only since it is shared across sessions"""
+        return self._snapshot
+
+    def start(self):
+        """Start the background refresh thread if it isn't already running"""
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="market-data-refresher", daemon=True)
+            self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None):
+        """Stop refreshing; the last snapshot stays available"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def refresh(self):
+        """Fetch all sources and swap in the new snapshot; a refresh already running is joined"""
+        self.single_flight.do(("market_data", id(self)), self._refresh)
+
+    def _refresh(self):
+        """Fetch all sources and swap in the new snapshot in one assignment"""
+        try:
+            snapshot = fetch_market_data(self.sources)
+        except Exception:
+            # Keep serving the previous snapshot until the next attempt
+            logger.exception("Market data refresh failed")
+            return
+
+        # Recorded first, so history read under a snapshot's version already includes it
+        if self.history is not None:
+            try:
+                self.history.append(snapshot)
+            except Exception:
+                logger.exception("Recording market history failed")
+        self._snapshot = snapshot
+
+    def _run(self):
+        self.refresh()
+        while not self._stop.wait(self.interval_seconds):
+            self.refresh()
@@ -0,0 +1,210 @@
+"""
+Market History Module
+Stores market data snapshots as a time series with hourly and daily rollups
+"""
+
+import hashlib
+import sqlite3
+import threading
+import time
+import pandas as pd
+from typing import Dict, List, Optional
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import MARKET_HISTORY
+
+METRICS = ("count", "growth_rate", "avg_salary")
+
+# Table and bucket width (seconds) for each resolution
+RESOLUTIONS = {
+    "raw": ("market_raw", None),
+    "hour": ("market_hourly", 3600),
+    "day": ("market_daily", 86400)
+}
+
+# Spans (seconds) up to which "auto" queries use each resolution
+AUTO_RESOLUTION_SPANS = [
+    ("raw", 2 * 86400),
+    ("hour", 90 * 86400)
+]
+
+def _snapshot_id(version: str, metrics: tuple) -> str:
+    """Identifies a field's figures in one snapshot, whichever process records it"""
+    key = "\x1f".join([version] + [repr(value) for value in metrics])
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()[:16]
+
+class MarketHistoryStore:
+    def __init__(self, path: str = MARKET_HISTORY["path"],
+                 raw_retention_days: int = MARKET_HISTORY["raw_retention_days"],
+                 hourly_retention_days: int = MARKET_HISTORY["hourly_retention_days"]):
+        """Open (or create) the SQLite time-series store"""
+        self.path = path
+        self.retention = {
+            "raw": raw_retention_days * 86400,
+            "hour": hourly_retention_days * 86400
+        }
+        self._local = threading.local()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        conn = self._connection()
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS market_raw (
+                field TEXT NOT NULL,
+                ts REAL NOT NULL,
+                count REAL,
+                growth_rate REAL,
+                avg_salary REAL,
+                snapshot TEXT NOT NULL
+            )
+        """)
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_market_raw ON market_raw (field, ts)")
+        # Every server process appends what its own refresher fetched; the same
+        # snapshot seen by several of them is recorded (and rolled up) once
+        conn.execute("CREATE UNIQUE INDEX IF NOT EXISTS idx_market_raw_snapshot ON market_raw (field, snapshot)")
+
+        # Rollups keep sums and a sample count so averages stay exact as points arrive
+        for table in ("market_hourly", "market_daily"):
+            conn.execute(f"""
+                CREATE TABLE IF NOT EXISTS {table} (
+                    field TEXT NOT NULL,
+                    bucket INTEGER NOT NULL,
+                    samples INTEGER NOT NULL,
+                    count_sum REAL NOT NULL,
+                    growth_rate_sum REAL NOT NULL,
+                    avg_salary_sum REAL NOT NULL,
+                    PRIMARY KEY (field, bucket)
+                )
+            """)
+
+    def _connection(self) -> sqlite3.Connection:
+        """One connection per thread, so the refresher can write while sessions read"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=10, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def append(self, job_data: Dict, timestamp: Optional[float] = None) -> int:
+        """
+        Record one market data snapshot
+
+        Only fields reported by a live source are stored, so the history
+        never mixes in simulated baseline figures. A field already recorded
+        from the same snapshot (same last_updated and figures, by this or
+        another process) is skipped.
+
+        Args:
+            job_data: Snapshot as returned by fetch_market_data
+            timestamp: Unix time of the snapshot (default: now)
+
+        Returns:
+            Number of fields recorded
+        """
+        ts = time.time() if timestamp is None else timestamp
+        version = str(job_data.get("last_updated") or ts)
+        rows = [
+            (field, ts, float(data["count"]), float(data["growth_rate"]), float(data["avg_salary"]))
+            for field, data in job_data.items()
+            if isinstance(data, dict) and data.get("live") and all(metric in data for metric in METRICS)
+        ]
+        if not rows:
+            return 0
+
+        conn = self._connection()
+        # Take the write lock up front so concurrent appends serialize instead of failing to upgrade
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            inserted = []
+            for row in rows:
+                cursor = conn.execute(
+                    "INSERT OR IGNORE INTO market_raw (field, ts, count, growth_rate, avg_salary, snapshot) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    row + (_snapshot_id(version, row[2:]),)
+                )
+                if cursor.rowcount:
+                    inserted.append(row)
+            rows = inserted
+
+            for resolution in ("hour", "day"):
+                table, width = RESOLUTIONS[resolution]
+                conn.executemany(
+                    f"INSERT INTO {table} VALUES (?, ?, 1, ?, ?, ?) "
+                    "ON CONFLICT (field, bucket) DO UPDATE SET "
+                    "samples = samples + 1, count_sum = count_sum + excluded.count_sum, "
+                    "growth_rate_sum = growth_rate_sum + excluded.growth_rate_sum, "
+                    "avg_salary_sum = avg_salary_sum + excluded.avg_salary_sum",
+                    [(field, int(ts // width) * width, count, growth, salary) for field, ts, count, growth, salary in rows]
+                )
+            self._prune(conn, ts)
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
+        return len(rows)
+
+    def _prune(self, conn: sqlite3.Connection, now: float):
+        """Drop raw and hourly points past their retention; daily rollups are kept"""
+        conn.execute("DELETE FROM market_raw WHERE ts < ?", (now - self.retention["raw"],))
+        conn.execute("DELETE FROM market_hourly WHERE bucket < ?", (now - self.retention["hour"],))
+
+    def choose_resolution(self, start: float, end: float) -> str:
+        """Finest resolution that covers the range and keeps the point count small"""
+        oldest_needed = time.time() - start
+        for resolution, max_span in AUTO_RESOLUTION_SPANS:
+            if end - start <= max_span and oldest_needed <= self.retention[resolution]:
+                return resolution
+        return "day"
+
+    def query(self, fields: Optional[List[str]] = None, start: Optional[float] = None,
+              end: Optional[float] = None, resolution: str = "auto") -> pd.DataFrame:
+        """
+        Read a time range of snapshots, downsampled to raw, hourly or daily points
+
+        Args:
+            fields: Job fields to include (default: all)
+            start: Range start as Unix time (default: 30 days ago)
+            end: Range end as Unix time (default: now)
+            resolution: "raw", "hour", "day" or "auto" to pick from the span
+
+        Returns:
+            DataFrame with timestamp, field, count, growth_rate, avg_salary
+        """
+        end = time.time() if end is None else end
+        start = end - 30 * 86400 if start is None else start
+        if resolution == "auto":
+            resolution = self.choose_resolution(start, end)
+        if resolution not in RESOLUTIONS:
+            raise ValueError(f"Unknown resolution: {resolution}")
+
+        table, width = RESOLUTIONS[resolution]
+        if width is None:
+            sql = f"SELECT ts AS timestamp, field, count, growth_rate, avg_salary FROM {table} WHERE ts BETWEEN ? AND ?"
+        else:
+            sql = (
+                f"SELECT bucket AS timestamp, field, count_sum / samples AS count, "
+                f"growth_rate_sum / samples AS growth_rate, avg_salary_sum / samples AS avg_salary "
+                f"FROM {table} WHERE bucket BETWEEN ? AND ?"
+            )
+            # Include the bucket that contains the range start
+            start = int(start // width) * width
+        params = [start, end]
+
+        if fields:
+            sql += f" AND field IN ({', '.join('?' * len(fields))})"
+            params.extend(fields)
+        sql += " ORDER BY field, timestamp"
+
+        history = pd.read_sql_query(sql, self._connection(), params=params)
+        history["timestamp"] = pd.to_datetime(history["timestamp"], unit="s")
+        history.attrs["resolution"] = resolution
+        return history
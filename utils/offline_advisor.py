@@ -0,0 +1,174 @@
+"""
+Offline Advisor Module
+Composes a structured career answer from the platform's own data, without any network call
+"""
+
+import re
+from typing import Dict, List, Optional
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import FUTURE_INDUSTRIES, STEM_FIELDS
+from .career_mapper import CareerMapper
+from .readiness_score import ReadinessCalculator
+from .skill_extractor import SkillExtractor
+
+# Phrases that identify the asker's current role, checked in order (CareerMapper role keys)
+ROLE_KEYWORDS = {
+    "software_developer": ["software developer", "software engineer", "developer", "programmer", "coder"],
+    "data_analyst": ["data analyst", "business analyst", "analyst"],
+    "accountant": ["accountant", "accounting", "bookkeeper", "auditor"],
+    "marketing_professional": ["marketing", "marketer", "advertising"],
+    "healthcare_professional": ["nurse", "doctor", "physician", "pharmacist", "healthcare", "clinician"],
+    "teacher": ["teacher", "teaching", "educator", "lecturer"],
+    "researcher": ["researcher", "research scientist", "scientist", "phd"],
+    "engineer": ["engineer", "engineering"]
+}
+
+# Market snapshot field and STEM field describing each target industry, where there is one
+INDUSTRY_DATA = {
+    "AI": ("ai_ml_jobs", "AI & Machine Learning"),
+    "CYBERSECURITY": ("cybersecurity_jobs", "Cybersecurity"),
+    "BIOTECH": ("biotech_jobs", "Biotechnology")
+}
+
+OFFLINE_NOTICE = ("_The AI advisor can't be reached right now, so this answer was put together "
+                  "from the platform's own career, course and market data._")
+
+# Phrases after which the asker describes their own role ("I'm a marketing manager")
+SELF_DESCRIPTION = re.compile(r"\b(?:i m|im|i am|as an?|currently an?|work(?:ing)? (?:as|in)|background in|career in|years (?:as|in))\b")
+
+# Words after a self-description that are searched for a role
+ROLE_WINDOW_WORDS = 5
+
+def detect_current_role(text: str) -> Optional[str]:
+    """
+    CareerMapper role key for the role the asker says they have, or None
+
+    Only roles mentioned right after a self-description count, so a target
+    role ("how much does a security analyst earn") isn't taken for theirs.
+    """
+    words = " ".join(re.findall(r"[a-z0-9]+", text.lower()))
+    for cue in SELF_DESCRIPTION.finditer(words):
+        window = f" {' '.join(words[cue.end():].split()[:ROLE_WINDOW_WORDS])} "
+        for role, keywords in ROLE_KEYWORDS.items():
+            if any(f" {keyword} " in window for keyword in keywords):
+                return role
+    return None
+
+def _industry_name(industry: str) -> str:
+    """Display name of an industry key ("RENEWABLE" -> "Renewable Energy")"""
+    return FUTURE_INDUSTRIES.get(industry, {}).get("name", industry)
+
+class OfflineAdvisor:
+    def __init__(self, career_mapper: Optional[CareerMapper] = None,
+                 readiness_calculator: Optional[ReadinessCalculator] = None,
+                 skill_extractor: Optional[SkillExtractor] = None):
+        """Create the engine around the platform's scoring tools"""
+        self.career_mapper = career_mapper or CareerMapper()
+        self.readiness_calculator = readiness_calculator or ReadinessCalculator()
+        self.skill_extractor = skill_extractor or SkillExtractor()
+
+    def answer(self, question: str, target_industry: str, context: str = "general",
+               market: Optional[Dict] = None, recommender=None) -> str:
+        """
+        Markdown answer to a career question, built only from local data
+
+        Args:
+            question: The user's question
+            target_industry: Industry key the question is about (e.g. "AI")
+            context: Advisor context type; salary questions lead with pay figures
+            market: Latest market snapshot, if any
+            recommender: CourseRecommender used to pick courses for the skill gaps
+
+        Returns:
+            Markdown with the transition outlook, skill gaps, courses, market
+            figures and next steps
+        """
+        role = detect_current_role(question)
+        profile = {"skills": self.skill_extractor.extract_skills(question), "current_role": role or ""}
+        readiness = self.readiness_calculator.calculate_readiness_score(profile, target_industry)
+        transition = self.career_mapper.map_career_transition(role or "career changer", target_industry)
+
+        sections = [
+            self._outlook_section(role, target_industry, transition, readiness),
+            self._gaps_section(readiness, transition),
+            self._courses_section(readiness["gaps"], target_industry, recommender),
+            self._market_section(target_industry, market)
+        ]
+        if context == "salary_negotiation":
+            # Pay figures are what the question is about
+            sections.insert(0, sections.pop())
+        sections.append(self._next_steps_section(readiness))
+
+        return "\n\n".join([OFFLINE_NOTICE] + [section for section in sections if section])
+
+    def _outlook_section(self, role: Optional[str], industry: str, transition: Dict, readiness: Dict) -> str:
+        industry_name = _industry_name(industry)
+        lines = []
+        if role:
+            lines.append(f"### Moving from {role.replace('_', ' ').title()} into {industry_name}")
+            lines.append(f"- **Transition score:** {transition['transition_score'] * 100:.0f}/100 "
+                         f"({transition['difficulty']}, typically {transition['estimated_duration']})")
+            if transition["transferable_skills"]:
+                lines.append(f"- **Skills that carry over:** {', '.join(transition['transferable_skills'][:4])}")
+        else:
+            lines.append(f"### Getting into {industry_name}")
+        lines.append(f"- **Readiness from the skills you mentioned:** {readiness['overall_score']:.0f}/100 "
+                     f"({readiness['readiness_level']}, about {readiness['time_to_ready']} to job-ready)")
+        lines.append(f"- **Roles to aim for:** {', '.join(transition['potential_roles'][:4])}")
+        return "\n".join(lines)
+
+    def _gaps_section(self, readiness: Dict, transition: Dict) -> str:
+        if not readiness["gaps"]:
+            return ""
+        lines = ["### Skills to build"]
+        lines += [f"- {gap}" for gap in readiness["gaps"]]
+        steps = transition["career_path"]
+        if steps:
+            lines.append("")
+            lines.append("Suggested path: " + " → ".join(f"{step['title']} ({step['duration']})" for step in steps))
+        return "\n".join(lines)
+
+    def _courses_section(self, gaps: List[str], industry: str, recommender) -> str:
+        if recommender is None or not gaps:
+            return ""
+        recommendations = recommender.recommend(gaps, top_k=3, industry=industry)
+        if not recommendations["courses"]:
+            recommendations = recommender.recommend(gaps, top_k=3)
+        if not recommendations["courses"]:
+            return ""
+
+        lines = ["### Courses that close those gaps"]
+        for course in recommendations["courses"]:
+            price = "Free" if course["price_usd"] == 0 else f"${course['price_usd']:,.0f}"
+            lines.append(f"- [{course['course_name']}]({course['url']}) · {course['platform']} · {course['difficulty']} · "
+                         f"{course['duration_weeks']} weeks · {price} · ⭐ {course['rating']} — covers {', '.join(course['covers'])}")
+        return "\n".join(lines)
+
+    def _market_section(self, industry: str, market: Optional[Dict]) -> str:
+        market_key, field_name = INDUSTRY_DATA.get(industry, (None, None))
+        lines = []
+        data = (market or {}).get(market_key)
+        if isinstance(data, dict):
+            freshness = "live" if data.get("live") else "baseline estimate"
+            lines.append(f"- **Demand:** {data['count']:,} open roles, growing {data['growth_rate']:.1f}% a year "
+                         f"({freshness}, updated {market.get('last_updated', 'recently')})")
+            lines.append(f"- **Average salary:** ${data['avg_salary']:,}")
+            if data.get("top_skills"):
+                lines.append(f"- **Skills employers ask for most:** {', '.join(data['top_skills'])}")
+            if data.get("locations"):
+                lines.append(f"- **Hiring hubs:** {', '.join(data['locations'])}")
+        field = STEM_FIELDS.get(field_name)
+        if field:
+            lines.append(f"- **{field_name} field:** average salary ${field['avg_salary']:,}, growth {field['growth']}")
+        if not lines:
+            return ""
+        return "\n".join([f"### {_industry_name(industry)} market"] + lines)
+
+    def _next_steps_section(self, readiness: Dict) -> str:
+        steps = readiness["next_steps"]
+        return "\n".join(["### Next steps"] + [f"{i}. {step}" for i, step in enumerate(steps, 1)])
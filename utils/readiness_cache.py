@@ -0,0 +1,182 @@
+"""
+Readiness Cache Module
+Persists readiness assessments on disk, keyed by a canonical profile hash
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from typing import Dict, Optional
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import READINESS_CACHE
+from .readiness_score import ReadinessCalculator, SCORING_MODEL_VERSION
+
+# Run TTL and size eviction once every this many writes
+PRUNE_INTERVAL = 200
+
+def canonical_profile(user_profile: Dict, target_industry: str) -> Dict:
+    """
+    Reduce a profile to the fields the readiness score depends on
+
+    Two profiles with the same canonical form always produce the same
+    assessment, regardless of skill ordering, category names or casing.
+    """
+    all_skills = []
+    for category, skills in user_profile.get("skills", {}).items():
+        all_skills.extend(s.strip().lower() for s in skills)
+
+    return {
+        "industry": target_industry,
+        "skills": sorted(all_skills),
+        "experience_years": float(user_profile.get("experience_years", 0) or 0),
+        "education_level": user_profile.get("education_level", "").strip().lower(),
+        "current_role": user_profile.get("current_role", "").strip().lower().replace(" ", "_"),
+        # Only the number of projects affects the score
+        "projects": len(user_profile.get("projects", [])),
+        "certifications": sorted(c.strip().lower() for c in user_profile.get("certifications", []))
+    }
+
+def scoring_profile(canonical: Dict) -> Dict:
+    """
+    Rebuild a profile the calculator accepts from a canonical one
+
+    Scoring this instead of the raw profile guarantees that every profile
+    sharing a cache key also shares the assessment stored under it.
+    """
+    return {
+        "skills": {"all": list(canonical["skills"])},
+        "experience_years": canonical["experience_years"],
+        "education_level": canonical["education_level"],
+        "current_role": canonical["current_role"],
+        "projects": [""] * canonical["projects"],
+        "certifications": list(canonical["certifications"])
+    }
+
+def canonical_hash(canonical: Dict, model_version: str = SCORING_MODEL_VERSION) -> str:
+    """Stable hash of a canonical profile and scoring model version"""
+    payload = json.dumps({"model_version": model_version, "profile": canonical}, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+def profile_hash(user_profile: Dict, target_industry: str, model_version: str = SCORING_MODEL_VERSION) -> str:
+    """Stable hash of the canonical profile and scoring model version"""
+    return canonical_hash(canonical_profile(user_profile, target_industry), model_version)
+
+class ReadinessCache:
+    def __init__(self, path: str = READINESS_CACHE["path"],
+                 ttl_seconds: int = READINESS_CACHE["ttl_seconds"],
+                 max_entries: int = READINESS_CACHE["max_entries"],
+                 model_version: str = SCORING_MODEL_VERSION):
+        """Open (or create) the SQLite cache shared by all processes on the host"""
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.model_version = model_version
+
+        self._local = threading.local()
+        self._writes = 0
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        with self._connection() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS readiness_cache (
+                    key TEXT PRIMARY KEY,
+                    model_version TEXT NOT NULL,
+                    result TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_readiness_accessed ON readiness_cache (accessed_at)")
+            # Rows from other scoring model versions are left alone: processes on
+            # either side of a deploy share this file, and reads filter by version.
+            # Pruning ages them out once nothing reads them.
+
+    def _connection(self) -> sqlite3.Connection:
+        """One connection per thread; WAL lets worker processes read while one writes"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=10, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def get(self, user_profile: Dict, target_industry: str) -> Optional[Dict]:
+        """Return a cached assessment, or None if missing or expired"""
+        return self._get(profile_hash(user_profile, target_industry, self.model_version))
+
+    def _get(self, key: str) -> Optional[Dict]:
+        now = time.time()
+
+        conn = self._connection()
+        row = conn.execute(
+            "SELECT result FROM readiness_cache WHERE key = ? AND model_version = ? AND created_at >= ?",
+            (key, self.model_version, now - self.ttl_seconds)
+        ).fetchone()
+        if row is None:
+            return None
+
+        conn.execute("UPDATE readiness_cache SET accessed_at = ? WHERE key = ?", (now, key))
+        return json.loads(row[0])
+
+    def set(self, user_profile: Dict, target_industry: str, result: Dict):
+        """Store an assessment and periodically evict expired and least recently used rows"""
+        self._set(profile_hash(user_profile, target_industry, self.model_version), result)
+
+    def _set(self, key: str, result: Dict):
+        now = time.time()
+
+        self._connection().execute(
+            "INSERT OR REPLACE INTO readiness_cache (key, model_version, result, created_at, accessed_at) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (key, self.model_version, json.dumps(result), now, now)
+        )
+
+        with self._lock:
+            self._writes += 1
+            should_prune = self._writes % PRUNE_INTERVAL == 0
+        if should_prune:
+            self.prune()
+
+    def get_or_compute(self, calculator: ReadinessCalculator, user_profile: Dict, target_industry: str) -> Dict:
+        """
+        Serve the assessment from cache, computing and storing it on a miss
+
+        The profile is canonicalized once: the same canonical form is both
+        hashed for the key and scored, so a hit always matches a fresh score.
+        """
+        canonical = canonical_profile(user_profile, target_industry)
+        key = canonical_hash(canonical, self.model_version)
+        result = self._get(key)
+        if result is None:
+            result = calculator.calculate_readiness_score(scoring_profile(canonical), target_industry)
+            self._set(key, result)
+        return result
+
+    def prune(self):
+        """Drop expired entries, then the least recently used ones above max_entries"""
+        conn = self._connection()
+        conn.execute("DELETE FROM readiness_cache WHERE created_at < ?", (time.time() - self.ttl_seconds,))
+        conn.execute(
+            "DELETE FROM readiness_cache WHERE key IN ("
+            "SELECT key FROM readiness_cache ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+            (self.max_entries,)
+        )
+
+    def clear(self):
+        """Remove every cached assessment"""
+        self._connection().execute("DELETE FROM readiness_cache")
+
+    def __len__(self) -> int:
+        return self._connection().execute("SELECT COUNT(*) FROM readiness_cache").fetchone()[0]
@@ -13,12 +13,20 @@ import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from config import FUTURE_INDUSTRIES, SCORING_WEIGHTS
+from .certification_index import CertificationIndex
+
+# Bump whenever scoring logic changes so cached assessments are invalidated
+SCORING_MODEL_VERSION = "1.3"
+
+# Skills that make picking up any STEM field easier
+FOUNDATIONAL_SKILLS = ["programming", "data analysis", "mathematics", "problem solving"]
 
 class ReadinessCalculator:
     def __init__(self):
         """Initialize readiness calculator"""
         self.weights = SCORING_WEIGHTS
         self.industry_requirements = self._load_industry_requirements()
+        self.certification_index = CertificationIndex()
         
     def _load_industry_requirements(self) -> Dict[str, Dict]:
         """Load specific requirements for each industry"""
@@ -153,9 +161,129 @@ class ReadinessCalculator:
             "recommendations": recommendations,
             "strengths": self._identify_strengths(user_profile, target_industry),
             "gaps": self._identify_gaps(user_skills, target_industry),
+            "certification_matches": self.certification_index.match_industries(certifications).get(target_industry, []),
             "next_steps": self._generate_next_steps(final_score, target_industry)
         }
-    
+
+    def calculate_marginal_gains(self, user_profile: Dict, target_industry: str,
+                                 candidate_skills: List[str] = None,
+                                 candidate_courses: List[Dict] = None,
+                                 candidate_certifications: List[str] = None,
+                                 top_k: int = None) -> List[Dict]:
+        """
+        Rank candidate skills, courses and certifications by readiness gain
+
+        Skill match and learning curve are additive over individual skills, so
+        the gain of every candidate is computed in one vectorized pass instead
+        of one calculate_readiness_score call per candidate.
+
+        Args:
+            user_profile: User's profile with skills, experience, education
+            target_industry: Target STEM industry
+            candidate_skills: Skills to evaluate (defaults to the industry's
+                missing essential, preferred and foundational skills)
+            candidate_courses: Course rows with "course_name" and "skill_focus"
+            candidate_certifications: Certification names to evaluate
+            top_k: Return only the best k candidates
+
+        Returns:
+            Candidates sorted by score gain, highest first
+        """
+        user_skills = user_profile.get("skills", {})
+        certifications = user_profile.get("certifications", [])
+
+        requirements = self.industry_requirements.get(target_industry, {})
+        essential_skills = [s.lower() for s in requirements.get("essential_skills", [])]
+        preferred_skills = [s.lower() for s in requirements.get("preferred_skills", [])]
+
+        all_user_skills = []
+        for category, skills in user_skills.items():
+            all_user_skills.extend([s.lower() for s in skills])
+
+        if candidate_skills is None:
+            candidate_skills = [
+                skill for skill in dict.fromkeys(
+                    requirements.get("essential_skills", []) +
+                    requirements.get("preferred_skills", []) +
+                    [s.title() for s in FOUNDATIONAL_SKILLS]
+                )
+                if skill.lower() not in all_user_skills
+            ]
+        candidate_courses = candidate_courses or []
+        candidate_certifications = candidate_certifications or []
+
+        # Current (unclipped) weighted score
+        skill_match_score = self._calculate_skill_match(user_skills, target_industry)
+        learning_curve_score = self._calculate_learning_curve(user_skills, target_industry)
+        experience_score = self._calculate_experience_score(
+            user_profile.get("experience_years", 0), user_profile.get("current_role", ""), target_industry
+        )
+        market_readiness = self._calculate_market_readiness(target_industry)
+        education_score = self._calculate_education_score(user_profile.get("education_level", ""), target_industry)
+        project_score = self._calculate_project_score(user_profile.get("projects", []), target_industry)
+        certification_score = self._calculate_certification_score(certifications, target_industry)
+
+        current_score = (
+            skill_match_score * self.weights["current_skills_match"] +
+            experience_score * self.weights["transferable_skills"] +
+            learning_curve_score * self.weights["learning_curve"] +
+            market_readiness * self.weights["market_demand"] +
+            (education_score + project_score + certification_score) / 3 * 0.1
+        )
+
+        # Skills and courses: a course contributes the skill it focuses on
+        skill_names = [s.lower() for s in candidate_skills]
+        skill_names += [str(course.get("skill_focus", "")).lower() for course in candidate_courses]
+        names = np.array(skill_names, dtype=object)
+
+        is_new = ~np.isin(names, all_user_skills)
+        essential_delta = np.isin(names, essential_skills) & is_new
+        preferred_delta = np.isin(names, preferred_skills) & is_new
+        foundation_delta = np.isin(names, FOUNDATIONAL_SKILLS) & is_new
+
+        skill_match_delta = np.zeros(len(names))
+        if essential_skills:
+            skill_match_delta += essential_delta * 0.6 / len(essential_skills)
+        if preferred_skills:
+            skill_match_delta += preferred_delta * 0.4 / len(preferred_skills)
+        learning_delta = foundation_delta * 0.4 / len(FOUNDATIONAL_SKILLS) + skill_match_delta * 0.6
+
+        skill_gains = (
+            skill_match_delta * self.weights["current_skills_match"] +
+            learning_delta * self.weights["learning_curve"]
+        )
+
+        # Certifications only move the bonus component
+        cert_gains = np.array([
+            self._calculate_certification_score(certifications + [cert], target_industry) - certification_score
+            for cert in candidate_certifications
+        ]) / 3 * 0.1
+
+        gains = np.concatenate([skill_gains, cert_gains])
+        current_final = min(current_score, 1.0)
+        new_scores = np.minimum(current_score + gains, 1.0)
+        gains = new_scores - current_final
+
+        candidates = (
+            [(skill, "skill") for skill in candidate_skills] +
+            [(course.get("course_name", ""), "course") for course in candidate_courses] +
+            [(cert, "certification") for cert in candidate_certifications]
+        )
+
+        order = np.argsort(-gains, kind="stable")
+        if top_k is not None:
+            order = order[:top_k]
+
+        return [
+            {
+                "candidate": candidates[i][0],
+                "type": candidates[i][1],
+                "score_gain": round(float(gains[i]) * 100, 1),
+                "new_score": round(float(new_scores[i]) * 100, 1)
+            }
+            for i in order
+        ]
+
     def _calculate_skill_match(self, user_skills: Dict, industry: str) -> float:
         """Calculate skill match score"""
         requirements = self.industry_requirements.get(industry, {})
@@ -253,23 +381,9 @@ class ReadinessCalculator:
         if not certifications:
             return 0.0
         
-        # Industry-relevant certification keywords
-        industry_certs = {
-            "AI": ["machine learning", "deep learning", "ai", "tensorflow", "aws ml"],
-            "BLOCKCHAIN": ["blockchain", "ethereum", "solidity", "web3", "defi"],
-            "CYBERSECURITY": ["security+", "cissp", "ceh", "oscp", "ccna security"],
-            "BIOTECH": ["bioinformatics", "clinical", "gcp", "biostatistics"],
-            "AGRITECH": ["precision agriculture", "iot", "sustainability", "gis"],
-            "AQUATECH": ["aquaculture", "marine", "water quality", "environmental"],
-            "SPACETECH": ["aerospace", "systems engineering", "satellite", "space"],
-            "RENEWABLE": ["renewable energy", "solar", "wind", "energy management", "leed"]
-        }
-        
-        relevant_keywords = industry_certs.get(industry, [])
-        cert_text = " ".join(certifications).lower()
-        
-        matches = sum(1 for keyword in relevant_keywords if keyword in cert_text)
-        return min(matches / 3, 1.0)  # Cap at 3 relevant certs
+        # Count certifications, not keywords, so one cert cannot match twice
+        matches = self.certification_index.match_industries(certifications).get(industry, [])
+        return min(len(matches) / 3, 1.0)  # Cap at 3 relevant certs
     
     def _calculate_learning_curve(self, user_skills: Dict, industry: str) -> float:
         """Calculate learning curve difficulty (inverse - higher score = easier learning)"""
@@ -282,9 +396,8 @@ class ReadinessCalculator:
             all_user_skills.extend([s.lower() for s in skills])
         
         # Check for foundational skills that make learning easier
-        foundational_skills = ["programming", "data analysis", "mathematics", "problem solving"]
-        foundation_score = sum(1 for skill in foundational_skills if skill in all_user_skills)
-        foundation_score = foundation_score / len(foundational_skills)
+        foundation_score = sum(1 for skill in FOUNDATIONAL_SKILLS if skill in all_user_skills)
+        foundation_score = foundation_score / len(FOUNDATIONAL_SKILLS)
         
         # Check existing match with essential skills
         skill_match = self._calculate_skill_match(user_skills, industry)
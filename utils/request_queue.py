@@ -0,0 +1,317 @@
+"""
+Request Queue Module
+Rate-limited, session-fair queue for outbound AI provider calls
+"""
+
+import asyncio
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from collections.abc import Iterator
+from typing import Any, Callable, Dict, Optional
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import ADVISOR_RATE_LIMITS
+
+class QueueTimeout(Exception):
+    """A request waited in the queue longer than allowed and was withdrawn"""
+
+class TokenBucket:
+    """Allows `rate` calls per second on average, with bursts of up to `burst`"""
+
+    def __init__(self, rate_per_second: float, burst: int):
+        self.rate = rate_per_second
+        self.capacity = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+
+    def _refill(self, now: float):
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def delay(self) -> float:
+        """Seconds until a token is available (0 if one is available now)"""
+        self._refill(time.monotonic())
+        return 0.0 if self.tokens >= 1 else (1 - self.tokens) / self.rate
+
+    def take(self):
+        self._refill(time.monotonic())
+        self.tokens -= 1
+
+class _Job:
+    def __init__(self, provider: str, session_id: str, fn: Callable[[], Any]):
+        self.provider = provider
+        self.session_id = session_id
+        self.fn = fn
+        self.future = Future()
+        # Set once the job leaves the queue, by starting or by being cancelled
+        self.dequeued = threading.Event()
+        self.submitted_at = time.monotonic()
+
+class HeldStream:
+    """
+    Streamed result of a queued call, keeping the call's slot until the stream
+    is exhausted or closed (or dropped, as a last resort)
+    """
+
+    def __init__(self, pieces: Iterator, release: Callable[[], Any]):
+        self._pieces = pieces
+        self._release = release
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        try:
+            return next(self._pieces)
+        except BaseException:
+            self.close()
+            raise
+
+    def close(self):
+        release, self._release = self._release, None
+        if release is None:
+            return
+        try:
+            close = getattr(self._pieces, "close", None)
+            if callable(close):
+                close()
+        finally:
+            release()
+
+    def __del__(self):
+        self.close()
+
+class Ticket:
+    """Handle on a queued call: its place in line and, later, its result"""
+
+    def __init__(self, queue: "AdvisorRequestQueue", job: _Job):
+        self._queue = queue
+        self._job = job
+
+    def position(self) -> Optional[int]:
+        """Calls ahead of this one for the same provider, or None once it has started"""
+        return self._queue._position(self._job)
+
+    def cancel(self) -> bool:
+        """
+        Withdraw the call if it has not started, so it never takes a rate-limit token
+
+        Returns:
+            True if withdrawn, False if the call had already started
+        """
+        if not self._job.future.cancel():
+            return False
+        self._queue._withdraw(self._job)
+        self._job.dequeued.set()
+        return True
+
+    def result(self, queue_timeout: Optional[float] = None) -> Any:
+        """
+        Wait for the call to run and return its result
+
+        Args:
+            queue_timeout: Most seconds to wait for the call to start; the call's
+                own run time is bounded by its request timeouts
+
+        Raises:
+            QueueTimeout: If the call had not started within queue_timeout
+            CancelledError: If the call was cancelled before it started
+        """
+        if not self._job.dequeued.wait(queue_timeout) and self.cancel():
+            raise QueueTimeout(f"{self._job.provider} request waited over {queue_timeout}s in the queue")
+        return self._job.future.result()
+
+class AdvisorRequestQueue:
+    def __init__(self, rate_limits: Dict[str, Dict] = ADVISOR_RATE_LIMITS["providers"],
+                 max_concurrent: int = ADVISOR_RATE_LIMITS["max_concurrent"]):
+        """
+        Start the queue's event loop thread
+
+        Args:
+            rate_limits: provider -> {"rate_per_second", "burst"}; providers not
+                listed are only subject to the concurrency cap
+            max_concurrent: Calls in flight at once, across all providers
+        """
+        self.rate_limits = rate_limits
+        self.max_concurrent = max_concurrent
+        self.buckets = {provider: TokenBucket(**limits) for provider, limits in rate_limits.items()}
+        # provider -> session -> that session's queued jobs; sessions are served round-robin
+        self.queues: Dict[str, "OrderedDict[str, deque]"] = {}
+        self.running = 0
+        self.dispatched = 0
+        self._tasks = set()
+        self._lock = threading.Lock()
+
+        self.executor = ThreadPoolExecutor(max_workers=max_concurrent, thread_name_prefix="advisor-queue")
+        self.loop = asyncio.new_event_loop()
+        self._ready = threading.Event()
+        self._thread = threading.Thread(target=self._run_loop, name="advisor-queue-loop", daemon=True)
+        self._thread.start()
+        self._ready.wait()
+
+    def _run_loop(self):
+        asyncio.set_event_loop(self.loop)
+        self._wakeup = asyncio.Event()
+        self._slots = asyncio.Semaphore(self.max_concurrent)
+        self._ready.set()
+        self.loop.run_until_complete(self._schedule())
+
+    def submit(self, provider: str, session_id: str, fn: Callable[[], Any]) -> Ticket:
+        """
+        Queue a blocking provider call on behalf of a session
+
+        A call that returns an iterator (a streamed answer) keeps its slot until
+        the caller has exhausted or closed the HeldStream it gets back.
+        """
+        job = _Job(provider, session_id, fn)
+        with self._lock:
+            sessions = self.queues.setdefault(provider, OrderedDict())
+            sessions.setdefault(session_id, deque()).append(job)
+        self.loop.call_soon_threadsafe(self._wakeup.set)
+        return Ticket(self, job)
+
+    def call(self, provider: str, session_id: str, fn: Callable[[], Any],
+             queue_timeout: Optional[float] = ADVISOR_RATE_LIMITS["max_queue_seconds"],
+             on_submit: Optional[Callable[[Ticket], Any]] = None) -> Any:
+        """
+        Queue a call, wait for it and return its result (see Ticket.result)
+
+        on_submit is given the ticket as soon as the call is queued, e.g. so a
+        caller that gives up can cancel it from another thread.
+        """
+        ticket = self.submit(provider, session_id, fn)
+        if on_submit is not None:
+            on_submit(ticket)
+        return ticket.result(queue_timeout)
+
+    def _withdraw(self, job: _Job):
+        with self._lock:
+            sessions = self.queues.get(job.provider, {})
+            jobs = sessions.get(job.session_id)
+            if jobs and job in jobs:
+                jobs.remove(job)
+                if not jobs:
+                    del sessions[job.session_id]
+
+    def _position(self, job: _Job) -> Optional[int]:
+        """
+        Jobs that will be dispatched before this one under round-robin
+
+        Each round takes the head job of every session in turn, so a job k deep
+        in its session's queue waits for k rounds plus the sessions ahead of
+        its own in the current round.
+        """
+        with self._lock:
+            sessions = self.queues.get(job.provider, {})
+            jobs = sessions.get(job.session_id)
+            if not jobs or job not in jobs:
+                return None
+            depth = jobs.index(job)
+            ahead = 0
+            own_turn_passed = False
+            for session_id, queued in sessions.items():
+                if session_id == job.session_id:
+                    own_turn_passed = True
+                    ahead += depth
+                else:
+                    ahead += min(len(queued), depth + (0 if own_turn_passed else 1))
+            return ahead
+
+    def position(self, session_id: str) -> Optional[int]:
+        """Place in line of a session's next queued call (0 = next up), or None if it has none"""
+        with self._lock:
+            heads = [jobs[0] for sessions in self.queues.values()
+                     for queued_session, jobs in sessions.items() if queued_session == session_id and jobs]
+        positions = [position for position in map(self._position, heads) if position is not None]
+        return min(positions) if positions else None
+
+    def _next_job(self):
+        """
+        Pop the next job whose provider has a token, rotating its session to the back
+
+        Returns:
+            (job, None), or (None, seconds until a token frees up / None if idle)
+        """
+        with self._lock:
+            soonest = None
+            for provider, sessions in list(self.queues.items()):
+                if not sessions:
+                    continue
+                bucket = self.buckets.get(provider)
+                delay = bucket.delay() if bucket else 0.0
+                if delay > 0:
+                    soonest = delay if soonest is None else min(soonest, delay)
+                    continue
+
+                while sessions:
+                    session_id, jobs = next(iter(sessions.items()))
+                    job = jobs.popleft()
+                    if jobs:
+                        sessions.move_to_end(session_id)
+                    else:
+                        del sessions[session_id]
+                    # Skip jobs whose caller already gave up
+                    if job.future.set_running_or_notify_cancel():
+                        if bucket:
+                            bucket.take()
+                        # Providers take turns too when slots are scarce
+                        self.queues[provider] = self.queues.pop(provider)
+                        return job, None
+            return None, soonest
+
+    async def _schedule(self):
+        while True:
+            await self._slots.acquire()
+            self._wakeup.clear()
+            job, delay = self._next_job()
+            if job is None:
+                self._slots.release()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=delay)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+            # Hold a reference so the task isn't garbage collected mid-flight
+            task = self.loop.create_task(self._execute(job))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _execute(self, job: _Job):
+        with self._lock:
+            self.running += 1
+            self.dispatched += 1
+        job.dequeued.set()
+        try:
+            result = await self.loop.run_in_executor(self.executor, job.fn)
+        except BaseException as e:
+            job.future.set_exception(e)
+            self._release()
+            return
+        if isinstance(result, Iterator):
+            # A streamed answer is still talking to the provider until it ends
+            job.future.set_result(HeldStream(result, lambda: self.loop.call_soon_threadsafe(self._release)))
+        else:
+            job.future.set_result(result)
+            self._release()
+
+    def _release(self):
+        """Free a running call's slot; runs on the event loop thread"""
+        with self._lock:
+            self.running -= 1
+        self._slots.release()
+
+    def stats(self) -> Dict:
+        """Calls queued per provider, calls in flight and calls dispatched since startup"""
+        with self._lock:
+            return {
+                "queued": {provider: sum(len(jobs) for jobs in sessions.values())
+                           for provider, sessions in self.queues.items()},
+                "running": self.running,
+                "dispatched": self.dispatched
+            }
@@ -0,0 +1,281 @@
+"""
+Response Cache Module
+Serves repeated and near-duplicate advisor questions from disk instead of the AI providers
+"""
+
+import math
+import sqlite3
+import threading
+import time
+from collections import Counter, OrderedDict
+from typing import Dict, Optional
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import ADVISOR_RESPONSE_CACHE
+from .certification_index import tokenize
+
+# Near-duplicate lookups check exact cosine for only this many best dot-product matches
+SIMILAR_CANDIDATES = 5
+
+# Function words and pleasantries left out of similarity, so "Which skills..." matches
+# "What skills..." while a changed role, field or number still lowers the score
+STOP_WORDS = frozenset("""
+a an the i me my we you your is are am be to of in on for from with at by and or
+how what which who when where why do does can could should would will it its this
+that these those there please thanks thank hi hello
+""".split())
+
+# Words that give the following terms a direction: "from X" is where the asker
+# is coming from, "to/into X" where they want to go. Each maps to its feature prefix.
+DIRECTION_WORDS = {"from": "from", "to": "to", "into": "to", "toward": "to", "towards": "to"}
+
+# Terms after a direction word that are tagged with it
+DIRECTION_WINDOW = 3
+
+def normalize_prompt(prompt: str) -> str:
+    """Lowercase word tokens joined by spaces, so case, punctuation and spacing don't matter"""
+    return " ".join(tokenize(prompt))
+
+def similarity_terms(prompt: str) -> Counter:
+    """
+    Term counts a prompt is compared on for near-duplicate matches
+
+    Besides the words themselves, terms following "from" or "to" are counted
+    again as "from:term" / "to:term", so "from software to cybersecurity" and
+    "from cybersecurity to software" no longer look identical.
+    """
+    terms = Counter()
+    direction, remaining = None, 0
+    for token in tokenize(prompt):
+        if token in DIRECTION_WORDS:
+            direction, remaining = DIRECTION_WORDS[token], DIRECTION_WINDOW
+            continue
+        if token in STOP_WORDS:
+            continue
+        terms[token] += 1
+        if remaining:
+            terms[f"{direction}:{token}"] += 1
+            remaining -= 1
+    return terms
+
+class AdvisorResponseCache:
+    def __init__(self, path: str = ADVISOR_RESPONSE_CACHE["path"],
+                 ttl_seconds: int = ADVISOR_RESPONSE_CACHE["ttl_seconds"],
+                 max_entries: int = ADVISOR_RESPONSE_CACHE["max_entries"],
+                 similarity_threshold: float = ADVISOR_RESPONSE_CACHE["similarity_threshold"]):
+        """
+        Open (or create) the on-disk cache and load its live entries into memory
+
+        Args:
+            path: SQLite file the entries persist to
+            ttl_seconds: Age after which an answer is no longer served
+            max_entries: Entries kept; the least recently used are evicted
+            similarity_threshold: TF-IDF cosine a cached prompt needs to be
+                served for a question that isn't an exact match
+        """
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.similarity_threshold = similarity_threshold
+
+        # key -> entry, least recently used first
+        self.entries: "OrderedDict[str, Dict]" = OrderedDict()
+        # term -> keys of entries whose prompt contains it, and how many there are
+        self.postings: Dict[str, set] = {}
+        self.document_frequency = Counter()
+        self.counters = Counter()
+
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        conn = self._connection()
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS advisor_responses (
+                key TEXT PRIMARY KEY,
+                context TEXT NOT NULL,
+                prompt TEXT NOT NULL,
+                answer TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                accessed_at REAL NOT NULL,
+                version TEXT NOT NULL
+            )
+        """)
+        self._load(conn)
+
+    def _connection(self) -> sqlite3.Connection:
+        """One connection per thread; WAL lets other processes read while one writes"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=10, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def _load(self, conn: sqlite3.Connection):
+        """Index the most recently used unexpired entries from disk"""
+        conn.execute("DELETE FROM advisor_responses WHERE created_at < ?", (time.time() - self.ttl_seconds,))
+        rows = conn.execute(
+            "SELECT key, context, version, prompt, answer, created_at FROM "
+            "(SELECT * FROM advisor_responses ORDER BY accessed_at DESC LIMIT ?) ORDER BY accessed_at",
+            (self.max_entries,)
+        ).fetchall()
+        for key, context, version, prompt, answer, created_at in rows:
+            self._index(key, (context, version), prompt, answer, created_at)
+
+    def _key(self, prompt: str, context: str, version: str) -> str:
+        return f"{context}\x1f{version}\x1f{normalize_prompt(prompt)}"
+
+    def _index(self, key: str, scope: tuple, prompt: str, answer: str, created_at: float):
+        terms = similarity_terms(prompt)
+        self.entries[key] = {
+            "scope": scope,
+            "prompt": prompt,
+            "answer": answer,
+            "created_at": created_at,
+            "terms": terms
+        }
+        for term in terms:
+            self.postings.setdefault(term, set()).add(key)
+            self.document_frequency[term] += 1
+
+    def _unindex(self, key: str):
+        entry = self.entries.pop(key)
+        for term in entry["terms"]:
+            keys = self.postings[term]
+            keys.discard(key)
+            if not keys:
+                del self.postings[term]
+            self.document_frequency[term] -= 1
+            if not self.document_frequency[term]:
+                del self.document_frequency[term]
+
+    def _weights(self, terms: Counter) -> Dict[str, float]:
+        """TF-IDF weights with smoothed IDF over the cached prompts"""
+        total = len(self.entries)
+        return {
+            term: count * (math.log((1 + total) / (1 + self.document_frequency.get(term, 0))) + 1)
+            for term, count in terms.items()
+        }
+
+    def _most_similar(self, terms: Counter, scope: tuple):
+        """Cached prompt in the same context and version with the highest TF-IDF cosine to the question"""
+        query = self._weights(terms)
+        query_norm = math.sqrt(sum(weight * weight for weight in query.values()))
+        if not query_norm:
+            return None, 0.0
+
+        # Dot products via the postings, then exact cosine for the few best
+        dots = Counter()
+        for term, weight in query.items():
+            idf = weight / terms[term]
+            for key in self.postings.get(term, ()):
+                entry = self.entries[key]
+                if entry["scope"] == scope:
+                    dots[key] += weight * entry["terms"][term] * idf
+
+        best_key, best_similarity = None, 0.0
+        for key, dot in dots.most_common(SIMILAR_CANDIDATES):
+            entry = self.entries[key]
+            entry_norm = math.sqrt(sum(weight * weight for weight in self._weights(entry["terms"]).values()))
+            similarity = dot / (query_norm * entry_norm)
+            if similarity > best_similarity:
+                best_key, best_similarity = key, similarity
+        return best_key, best_similarity
+
+    def get(self, prompt: str, context: str = "general", version: str = "") -> Optional[Dict]:
+        """
+        Look up a cached answer for a question
+
+        Args:
+            prompt: The user's question
+            context: Advisor context type
+            version: Identifies the data the answer was based on (e.g. a hash of
+                its grounding); only answers stored under the same version are served
+
+        Returns:
+            Dictionary with answer, match ("exact" or "similar"), similarity and
+            the cached prompt, or None on a miss
+        """
+        key = self._key(prompt, context, version)
+        now = time.time()
+
+        with self._lock:
+            match = "exact"
+            similarity = 1.0
+            if key not in self.entries:
+                match = "similar"
+                key, similarity = self._most_similar(similarity_terms(prompt), (context, version))
+                if key is None or similarity < self.similarity_threshold:
+                    self.counters["misses"] += 1
+                    return None
+
+            entry = self.entries[key]
+            if entry["created_at"] < now - self.ttl_seconds:
+                self._unindex(key)
+                self.counters["misses"] += 1
+                expired = True
+            else:
+                self.entries.move_to_end(key)
+                self.counters[f"{match}_hits"] += 1
+                expired = False
+
+        conn = self._connection()
+        if expired:
+            conn.execute("DELETE FROM advisor_responses WHERE key = ?", (key,))
+            return None
+        conn.execute("UPDATE advisor_responses SET accessed_at = ? WHERE key = ?", (now, key))
+        return {"answer": entry["answer"], "match": match, "similarity": similarity, "prompt": entry["prompt"]}
+
+    def set(self, prompt: str, context: str, answer: str, version: str = ""):
+        """Store an answer under a data version, evicting the least recently used entries over max_entries"""
+        key = self._key(prompt, context, version)
+        now = time.time()
+
+        with self._lock:
+            if key in self.entries:
+                self._unindex(key)
+            self._index(key, (context, version), prompt, answer, now)
+            evicted = []
+            while len(self.entries) > self.max_entries:
+                oldest = next(iter(self.entries))
+                self._unindex(oldest)
+                evicted.append((oldest,))
+
+        conn = self._connection()
+        conn.execute(
+            "INSERT OR REPLACE INTO advisor_responses (key, context, version, prompt, answer, created_at, accessed_at) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (key, context, version, prompt, answer, now, now)
+        )
+        if evicted:
+            conn.executemany("DELETE FROM advisor_responses WHERE key = ?", evicted)
+
+    def stats(self) -> Dict[str, int]:
+        """Entry count and exact / similar hit and miss counters since startup"""
+        with self._lock:
+            return {
+                "entries": len(self.entries),
+                "exact_hits": self.counters["exact_hits"],
+                "similar_hits": self.counters["similar_hits"],
+                "misses": self.counters["misses"]
+            }
+
+    def clear(self):
+        """Remove every cached answer"""
+        with self._lock:
+            self.entries.clear()
+            self.postings.clear()
+            self.document_frequency.clear()
+        self._connection().execute("DELETE FROM advisor_responses")
+
+    def __len__(self) -> int:
+        return len(self.entries)
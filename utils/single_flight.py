@@ -0,0 +1,104 @@
+"""
+Single Flight Module
+Concurrent callers asking for the same thing share one in-flight computation
+"""
+
+import threading
+from collections import Counter
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+class Flight:
+    """One in-flight computation; the leader settles it and followers wait on it"""
+
+    def __init__(self, group: "SingleFlight", key: Hashable):
+        self._group = group
+        self.key = key
+        self.future = Future()
+
+    def resolve(self, value: Any):
+        """Hand the leader's result to every follower and end the flight"""
+        self._group._land(self)
+        self.future.set_result(value)
+
+    def fail(self, error: BaseException):
+        """Raise the leader's error in every follower and end the flight"""
+        self._group._land(self)
+        self.future.set_exception(error)
+
+    def result(self, timeout: Optional[float] = None) -> Any:
+        """Wait for the leader; raises what the leader failed with"""
+        return self.future.result(timeout)
+
+def _namespace(key: Hashable) -> str:
+    """Counter bucket for a key: the first element of a tuple key, else the key itself"""
+    return str(key[0] if isinstance(key, tuple) and key else key)
+
+class SingleFlight:
+    """
+    Deduplicates concurrent work by key
+
+    Only calls that overlap are shared: once a flight ends, the next caller
+    for the same key starts a new one. Caching results is left to the caller.
+    """
+
+    def __init__(self):
+        self.flights: Dict[Hashable, Flight] = {}
+        # namespace -> calls, and calls that joined a flight instead of starting one
+        self.calls = Counter()
+        self.coalesced = Counter()
+        self._lock = threading.Lock()
+
+    def claim(self, key: Hashable) -> Tuple[Flight, bool]:
+        """
+        Join the flight for a key, starting one if none is in the air
+
+        Returns:
+            (flight, leader). The leader must end the flight with resolve() or
+            fail(); followers call flight.result().
+        """
+        namespace = _namespace(key)
+        with self._lock:
+            self.calls[namespace] += 1
+            flight = self.flights.get(key)
+            if flight is not None:
+                self.coalesced[namespace] += 1
+                return flight, False
+            flight = self.flights[key] = Flight(self, key)
+            return flight, True
+
+    def _land(self, flight: Flight):
+        with self._lock:
+            if self.flights.get(flight.key) is flight:
+                del self.flights[flight.key]
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """
+        Run fn, or wait for the identical call already running, and return its result
+
+        fn runs on the calling thread of whichever caller arrives first. If it
+        raises, every caller sharing the flight gets the same exception.
+        """
+        flight, leader = self.claim(key)
+        if not leader:
+            return flight.result()
+        try:
+            value = fn()
+        except BaseException as e:
+            flight.fail(e)
+            raise
+        flight.resolve(value)
+        return value
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """namespace -> calls, coalesced (served by another caller's flight) and in_flight"""
+        with self._lock:
+            in_flight = Counter(_namespace(key) for key in self.flights)
+            return {
+                namespace: {
+                    "calls": calls,
+                    "coalesced": self.coalesced[namespace],
+                    "in_flight": in_flight[namespace]
+                }
+                for namespace, calls in self.calls.items()
+            }